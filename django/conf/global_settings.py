@@ -136,6 +136,9 @@ LANGUAGES_BIDI = ("he", "ar", "fa")
 # to load the internationalization machinery.
 USE_I18N = True
 LOCALE_PATHS = ()
+# Directory holding the merged translation catalogs written by the
+# mergecatalogs command. If None, catalogs are merged when first used.
+MERGED_CATALOGS_DIR = None
 LANGUAGE_COOKIE_NAME = 'django_language'
 
 # If you set this to True, Django will format dates, numbers and calendars
@@ -167,6 +170,11 @@ DATABASES = {}
 # Classes used to implement DB routing behavior.
 DATABASE_ROUTERS = []
 
+# The executor running signal receivers connected with background=True, and
+# the keyword arguments it's created with.
+SIGNAL_EXECUTOR = 'django.dispatch.executors.ThreadExecutor'
+SIGNAL_EXECUTOR_OPTIONS = {}
+
 # The email backend to use. For possible shortcuts see django.core.mail.
 # The default is to use the SMTP backend.
 # Third-party backends can be specified by providing a Python path
@@ -213,6 +221,10 @@ TEMPLATE_CONTEXT_PROCESSORS = (
     'django.contrib.messages.context_processors.messages',
 )
 
+# Number of threads rendering {% include ... async %} tags. Set to 0 to render
+# them in place like other includes.
+TEMPLATE_ASYNC_INCLUDE_THREADS = 4
+
 # Output to use in template system for invalid (e.g. misspelled) variables.
 TEMPLATE_STRING_IF_INVALID = ''
 
@@ -233,6 +245,10 @@ PREPEND_WWW = False
 # Override the server-derived value of SCRIPT_NAME
 FORCE_SCRIPT_NAME = None
 
+# Maximum number of reverse() results to memoize. Only calls whose arguments
+# are strings or integers are memoized. Set to 0 to disable.
+URL_REVERSE_CACHE_SIZE = 0
+
 # List of compiled regular expression objects representing User-Agent strings
 # that are not allowed to visit any page, systemwide. Use this for bad
 # robots/crawlers. Here are a few examples:
@@ -452,6 +468,11 @@ MIDDLEWARE_CLASSES = (
 #     'django.middleware.gzip.GZipMiddleware',
 )
 
+# A dictionary mapping URL path prefixes to tuples of middleware classes from
+# MIDDLEWARE_CLASSES that aren't applied to requests whose path starts with
+# them, e.g. {'/health/': ('django.contrib.sessions.middleware.SessionMiddleware',)}.
+MIDDLEWARE_EXCLUDED_PREFIXES = {}
+
 ############
 # SESSIONS #
 ############
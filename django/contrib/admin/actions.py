@@ -7,6 +7,7 @@ from django.contrib.admin import helpers
 from django.contrib.admin.util import get_deleted_objects, model_ngettext
 from django.db import router
 from django.template.response import TemplateResponse
+from django.views.generic.export import export_response
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy, ugettext as _
 
@@ -81,3 +82,22 @@ def delete_selected(modeladmin, request, queryset):
     ], context, current_app=modeladmin.admin_site.name)
 
 delete_selected.short_description = ugettext_lazy("Delete selected %(verbose_name_plural)s")
+
+def export_as_csv(modeladmin, request, queryset):
+    """
+    Action which streams the fields returned by the ModelAdmin's
+    get_export_fields() for the selected objects as a CSV file.
+    """
+    return export_response(queryset, modeladmin.get_export_fields(request), 'csv')
+
+export_as_csv.short_description = ugettext_lazy("Export selected %(verbose_name_plural)s as CSV")
+
+def export_as_json_lines(modeladmin, request, queryset):
+    """
+    Action which streams the fields returned by the ModelAdmin's
+    get_export_fields() for the selected objects as JSON lines, one object
+    per line.
+    """
+    return export_response(queryset, modeladmin.get_export_fields(request), 'jsonl')
+
+export_as_json_lines.short_description = ugettext_lazy("Export selected %(verbose_name_plural)s as JSON lines")
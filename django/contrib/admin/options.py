@@ -22,6 +22,7 @@ from django.db.models.related import RelatedObject
 from django.db.models.fields import BLANK_CHOICE_DASH, FieldDoesNotExist
 from django.db.models.sql.constants import QUERY_TERMS
 from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.http.response import HttpResponseBase
 from django.shortcuts import get_object_or_404
 from django.template.response import SimpleTemplateResponse, TemplateResponse
 from django.utils.decorators import method_decorator
@@ -342,6 +343,9 @@ class ModelAdmin(BaseModelAdmin):
     actions_on_top = True
     actions_on_bottom = False
     actions_selection_counter = True
+    # Fields written by the export actions, all the fields of the model if
+    # None.
+    export_fields = None
 
     def __init__(self, model, admin_site):
         self.model = model
@@ -656,6 +660,15 @@ class ModelAdmin(BaseModelAdmin):
         """
         return self.list_display
 
+    def get_export_fields(self, request):
+        """
+        Return a sequence containing the fields written by the export
+        actions.
+        """
+        if self.export_fields is not None:
+            return self.export_fields
+        return [field.name for field in self.opts.fields]
+
     def get_list_display_links(self, request, list_display):
         """
         Return a sequence containing the fields to be displayed as links
@@ -962,7 +975,7 @@ class ModelAdmin(BaseModelAdmin):
             # Actions may return an HttpResponse, which will be used as the
             # response from the POST. If not, we'll be a good little HTTP
             # citizen and redirect back to the changelist page.
-            if isinstance(response, HttpResponse):
+            if isinstance(response, HttpResponseBase):
                 return response
             else:
                 return HttpResponseRedirect(request.get_full_path())
@@ -1,3 +1,6 @@
+from django.template.context import provides
+
+
 # PermWrapper and PermLookupDict proxy the permissions system into objects that
 # the template system can understand.
 
@@ -45,6 +48,7 @@ class PermWrapper(object):
         return self[module_name][perm_name]
 
 
+@provides('user', 'perms')
 def auth(request):
     """
     Returns context variables required by apps that use Django's authentication
@@ -24,13 +24,16 @@ class GeoQuerySet(QuerySet):
 
     def values_list(self, *fields, **kwargs):
         flat = kwargs.pop('flat', False)
+        named = kwargs.pop('named', False)
         if kwargs:
             raise TypeError('Unexpected keyword arguments to values_list: %s'
                     % (list(kwargs),))
         if flat and len(fields) > 1:
             raise TypeError("'flat' is not valid when values_list is called with more than one field.")
+        if flat and named:
+            raise TypeError("'flat' and 'named' can't be used together.")
         return self._clone(klass=GeoValuesListQuerySet, setup=True, flat=flat,
-                           _fields=fields)
+                           named=named, _fields=fields)
 
     ### GeoQuerySet Methods ###
     def area(self, tolerance=0.05, **kwargs):
@@ -1,6 +1,8 @@
 from django.contrib.messages.api import get_messages
+from django.template.context import provides
 
 
+@provides('messages')
 def messages(request):
     """
     Returns a lazy 'messages' context variable.
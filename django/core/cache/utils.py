@@ -0,0 +1,19 @@
+from __future__ import absolute_import, unicode_literals
+
+import hashlib
+from django.utils.encoding import force_bytes
+from django.utils.http import urlquote
+
+TEMPLATE_FRAGMENT_KEY_TEMPLATE = 'template.cache.%s.%s'
+
+
+def make_template_fragment_key(fragment_name, vary_on=None):
+    """
+    Returns the cache key used by the {% cache %} template tag for the
+    fragment ``fragment_name`` varying on the values in ``vary_on``.
+    """
+    if vary_on is None:
+        vary_on = ()
+    key = ':'.join([urlquote(var) for var in vary_on])
+    args = hashlib.md5(force_bytes(key))
+    return TEMPLATE_FRAGMENT_KEY_TEMPLATE % (fragment_name, args.hexdigest())
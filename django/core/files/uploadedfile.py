@@ -2,6 +2,7 @@
 Classes representing uploaded files.
 """
 
+import mmap
 import os
 from io import BytesIO
 
@@ -10,8 +11,8 @@ from django.core.files.base import File
 from django.core.files import temp as tempfile
 from django.utils.encoding import force_str
 
-__all__ = ('UploadedFile', 'TemporaryUploadedFile', 'InMemoryUploadedFile',
-           'SimpleUploadedFile')
+__all__ = ('UploadedFile', 'TemporaryUploadedFile', 'MappedUploadedFile',
+           'InMemoryUploadedFile', 'SimpleUploadedFile')
 
 class UploadedFile(File):
     """
@@ -79,6 +80,40 @@ class TemporaryUploadedFile(UploadedFile):
                 # calls self.file.file.close() before the exception
                 raise
 
+class MappedUploadedFile(TemporaryUploadedFile):
+    """
+    A file uploaded to a temporary location, whose content can be accessed
+    through a memory map, along with digests of it computed during the upload.
+    """
+    def __init__(self, name, content_type, size, charset, digests=None):
+        super(MappedUploadedFile, self).__init__(name, content_type, size, charset)
+        self.digests = digests if digests is not None else {}
+        self._mmap = None
+
+    @property
+    def mmap(self):
+        """
+        A read-only memory map of the content of the file, or an empty
+        bytestring if the file is empty (which can't be mapped).
+        """
+        if self._mmap is None:
+            self.file.flush()
+            if not os.fstat(self.file.fileno()).st_size:
+                return b''
+            self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def close(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Some views of the map are still alive, it will be closed
+                # when they are garbage collected.
+                pass
+            self._mmap = None
+        return super(MappedUploadedFile, self).close()
+
 class InMemoryUploadedFile(UploadedFile):
     """
     A file uploaded into memory (i.e. stream-to-memory).
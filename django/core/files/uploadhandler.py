@@ -4,17 +4,20 @@ Base file upload handler classes, and the built-in concrete subclasses
 
 from __future__ import unicode_literals
 
+import hashlib
+import os
 from io import BytesIO
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.core.files.uploadedfile import TemporaryUploadedFile, InMemoryUploadedFile
+from django.core.files.uploadedfile import (TemporaryUploadedFile,
+    MappedUploadedFile, InMemoryUploadedFile)
 from django.utils import importlib
 from django.utils.encoding import python_2_unicode_compatible
 
 __all__ = ['UploadFileException','StopUpload', 'SkipFile', 'FileUploadHandler',
-           'TemporaryFileUploadHandler', 'MemoryFileUploadHandler',
-           'load_handler', 'StopFutureHandlers']
+           'TemporaryFileUploadHandler', 'MappedFileUploadHandler',
+           'MemoryFileUploadHandler', 'load_handler', 'StopFutureHandlers']
 
 class UploadFileException(Exception):
     """
@@ -143,6 +146,65 @@ class TemporaryFileUploadHandler(FileUploadHandler):
         self.file.size = file_size
         return self.file
 
+class MappedFileUploadHandler(FileUploadHandler):
+    """
+    Upload handler that streams data into a temporary file, sized up front
+    when possible, and computes digests of it on the way. The uploaded files
+    can be accessed through a memory map once complete.
+    """
+    #: The names of the ``hashlib`` algorithms whose hexadecimal digests are
+    #: computed.
+    digests = ('md5', 'sha256')
+    #: The maximum number of bytes allocated ahead for a file, since the
+    #: length of the request body is given by the client.
+    max_preallocation = 100 * 2 ** 20
+
+    def __init__(self, *args, **kwargs):
+        super(MappedFileUploadHandler, self).__init__(*args, **kwargs)
+        self.request_content_length = None
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # The length of the request body is an upper bound of the size of
+        # the files.
+        self.request_content_length = content_length
+
+    def new_file(self, file_name, *args, **kwargs):
+        """
+        Create the file object to append to as data is coming in.
+        """
+        super(MappedFileUploadHandler, self).new_file(file_name, *args, **kwargs)
+        self.file = MappedUploadedFile(self.file_name, self.content_type, 0, self.charset)
+        self.hashes = [(name, hashlib.new(name)) for name in self.digests]
+        self.preallocate(self.content_length or self.request_content_length)
+
+    def preallocate(self, size):
+        """
+        Allocates disk space for the file, so that the filesystem doesn't
+        have to grow it chunk by chunk. Only supported on platforms that
+        provide ``os.posix_fallocate()``.
+        """
+        fallocate = getattr(os, 'posix_fallocate', None)
+        if fallocate is None or not size:
+            return
+        try:
+            fallocate(self.file.fileno(), 0, min(size, self.max_preallocation))
+        except (OSError, IOError):
+            pass
+
+    def receive_data_chunk(self, raw_data, start):
+        for name, hasher in self.hashes:
+            hasher.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        # Drop the space allocated beyond the end of the data.
+        self.file.flush()
+        self.file.truncate(file_size)
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.digests = dict((name, hasher.hexdigest()) for name, hasher in self.hashes)
+        return self.file
+
 class MemoryFileUploadHandler(FileUploadHandler):
     """
     File upload handler to stream uploads into memory (used for small files).
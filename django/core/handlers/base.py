@@ -17,6 +17,56 @@ from django.views import debug
 logger = logging.getLogger('django.request')
 
 
+# The phases a middleware can implement, by name of the method.
+MIDDLEWARE_PHASES = {
+    'request': 'process_request',
+    'view': 'process_view',
+    'template_response': 'process_template_response',
+    'response': 'process_response',
+    'exception': 'process_exception',
+}
+
+
+class MiddlewareChain(object):
+    """
+    The methods of a set of middleware, by phase, in the order they're called.
+    """
+    def __init__(self, middleware=()):
+        self.request = []
+        self.view = []
+        self.template_response = []
+        self.response = []
+        self.exception = []
+        for mw_instance in middleware:
+            self.add(mw_instance)
+
+    def add(self, mw_instance):
+        """
+        Adds the phases implemented by mw_instance to the chain. Middleware
+        can restrict them by listing the phases it implements in a
+        ``middleware_phases`` attribute.
+        """
+        phases = getattr(mw_instance, 'middleware_phases', None)
+        if phases is None:
+            phases = [phase for phase, method in MIDDLEWARE_PHASES.items()
+                      if hasattr(mw_instance, method)]
+        for phase in phases:
+            try:
+                method = getattr(mw_instance, MIDDLEWARE_PHASES[phase])
+            except KeyError:
+                raise exceptions.ImproperlyConfigured(
+                    '%s declares an unknown middleware phase: %r' % (
+                        mw_instance.__class__.__name__, phase))
+            except AttributeError:
+                raise exceptions.ImproperlyConfigured(
+                    '%s declares the %r middleware phase but has no %s method' % (
+                        mw_instance.__class__.__name__, phase, MIDDLEWARE_PHASES[phase]))
+            if phase in ('request', 'view'):
+                getattr(self, phase).append(method)
+            else:
+                getattr(self, phase).insert(0, method)
+
+
 class BaseHandler(object):
     # Changes that are always applied to a response (in this order).
     response_fixes = [
@@ -28,6 +78,9 @@ class BaseHandler(object):
 
     def __init__(self):
         self._request_middleware = self._view_middleware = self._template_response_middleware = self._response_middleware = self._exception_middleware = None
+        self._middleware = None
+        self._middleware_chains = None
+        self._middleware_prefix_rules = None
 
 
     def load_middleware(self):
@@ -36,12 +89,15 @@ class BaseHandler(object):
 
         Must be called after the environment is fixed (see __call__ in subclasses).
         """
-        self._view_middleware = []
-        self._template_response_middleware = []
-        self._response_middleware = []
-        self._exception_middleware = []
+        middleware = []
+        excluded = {}
+        for prefix, middleware_paths in settings.MIDDLEWARE_EXCLUDED_PREFIXES.items():
+            for middleware_path in middleware_paths:
+                excluded.setdefault(middleware_path, []).append(prefix)
+        # (index, url_prefixes, excluded_prefixes) rules of the middleware
+        # that isn't applied to every request.
+        prefix_rules = []
 
-        request_middleware = []
         for middleware_path in settings.MIDDLEWARE_CLASSES:
             try:
                 mw_module, mw_classname = middleware_path.rsplit('.', 1)
@@ -60,23 +116,55 @@ class BaseHandler(object):
             except exceptions.MiddlewareNotUsed:
                 continue
 
-            if hasattr(mw_instance, 'process_request'):
-                request_middleware.append(mw_instance.process_request)
-            if hasattr(mw_instance, 'process_view'):
-                self._view_middleware.append(mw_instance.process_view)
-            if hasattr(mw_instance, 'process_template_response'):
-                self._template_response_middleware.insert(0, mw_instance.process_template_response)
-            if hasattr(mw_instance, 'process_response'):
-                self._response_middleware.insert(0, mw_instance.process_response)
-            if hasattr(mw_instance, 'process_exception'):
-                self._exception_middleware.insert(0, mw_instance.process_exception)
+            url_prefixes = getattr(mw_instance, 'url_prefixes', None)
+            if url_prefixes is not None or middleware_path in excluded:
+                prefix_rules.append((
+                    len(middleware),
+                    tuple(url_prefixes) if url_prefixes is not None else None,
+                    tuple(excluded.get(middleware_path, ())),
+                ))
+            middleware.append(mw_instance)
+
+        chain = MiddlewareChain(middleware)
+        self._view_middleware = chain.view
+        self._template_response_middleware = chain.template_response
+        self._response_middleware = chain.response
+        self._exception_middleware = chain.exception
+        self._middleware = middleware
+        self._middleware_prefix_rules = prefix_rules
+        self._middleware_chains = {frozenset(): chain}
 
         # We only assign to this when initialization is complete as it is used
         # as a flag for initialization being complete.
-        self._request_middleware = request_middleware
+        self._request_middleware = chain.request
+
+    def get_middleware_chain(self, path):
+        """
+        Returns the MiddlewareChain applied to requests for the given path.
+        Chains are built once for each set of middleware left out by the URL
+        prefix rules.
+        """
+        chains = self._middleware_chains
+        if not self._middleware_prefix_rules:
+            return chains[frozenset()]
+        left_out = frozenset([
+            index for index, url_prefixes, excluded_prefixes in self._middleware_prefix_rules
+            if (url_prefixes is not None and not path.startswith(url_prefixes))
+            or path.startswith(excluded_prefixes)
+        ])
+        try:
+            return chains[left_out]
+        except KeyError:
+            chain = chains[left_out] = MiddlewareChain(
+                mw_instance for index, mw_instance in enumerate(self._middleware)
+                if index not in left_out)
+            return chain
 
     def get_response(self, request):
         "Returns an HttpResponse object for the given HttpRequest"
+        # Without a chain, e.g. if building it failed, no response middleware
+        # is applied.
+        chain = None
         try:
             # Setup default url resolver for this thread, this code is outside
             # the try/except so we don't get a spurious "unbound local
@@ -84,11 +172,12 @@ class BaseHandler(object):
             # resolver is set
             urlconf = settings.ROOT_URLCONF
             urlresolvers.set_urlconf(urlconf)
-            resolver = urlresolvers.RegexURLResolver(r'^/', urlconf)
+            resolver = urlresolvers.get_resolver(urlconf)
             try:
+                chain = self.get_middleware_chain(request.path_info)
                 response = None
                 # Apply request middleware
-                for middleware_method in self._request_middleware:
+                for middleware_method in chain.request:
                     response = middleware_method(request)
                     if response:
                         break
@@ -105,7 +194,7 @@ class BaseHandler(object):
                     request.resolver_match = resolver_match
 
                     # Apply view middleware
-                    for middleware_method in self._view_middleware:
+                    for middleware_method in chain.view:
                         response = middleware_method(request, callback, callback_args, callback_kwargs)
                         if response:
                             break
@@ -117,7 +206,7 @@ class BaseHandler(object):
                         # If the view raised an exception, run it through exception
                         # middleware, and if the exception middleware returns a
                         # response, use that. Otherwise, reraise the exception.
-                        for middleware_method in self._exception_middleware:
+                        for middleware_method in chain.exception:
                             response = middleware_method(request, e)
                             if response:
                                 break
@@ -135,7 +224,7 @@ class BaseHandler(object):
                 # If the response supports deferred rendering, apply template
                 # response middleware and the render the response
                 if hasattr(response, 'render') and callable(response.render):
-                    for middleware_method in self._template_response_middleware:
+                    for middleware_method in chain.template_response:
                         response = middleware_method(request, response)
                     response = response.render()
 
@@ -183,8 +272,9 @@ class BaseHandler(object):
 
         try:
             # Apply response middleware, regardless of the response
-            for middleware_method in self._response_middleware:
-                response = middleware_method(request, response)
+            if chain is not None:
+                for middleware_method in chain.response:
+                    response = middleware_method(request, response)
             response = self.apply_response_fixes(request, response)
         except: # Any exception should be gathered and handled
             signals.got_request_exception.send(sender=self.__class__, request=request)
@@ -221,6 +221,23 @@ class WSGIRequest(http.HttpRequest):
     REQUEST = property(_get_request)
 
 
+class _ResponseFile(object):
+    """
+    Wraps the file of a FileResponse handed to ``wsgi.file_wrapper``. The
+    server closes the file wrapper instead of the response, so closing the
+    file closes the response, which takes care of closing the file itself.
+    """
+    def __init__(self, filelike, response):
+        self._filelike = filelike
+        self._response = response
+
+    def close(self):
+        self._response.close()
+
+    def __getattr__(self, name):
+        return getattr(self._filelike, name)
+
+
 class WSGIHandler(base.BaseHandler):
     initLock = Lock()
     request_class = WSGIRequest
@@ -265,4 +282,9 @@ class WSGIHandler(base.BaseHandler):
         for c in response.cookies.values():
             response_headers.append((str('Set-Cookie'), str(c.output(header=''))))
         start_response(force_str(status), response_headers)
+        if (getattr(response, 'file_to_stream', None) is not None and
+                environ.get('wsgi.file_wrapper')):
+            response = environ['wsgi.file_wrapper'](
+                _ResponseFile(response.file_to_stream, response),
+                response.block_size)
         return response
@@ -1,11 +1,23 @@
-from django.core.exceptions import ImproperlyConfigured
+import json
+import multiprocessing
+import os
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.management.base import BaseCommand, CommandError
 from django.core import serializers
-from django.db import router, DEFAULT_DB_ALIAS
+from django.core.serializers.base import DeletedObject
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, DEFAULT_DB_ALIAS
+from django.db.models import Max, Q
+from django.db.models.fields import FieldDoesNotExist
 from django.utils.datastructures import SortedDict
+from django.utils.encoding import smart_text
 
 from optparse import make_option
 
+# Name of the file describing the fixtures written with --output-dir.
+MANIFEST_NAME = 'manifest.json'
+
 class Command(BaseCommand):
     option_list = BaseCommand.option_list + (
         make_option('--format', default='json', dest='format',
@@ -21,6 +33,28 @@ class Command(BaseCommand):
             help='Use natural keys if they are available.'),
         make_option('-a', '--all', action='store_true', dest='use_base_manager', default=False,
             help="Use Django's base manager to dump all models stored in the database, including those that would otherwise be filtered or modified by a custom manager."),
+        make_option('-o', '--output-dir', dest='output_dir', default=None,
+            help='Writes the objects of each model to separate fixtures in this '
+                 'directory, along with a manifest that loaddata can read.'),
+        make_option('--parallel', dest='parallel', type='int', default=1,
+            help='Number of processes writing the fixtures of --output-dir.'),
+        make_option('--partition-size', dest='partition_size', type='int', default=100000,
+            help='Maximum number of objects in each fixture of --output-dir.'),
+        make_option('--since', dest='since', action='append', default=[],
+            help='Only dumps the objects of a model whose field is greater than '
+                 'or equal to a value, given as app_label.ModelName.field=value '
+                 '(use multiple --since for multiple models).'),
+        make_option('--pk-gt', dest='pk_gt', action='append', default=[],
+            help='Only dumps the objects of a model whose primary key is greater '
+                 'than a value, given as app_label.ModelName=value (use multiple '
+                 '--pk-gt for multiple models).'),
+        make_option('--state-file', dest='state_file', default=None,
+            help='A file where the highest primary key of each model is recorded '
+                 'after the dump, so that the next dump only includes the objects '
+                 'added since.'),
+        make_option('--deleted', dest='deleted', default=None,
+            help='A JSON file mapping app_label.ModelName labels to lists of primary '
+                 'keys of deleted objects, dumped as deletions for loaddata.'),
     )
     help = ("Output the contents of the database as a fixture of the given "
             "format (using each model's default manager unless --all is "
@@ -37,6 +71,15 @@ class Command(BaseCommand):
         show_traceback = options.get('traceback')
         use_natural_keys = options.get('use_natural_keys')
         use_base_manager = options.get('use_base_manager')
+        output_dir = options.get('output_dir')
+        parallel = options.get('parallel')
+        partition_size = options.get('partition_size')
+        state_file = options.get('state_file')
+
+        if parallel > 1 and not output_dir:
+            raise CommandError("--parallel requires --output-dir.")
+        if partition_size < 1:
+            raise CommandError("--partition-size must be a positive integer.")
 
         excluded_apps = set()
         excluded_models = set()
@@ -93,33 +136,343 @@ class Command(BaseCommand):
             raise CommandError("Unknown serialization format: %s" % format)
 
         try:
-            serializers.get_serializer(format)
+            serializer = serializers.get_serializer(format)
         except KeyError:
             raise CommandError("Unknown serialization format: %s" % format)
 
+        models = [model for model in sort_dependencies(app_list.items())
+                  if model not in excluded_models and not model._meta.proxy
+                  and router.allow_syncdb(using, model)]
+
+        watermarks = read_state(state_file) if state_file else {}
+        filters = get_filters(models, watermarks, options.get('pk_gt'), options.get('since'))
+        deleted = []
+        if options.get('deleted'):
+            deleted = read_deleted(options.get('deleted'))
+        if state_file:
+            # Taken before the dump, objects added meanwhile are dumped again
+            # by the next one rather than missed.
+            watermarks.update(get_watermarks(models, using, use_base_manager))
+
         def get_objects():
             # Collate the objects to be serialized.
-            for model in sort_dependencies(app_list.items()):
-                if model in excluded_models:
-                    continue
-                if not model._meta.proxy and router.allow_syncdb(using, model):
-                    if use_base_manager:
-                        objects = model._base_manager
-                    else:
-                        objects = model._default_manager
-                    for obj in objects.using(using).\
-                            order_by(model._meta.pk.name).iterator():
-                        yield obj
+            for model in models:
+                for obj in get_queryset(model, using, use_base_manager, filters[model]).iterator():
+                    yield obj
+            for obj in deleted:
+                yield obj
 
         try:
-            self.stdout.ending = None
-            serializers.serialize(format, get_objects(), indent=indent,
-                    use_natural_keys=use_natural_keys, stream=self.stdout)
+            if output_dir:
+                self.dump_partitions(models, output_dir, format, using,
+                    use_base_manager, parallel, partition_size,
+                    int(options.get('verbosity')), filters, deleted,
+                    indent=indent, use_natural_keys=use_natural_keys)
+            else:
+                self.stdout.ending = None
+                stream = self.stdout
+                if serializer.binary:
+                    # Bypass the text wrappers of the standard output.
+                    stream = getattr(self.stdout._out, 'buffer', self.stdout._out)
+                serializers.serialize(format, get_objects(), indent=indent,
+                        use_natural_keys=use_natural_keys, stream=stream)
         except Exception as e:
             if show_traceback:
                 raise
             raise CommandError("Unable to serialize database: %s" % e)
 
+        if state_file:
+            with open(state_file, 'w') as f:
+                json.dump(watermarks, f, cls=DjangoJSONEncoder, indent=2,
+                          separators=(',', ': '), sort_keys=True)
+
+    def dump_partitions(self, models, output_dir, format, using,
+                        use_base_manager, parallel, partition_size, verbosity,
+                        filters, deleted, **options):
+        """
+        Writes the objects of each model selected by filters to fixtures of
+        at most partition_size objects, split on primary key ranges, in
+        parallel processes, and the deleted objects to a last fixture. Then
+        writes the manifest telling loaddata in which order to load them.
+        """
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        binary = serializers.get_serializer(format).binary
+        tasks = []
+        files = {}
+        for model in models:
+            queryset = get_queryset(model, using, use_base_manager, filters[model])
+            bounds, count = [None], 0
+            for pk in queryset.values_list('pk', flat=True).iterator():
+                if count and count % partition_size == 0:
+                    bounds.append(pk)
+                count += 1
+            if not count:
+                continue
+            files[model] = []
+            for index, (start, end) in enumerate(zip(bounds, bounds[1:] + [None])):
+                file_name = '%s.%s.%04d.%s' % (model._meta.app_label,
+                    model._meta.object_name.lower(), index + 1, format)
+                files[model].append(file_name)
+                tasks.append((model_label(model), using, use_base_manager,
+                              filters[model], start, end,
+                              os.path.join(output_dir, file_name), format,
+                              binary, options))
+
+        if parallel > 1 and len(tasks) > 1 and not is_in_memory(connections[using]):
+            # The workers must not share the connections of this process.
+            for connection in connections.all():
+                connection.close()
+            pool = multiprocessing.Pool(min(parallel, len(tasks)))
+            try:
+                counts = pool.map(dump_partition, tasks, 1)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            counts = [dump_partition(task) for task in tasks]
+
+        levels = []
+        for level in dependency_levels([model for model in models if model in files]):
+            groups = []
+            for group in level:
+                if len(group) == 1 and not refers_to_itself(group[0]):
+                    # Each fixture can be loaded on its own.
+                    groups.extend({'models': [model_label(group[0])], 'files': [f]}
+                                  for f in files[group[0]])
+                else:
+                    groups.append({'models': [model_label(model) for model in group],
+                                   'files': [f for model in group for f in files[model]]})
+            levels.append(groups)
+        if deleted:
+            # Applied once everything else is loaded.
+            file_name = 'deleted.%s' % format
+            with open(os.path.join(output_dir, file_name), 'wb' if binary else 'w') as stream:
+                serializers.serialize(format, deleted, stream=stream, **options)
+            labels = set(model_label(obj.object.__class__) for obj in deleted)
+            levels.append([{'models': sorted(labels), 'files': [file_name]}])
+            counts.append(len(deleted))
+        manifest = {'format': format, 'levels': levels}
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, separators=(',', ': '),
+                      sort_keys=True)
+        if verbosity >= 1:
+            self.stdout.write("Dumped %d object(s) to %d fixture(s) in %s" % (
+                sum(counts), len(counts), output_dir))
+
+
+def model_label(model):
+    return '%s.%s' % (model._meta.app_label, model._meta.object_name)
+
+
+def is_in_memory(connection):
+    """
+    Returns whether the database lives in the memory of this process, where
+    other processes can't reach it.
+    """
+    return (connection.vendor == 'sqlite' and
+            connection.settings_dict['NAME'] in ('', ':memory:'))
+
+
+def refers_to_itself(model):
+    return any(field.rel is not None and field.rel.to is model
+               for field in model._meta.fields + model._meta.many_to_many)
+
+
+def get_queryset(model, using, use_base_manager, filters=None):
+    if use_base_manager:
+        objects = model._base_manager
+    else:
+        objects = model._default_manager
+    queryset = objects.using(using).order_by(model._meta.pk.name)
+    if filters:
+        queryset = queryset.filter(filters)
+    return queryset
+
+
+def parse_model_value(option, value, with_field_name=False):
+    """
+    Parses the value of an option given as app_label.ModelName=value, or
+    app_label.ModelName.field=value if with_field_name is True. Returns the
+    model, the field (the primary key if with_field_name is False) and the
+    value converted by the field.
+    """
+    from django.db.models import get_model
+
+    label, sep, value = value.partition('=')
+    names = label.split('.')
+    if not sep or len(names) != (3 if with_field_name else 2):
+        raise CommandError("%s expects app_label.ModelName%s=value, not %r." % (
+            option, '.field' if with_field_name else '', label + sep + value))
+    model = get_model(names[0], names[1])
+    if model is None:
+        raise CommandError("Unknown model: %s.%s" % (names[0], names[1]))
+    if with_field_name:
+        try:
+            field = model._meta.get_field(names[2])
+        except FieldDoesNotExist:
+            raise CommandError("Unknown field: %s" % label)
+    else:
+        field = model._meta.pk
+    try:
+        value = field.to_python(value)
+    except ValidationError as e:
+        raise CommandError("Invalid value for %s %s: %s" % (
+            option, label, ' '.join(e.messages)))
+    return model, field, value
+
+
+def get_filters(models, watermarks, pk_gt, since):
+    """
+    Returns a Q object selecting the objects of each model to dump, given the
+    primary keys recorded in a state file and the values of the --pk-gt and
+    --since options. The objects added after the primary key and those
+    changed since the --since values are both selected.
+    """
+    added = {}
+    changed = dict((model, {}) for model in models)
+    for model in models:
+        if model_label(model) in watermarks:
+            added[model] = model._meta.pk.to_python(watermarks[model_label(model)])
+    for value in pk_gt:
+        model, field, value = parse_model_value('--pk-gt', value)
+        if model in changed:
+            added[model] = value
+    for value in since:
+        model, field, value = parse_model_value('--since', value, with_field_name=True)
+        if model in changed:
+            changed[model]['%s__gte' % field.name] = value
+    filters = {}
+    for model in models:
+        if model in added and changed[model]:
+            filters[model] = Q(pk__gt=added[model]) | Q(**changed[model])
+        elif model in added:
+            filters[model] = Q(pk__gt=added[model])
+        else:
+            filters[model] = Q(**changed[model])
+    return filters
+
+
+def get_watermarks(models, using, use_base_manager):
+    """
+    Returns the highest primary key of each model that has objects, by
+    model label.
+    """
+    watermarks = {}
+    for model in models:
+        latest = get_queryset(model, using, use_base_manager).aggregate(
+            latest=Max('pk'))['latest']
+        if latest is not None:
+            watermarks[model_label(model)] = smart_text(latest, strings_only=True)
+    return watermarks
+
+
+def read_state(path):
+    """
+    Returns the highest primary key of each model recorded in the state file
+    of a previous dump, by model label. The file doesn't have to exist yet.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except ValueError as e:
+        raise CommandError("Invalid state file %s: %s" % (path, e))
+
+
+def read_deleted(path):
+    """
+    Returns DeletedObject instances for the primary keys listed by model
+    label in a JSON file, the models depending on others first.
+    """
+    from django.db.models import get_model
+
+    try:
+        with open(path) as f:
+            pks = json.load(f)
+    except (IOError, ValueError) as e:
+        raise CommandError("Invalid file of deleted objects %s: %s" % (path, e))
+    models = {}
+    for label in pks:
+        model = get_model(*label.split('.', 1)) if '.' in label else None
+        if model is None:
+            raise CommandError("Unknown model: %s" % label)
+        models[model] = pks[label]
+    deleted = []
+    for level in reversed(dependency_levels(list(models))):
+        for group in level:
+            for model in group:
+                deleted.extend(DeletedObject(model(pk=model._meta.pk.to_python(pk)))
+                               for pk in models[model])
+    return deleted
+
+
+def dump_partition(task):
+    """
+    Writes the objects of a model whose primary key is in [start, end) to a
+    fixture. Returns the number of objects written.
+
+    Runs in the worker processes of dumpdata --parallel.
+    """
+    from django.db.models import get_model
+
+    label, using, use_base_manager, filters, start, end, path, format, binary, options = task
+    queryset = get_queryset(get_model(*label.split('.')), using, use_base_manager, filters)
+    if start is not None:
+        queryset = queryset.filter(pk__gte=start)
+    if end is not None:
+        queryset = queryset.filter(pk__lt=end)
+    counter = [0]
+    def get_objects():
+        for obj in queryset.iterator():
+            counter[0] += 1
+            yield obj
+    with open(path, 'wb' if binary else 'w') as stream:
+        serializers.serialize(format, get_objects(), stream=stream, **options)
+    return counter[0]
+
+
+def dependency_levels(models):
+    """
+    Splits a list of models into levels of groups of models. The models of
+    each level only have foreign keys and many-to-many relations to those of
+    the previous levels, or to their own group, so that the groups of a
+    level can be loaded in parallel once the previous levels are loaded.
+
+    Each model gets its own group, except for models with circular
+    dependencies, which end up together in the last group.
+    """
+    from django.db.models import get_model
+
+    dependencies = SortedDict()
+    for model in models:
+        deps = set()
+        for field in model._meta.fields:
+            if field.rel is not None:
+                deps.add(field.rel.to)
+        for field in model._meta.many_to_many:
+            deps.add(field.rel.to)
+        if hasattr(model, 'natural_key'):
+            for dep in getattr(model.natural_key, 'dependencies', []):
+                deps.add(get_model(*dep.split('.')))
+        deps.discard(model)
+        dependencies[model] = set(dep for dep in deps if dep in models)
+
+    levels = []
+    done = set()
+    while dependencies:
+        level = [model for model, deps in dependencies.items() if deps <= done]
+        if not level:
+            # Circular dependencies: one group of everything that's left.
+            levels.append([list(dependencies)])
+            break
+        for model in level:
+            del dependencies[model]
+        done.update(level)
+        levels.append([[model] for model in level])
+    return levels
+
 def sort_dependencies(app_list):
     """Sort a list of app,modellist pairs into a single list of models.
 
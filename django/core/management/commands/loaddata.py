@@ -3,17 +3,23 @@ from __future__ import unicode_literals
 import sys
 import os
 import gzip
+import json
+import multiprocessing
 import zipfile
 from optparse import make_option
 import traceback
 
 from django.conf import settings
 from django.core import serializers
+from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
+from django.core.management.commands.dumpdata import MANIFEST_NAME, is_in_memory
+from django.core.serializers.base import DeletedObject
 from django.db import (connections, router, transaction, DEFAULT_DB_ALIAS,
       IntegrityError, DatabaseError)
 from django.db.models import get_apps
+from django.utils import six
 from django.utils.encoding import force_text
 from django.utils._os import upath
 from itertools import product
@@ -36,12 +42,22 @@ class Command(BaseCommand):
         make_option('--ignorenonexistent', '-i', action='store_true', dest='ignore',
             default=False, help='Ignores entries in the serialized data for fields'
                                 ' that do not currently exist on the model.'),
+        make_option('--bulk', action='store_true', dest='bulk', default=False,
+            help='Inserts the objects of each model in batches rather than '
+                 'saving them one by one. Doesn\'t send signals.'),
+        make_option('--parallel', dest='parallel', type='int', default=1,
+            help='Number of processes loading the fixtures of directories '
+                 'written by dumpdata --output-dir.'),
     )
 
+    # Number of objects of a model written at once in bulk mode.
+    bulk_batch_size = 500
+
     def handle(self, *fixture_labels, **options):
 
         ignore = options.get('ignore')
         using = options.get('database')
+        bulk = options.get('bulk')
 
         connection = connections[using]
 
@@ -53,6 +69,7 @@ class Command(BaseCommand):
 
         verbosity = int(options.get('verbosity'))
         show_traceback = options.get('traceback')
+        parallel = options.get('parallel')
 
         # commit is a stealth option - it isn't really useful as
         # a command line option, but it can be useful when invoking
@@ -62,6 +79,23 @@ class Command(BaseCommand):
         # the transaction in place when loaddata was invoked.
         commit = options.get('commit', True)
 
+        # Directories written by dumpdata --output-dir are loaded by levels in
+        # parallel processes when possible, or else replaced by their
+        # fixtures, in order.
+        labels = []
+        for fixture_label in fixture_labels:
+            levels = read_manifest(fixture_label)
+            if levels is None:
+                labels.append(fixture_label)
+            elif parallel > 1 and commit and not is_in_memory(connection):
+                self.load_levels(levels, using, parallel, verbosity, bulk, ignore)
+            else:
+                labels.extend(path for level in levels for group in level
+                              for path in group['files'])
+        if not labels:
+            return
+        fixture_labels = labels
+
         # Keep a count of the installed objects and fixtures
         fixture_count = 0
         loaded_object_count = 0
@@ -83,20 +117,27 @@ class Command(BaseCommand):
             transaction.managed(True, using=using)
 
         class SingleZipReader(zipfile.ZipFile):
+            member = None
             def __init__(self, *args, **kwargs):
                 zipfile.ZipFile.__init__(self, *args, **kwargs)
                 if settings.DEBUG:
                     assert len(self.namelist()) == 1, "Zip-compressed fixtures must contain only one file."
-            def read(self):
-                return zipfile.ZipFile.read(self, self.namelist()[0])
-
+                self.member = self.open(self.namelist()[0])
+            def read(self, size=-1):
+                return self.member.read(size)
+            def close(self):
+                if self.member is not None:
+                    self.member.close()
+                zipfile.ZipFile.close(self)
+
+        # Fixtures are read as bytes, some formats are binary.
         compression_types = {
-            None:   open,
-            'gz':   gzip.GzipFile,
-            'zip':  SingleZipReader
+            None:   (open, 'rb'),
+            'gz':   (gzip.GzipFile, 'rb'),
+            'zip':  (SingleZipReader, 'r'),
         }
         if has_bz2:
-            compression_types['bz2'] = bz2.BZ2File
+            compression_types['bz2'] = (bz2.BZ2File, 'r')
 
         app_module_paths = []
         for app in get_apps():
@@ -162,9 +203,9 @@ class Command(BaseCommand):
                                 self.stdout.write("Trying %s for %s fixture '%s'..." % \
                                     (humanize(fixture_dir), file_name, fixture_name))
                             full_path = os.path.join(fixture_dir, file_name)
-                            open_method = compression_types[compression_format]
+                            open_method, mode = compression_types[compression_format]
                             try:
-                                fixture = open_method(full_path, 'r')
+                                fixture = open_method(full_path, mode)
                             except IOError:
                                 if verbosity >= 2:
                                     self.stdout.write("No %s fixture '%s' in %s." % \
@@ -183,22 +224,39 @@ class Command(BaseCommand):
                                             (format, fixture_name, humanize(fixture_dir)))
 
                                     objects = serializers.deserialize(format, fixture, using=using, ignorenonexistent=ignore)
+                                    # Objects waiting to be saved in bulk, all of
+                                    # the same model.
+                                    batch, batch_model = [], None
 
                                     for obj in objects:
                                         objects_in_fixture += 1
-                                        if router.allow_syncdb(using, obj.object.__class__):
+                                        model = obj.object.__class__
+                                        if router.allow_syncdb(using, model):
                                             loaded_objects_in_fixture += 1
-                                            models.add(obj.object.__class__)
-                                            try:
-                                                obj.save(using=using)
-                                            except (DatabaseError, IntegrityError) as e:
-                                                e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
-                                                        'app_label': obj.object._meta.app_label,
-                                                        'object_name': obj.object._meta.object_name,
-                                                        'pk': obj.object.pk,
-                                                        'error_msg': force_text(e)
-                                                    },)
-                                                raise
+                                            models.add(model)
+                                            if isinstance(obj, DeletedObject):
+                                                # Deletions are applied in
+                                                # order with the saves.
+                                                if batch:
+                                                    self.save_batch(batch_model, batch, using)
+                                                    batch = []
+                                                self.save_object(obj, using)
+                                                continue
+                                            # The next objects may refer to those
+                                            # with natural keys while being
+                                            # deserialized, they can't wait.
+                                            if not bulk or hasattr(model._default_manager, 'get_by_natural_key'):
+                                                self.save_object(obj, using)
+                                                continue
+                                            if batch and (model is not batch_model or
+                                                          len(batch) >= self.bulk_batch_size):
+                                                self.save_batch(batch_model, batch, using)
+                                                batch = []
+                                            batch.append(obj)
+                                            batch_model = model
+
+                                    if batch:
+                                        self.save_batch(batch_model, batch, using)
 
                                     loaded_object_count += loaded_objects_in_fixture
                                     fixture_object_count += objects_in_fixture
@@ -262,3 +320,155 @@ class Command(BaseCommand):
         # incorrect results. See Django #7572, MySQL #37735.
         if commit:
             connection.close()
+
+    def save_object(self, obj, using):
+        try:
+            obj.save(using=using)
+        except (DatabaseError, IntegrityError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
+                    'app_label': obj.object._meta.app_label,
+                    'object_name': obj.object._meta.object_name,
+                    'pk': obj.object.pk,
+                    'error_msg': force_text(e)
+                },)
+            raise
+
+    def save_batch(self, model, batch, using):
+        """
+        Saves a batch of deserialized objects of the same model.
+
+        Objects that don't exist in the database yet are inserted in raw
+        batches, which keep their field values as save_base(raw=True) does,
+        and their many-to-many relations with one bulk_create() per field.
+        Objects that exist already are updated one by one, as are those of
+        models that can't be bulk inserted.
+        """
+        opts = model._meta
+        # A later object with the same primary key replaces the earlier one,
+        # as it would when saving them one by one.
+        candidates = {}
+        for obj in batch:
+            if obj.object.pk is None or opts.parents:
+                self.save_object(obj, using)
+            else:
+                candidates[obj.object.pk] = obj
+        if not candidates:
+            return
+        existing = set(model._base_manager.using(using).filter(
+            pk__in=list(candidates)).values_list('pk', flat=True))
+        new_objects = []
+        for pk, obj in candidates.items():
+            if pk in existing:
+                self.save_object(obj, using)
+            else:
+                new_objects.append(obj)
+        if not new_objects:
+            return
+
+        try:
+            # bulk_create() would call pre_save() and replace the values of
+            # auto_now and auto_now_add fields.
+            objs = [obj.object for obj in new_objects]
+            fields = opts.local_fields
+            batch_size = max(connections[using].ops.bulk_batch_size(fields, objs), 1)
+            for i in range(0, len(objs), batch_size):
+                model._base_manager._insert(objs[i:i + batch_size], fields=fields,
+                                            using=using, raw=True)
+            for obj in new_objects:
+                obj.object._state.db = using
+                obj.object._state.adding = False
+            for field in opts.many_to_many:
+                through = field.rel.through
+                if not through._meta.auto_created or field.rel.symmetrical:
+                    # Leave these to the related manager, which knows how to
+                    # fill custom or symmetrical tables.
+                    for obj in new_objects:
+                        if obj.m2m_data and field.name in obj.m2m_data:
+                            setattr(obj.object, field.name, obj.m2m_data[field.name])
+                    continue
+                source = through._meta.get_field(field.m2m_field_name()).attname
+                target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+                rows = []
+                for obj in new_objects:
+                    if obj.m2m_data and field.name in obj.m2m_data:
+                        for related_pk in set(obj.m2m_data[field.name]):
+                            rows.append(through(**{source: obj.object.pk, target: related_pk}))
+                through._base_manager.db_manager(using).bulk_create(rows)
+        except (DatabaseError, IntegrityError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s objects: %(error_msg)s" % {
+                    'app_label': opts.app_label,
+                    'object_name': opts.object_name,
+                    'error_msg': force_text(e)
+                },)
+            raise
+        for obj in new_objects:
+            obj.m2m_data = None
+
+    def load_levels(self, levels, using, parallel, verbosity, bulk, ignore):
+        """
+        Loads the groups of fixtures of each level in parallel processes,
+        each group in its own transaction, then resets the sequences of the
+        loaded models.
+        """
+        from django.db.models import get_model
+
+        # The workers must not share the connections of this process.
+        for connection in connections.all():
+            connection.close()
+        pool = multiprocessing.Pool(parallel)
+        try:
+            for level in levels:
+                tasks = [(group['files'], using, verbosity, bulk, ignore) for group in level]
+                for output in pool.map(load_group, tasks, 1):
+                    self.stdout.write(output, ending='')
+        finally:
+            pool.terminate()
+            pool.join()
+
+        models = [get_model(*label.split('.')) for level in levels
+                  for group in level for label in group['models']]
+        connection = connections[using]
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), models)
+        if sequence_sql:
+            if verbosity >= 2:
+                self.stdout.write("Resetting sequences\n")
+            cursor = connection.cursor()
+            for line in sequence_sql:
+                cursor.execute(line)
+            transaction.commit_unless_managed(using=using)
+
+
+def read_manifest(label):
+    """
+    Returns the levels of groups of fixtures of a directory written by
+    dumpdata --output-dir, with absolute paths, or None if label isn't such
+    a directory.
+    """
+    path = os.path.join(label, MANIFEST_NAME)
+    if not os.path.isfile(path):
+        return None
+    with open(path) as manifest_file:
+        levels = json.load(manifest_file)['levels']
+    directory = os.path.abspath(label)
+    for level in levels:
+        for group in level:
+            group['files'] = [os.path.join(directory, f) for f in group['files']]
+    return levels
+
+
+def load_group(task):
+    """
+    Loads a group of fixtures in a transaction and returns the output of
+    loaddata.
+
+    Runs in the worker processes of loaddata --parallel.
+    """
+    files, using, verbosity, bulk, ignore = task
+    stdout = six.StringIO()
+    try:
+        call_command('loaddata', *files, database=using, verbosity=verbosity,
+                     bulk=bulk, ignore=ignore, stdout=stdout)
+    except Exception as e:
+        # Only pass picklable errors back to the main process.
+        raise CommandError(force_text(e))
+    return stdout.getvalue()
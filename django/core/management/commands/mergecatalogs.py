@@ -0,0 +1,35 @@
+from __future__ import unicode_literals
+
+import os
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand, CommandError
+
+
+class Command(NoArgsCommand):
+    option_list = NoArgsCommand.option_list + (
+        make_option('--locale', '-l', dest='locale', action='append',
+            help='The language to process. Use multiple times for more. Default is all the LANGUAGES.'),
+    )
+    help = ("Writes the merged translation catalog of each language to the "
+            "MERGED_CATALOGS_DIR directory.")
+
+    requires_model_validation = False
+
+    def handle_noargs(self, **options):
+        from django.conf import settings
+        from django.utils.translation import trans_real
+
+        if not settings.MERGED_CATALOGS_DIR:
+            raise CommandError("You must set the MERGED_CATALOGS_DIR setting.")
+        languages = options.get('locale') or [code for code, name in settings.LANGUAGES]
+        verbosity = int(options.get('verbosity'))
+
+        if not os.path.isdir(settings.MERGED_CATALOGS_DIR):
+            os.makedirs(settings.MERGED_CATALOGS_DIR)
+        for language in languages:
+            if trans_real.write_merged_catalog(language):
+                if verbosity >= 2:
+                    self.stdout.write("Wrote the catalog of %s" % language)
+            elif verbosity >= 1:
+                self.stdout.write("No catalogs found for %s" % language)
@@ -2,7 +2,10 @@
 Module for abstract serializer/unserializer base classes.
 """
 
+import itertools
+
 from django.db import models
+from django.db.models.query import prefetch_related_objects
 from django.utils.encoding import smart_text
 from django.utils import six
 
@@ -27,6 +30,12 @@ class Serializer(object):
     # internal Django use.
     internal_use_only = False
 
+    # Whether the serializer writes bytes rather than text.
+    binary = False
+
+    # Number of objects whose related objects are fetched at once.
+    prefetch_chunk_size = 1000
+
     def serialize(self, queryset, **options):
         """
         Serialize a queryset.
@@ -39,29 +48,137 @@ class Serializer(object):
 
         self.start_serialization()
         self.first = True
-        for obj in queryset:
-            self.start_object(obj)
-            # Use the concrete parent class' _meta instead of the object's _meta
-            # This is to avoid local_fields problems for proxy models. Refs #17717.
-            concrete_model = obj._meta.concrete_model
-            for field in concrete_model._meta.local_fields:
-                if field.serialize:
-                    if field.rel is None:
-                        if self.selected_fields is None or field.attname in self.selected_fields:
-                            self.handle_field(obj, field)
-                    else:
-                        if self.selected_fields is None or field.attname[:-3] in self.selected_fields:
-                            self.handle_fk_field(obj, field)
-            for field in concrete_model._meta.many_to_many:
-                if field.serialize:
-                    if self.selected_fields is None or field.attname in self.selected_fields:
-                        self.handle_m2m_field(obj, field)
-            self.end_object(obj)
+        self._related_pks = {}
+        plans = {}
+        for obj in self.prefetch_related(queryset):
+            if isinstance(obj, DeletedObject):
+                self.start_object(obj.object)
+                self.handle_deleted(obj.object)
+                self.end_object(obj.object)
+            else:
+                try:
+                    plan = plans[obj.__class__]
+                except KeyError:
+                    plan = plans[obj.__class__] = self.get_serialization_plan(obj.__class__)
+                self.start_object(obj)
+                for handler, field in plan:
+                    handler(obj, field)
+                self.end_object(obj)
             if self.first:
                 self.first = False
         self.end_serialization()
         return self.getvalue()
 
+    def get_serialization_plan(self, model):
+        """
+        Returns the (handler, field) pairs to call for each instance of the
+        model, in order. It's computed once per model for each call to
+        serialize().
+        """
+        # Use the concrete parent class' _meta instead of the object's _meta
+        # This is to avoid local_fields problems for proxy models. Refs #17717.
+        concrete_model = model._meta.concrete_model
+        plan = []
+        for field in concrete_model._meta.local_fields:
+            if field.serialize:
+                if field.rel is None:
+                    if self.selected_fields is None or field.attname in self.selected_fields:
+                        plan.append((self.handle_field, field))
+                else:
+                    if self.selected_fields is None or field.attname[:-3] in self.selected_fields:
+                        plan.append((self.handle_fk_field, field))
+        for field in concrete_model._meta.many_to_many:
+            if field.serialize:
+                if self.selected_fields is None or field.attname in self.selected_fields:
+                    plan.append((self.handle_m2m_field, field))
+        return plan
+
+    def prefetch_related(self, queryset):
+        """
+        Yields the objects of the queryset, fetching the related objects
+        needed to serialize them with one query per field for each chunk of
+        ``prefetch_chunk_size`` objects, rather than one per object.
+
+        The many-to-many fields only need the primary keys of their related
+        objects, see get_related_pks(). The related objects themselves are
+        fetched when their natural keys are used, for many-to-many fields
+        and foreign keys alike.
+        """
+        objects = iter(queryset)
+        while True:
+            chunk = list(itertools.islice(objects, self.prefetch_chunk_size))
+            if not chunk:
+                break
+            self._related_pks = {}
+            by_model = {}
+            for obj in chunk:
+                # The relations of unsaved objects can't be fetched.
+                if not isinstance(obj, DeletedObject) and obj.pk is not None:
+                    by_model.setdefault(obj.__class__, []).append(obj)
+            for model, instances in by_model.items():
+                lookups = self.get_prefetch_lookups(model)
+                if lookups:
+                    prefetch_related_objects(instances, lookups)
+                for field in self.get_related_pk_fields(model):
+                    self.fetch_related_pks(instances, field)
+            for obj in chunk:
+                yield obj
+
+    def get_prefetch_lookups(self, model):
+        """
+        Returns the names of the relations of the model whose objects are
+        fetched before serializing its instances.
+        """
+        concrete_model = model._meta.concrete_model
+        lookups = []
+        if self.use_natural_keys:
+            for field in concrete_model._meta.local_fields:
+                if (field.serialize and field.rel is not None and
+                        hasattr(field.rel.to, 'natural_key') and
+                        (self.selected_fields is None or field.attname[:-3] in self.selected_fields)):
+                    lookups.append(field.name)
+        for field in concrete_model._meta.many_to_many:
+            if (field.serialize and field.rel.through._meta.auto_created and
+                    self.use_natural_keys and hasattr(field.rel.to, 'natural_key') and
+                    (self.selected_fields is None or field.attname in self.selected_fields)):
+                lookups.append(field.name)
+        return lookups
+
+    def get_related_pk_fields(self, model):
+        """
+        Returns the many-to-many fields of the model whose related primary
+        keys are fetched before serializing its instances.
+        """
+        return [field for field in model._meta.concrete_model._meta.many_to_many
+                if field.serialize and field.rel.through._meta.auto_created and
+                not (self.use_natural_keys and hasattr(field.rel.to, 'natural_key')) and
+                (self.selected_fields is None or field.attname in self.selected_fields)]
+
+    def fetch_related_pks(self, instances, field):
+        """
+        Fetches the primary keys of the objects related to the instances by
+        the many-to-many field, in one query.
+        """
+        # The query of the related manager keeps the ordering and filtering
+        # of the target's default manager, and selects the primary key of
+        # the instance each row is related to.
+        manager = getattr(instances[0], field.name)
+        qs = manager.get_prefetch_query_set(instances)[0]
+        for instance in instances:
+            self._related_pks[field, instance.pk] = []
+        for pk, related_pk in qs.values_list('_prefetch_related_val', 'pk'):
+            self._related_pks[field, pk].append(related_pk)
+
+    def get_related_pks(self, obj, field):
+        """
+        Returns the primary keys of the objects related to obj by the
+        many-to-many field, fetched with the rest of the chunk if possible.
+        """
+        try:
+            return self._related_pks[field, obj.pk]
+        except KeyError:
+            return getattr(obj, field.name).values_list('pk', flat=True)
+
     def start_serialization(self):
         """
         Called when serializing of the queryset starts.
@@ -104,6 +221,12 @@ class Serializer(object):
         """
         raise NotImplementedError
 
+    def handle_deleted(self, obj):
+        """
+        Called instead of the field handlers for an object that was deleted.
+        """
+        raise NotImplementedError
+
     def getvalue(self):
         """
         Return the fully serialized queryset (or None if the output stream is
@@ -170,3 +293,26 @@ class DeserializedObject(object):
         # prevent a second (possibly accidental) call to save() from saving
         # the m2m data twice.
         self.m2m_data = None
+
+class DeletedObject(object):
+    """
+    A tombstone for a deleted model instance.
+
+    Serializers write it as a marker holding only the model and primary key
+    of the object, and deserializers return it alongside the
+    ``DeserializedObject`` instances. Calling ``save()`` deletes the object
+    from the database, if it's still there, so that loading the serialized
+    data applies the deletion.
+    """
+
+    def __init__(self, obj):
+        self.object = obj
+        self.m2m_data = None
+
+    def __repr__(self):
+        return "<DeletedObject: %s.%s(pk=%s)>" % (
+            self.object._meta.app_label, self.object._meta.object_name, self.object.pk)
+
+    def save(self, save_m2m=True, using=None):
+        model = self.object.__class__
+        model._base_manager.using(using).filter(pk=self.object.pk).delete()
@@ -0,0 +1,147 @@
+"""
+Compact binary serializer.
+
+The data starts with a signature, followed by frames. Each frame holds
+objects of a single model: the model identifier, the names of the serialized
+fields, and one row of values per object, packed with marshal. Frames of
+deleted objects have no names, and rows only holding the primary key. With
+the ``compress`` option, frames are compressed with zlib.
+
+marshal isn't meant to read data crafted by an attacker; only deserialize
+binary data from trusted sources.
+"""
+from __future__ import unicode_literals
+
+import marshal
+import struct
+import zlib
+
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Serializer as PythonSerializer
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.utils.encoding import smart_text
+from django.utils import six
+
+SIGNATURE = b'DJBIN\x01'
+# Flags, then length of the frame's payload.
+FRAME_HEADER = struct.Struct(str('>BI'))
+COMPRESSED = 1
+# The version of marshal that all supported Python versions can read.
+MARSHAL_VERSION = 2
+# Values of other types are packed as strings.
+PACKED_TYPES = (type(None), bool, float, six.text_type) + six.integer_types
+
+
+class Serializer(PythonSerializer):
+    """
+    Convert a queryset to compact binary data.
+    """
+    internal_use_only = False
+    binary = True
+    # Maximum number of objects in a frame.
+    frame_size = 1000
+
+    def serialize(self, queryset, **options):
+        options.setdefault('stream', six.BytesIO())
+        self.compress = options.pop('compress', False)
+        return super(Serializer, self).serialize(queryset, **options)
+
+    def start_serialization(self):
+        self._current = None
+        self._model = None
+        self._names = None
+        self._rows = []
+        self.stream.write(SIGNATURE)
+
+    def end_serialization(self):
+        self.write_frame()
+
+    def end_object(self, obj):
+        model = smart_text(obj._meta)
+        if (model != self._model or self._deleted != (self._names is None) or
+                len(self._rows) >= self.frame_size):
+            self.write_frame()
+            self._model = model
+            self._names = None if self._deleted else list(self._current)
+        row = [pack(obj._get_pk_val())]
+        if self._names is not None:
+            row.extend(pack(self._current[name]) for name in self._names)
+        self._rows.append(tuple(row))
+        self._current = None
+
+    def write_frame(self):
+        if not self._rows:
+            return
+        payload = marshal.dumps((self._model, self._names, self._rows), MARSHAL_VERSION)
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload)
+            flags |= COMPRESSED
+        self.stream.write(FRAME_HEADER.pack(flags, len(payload)))
+        self.stream.write(payload)
+        self._rows = []
+
+    def handle_field(self, obj, field):
+        value = field._get_val_from_obj(obj)
+        if isinstance(value, PACKED_TYPES):
+            self._current[field.name] = value
+        else:
+            self._current[field.name] = field.value_to_string(obj)
+
+    def getvalue(self):
+        # Grand-parent super
+        return super(PythonSerializer, self).getvalue()
+
+
+def pack(value):
+    """
+    Converts a value to types that marshal supports.
+    """
+    if isinstance(value, PACKED_TYPES):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [pack(item) for item in value]
+    return smart_text(value)
+
+
+def Deserializer(stream_or_string, **options):
+    """
+    Deserialize a stream or string of binary data, one frame at a time.
+    """
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = six.BytesIO(stream_or_string)
+    try:
+        for obj in PythonDeserializer(iter_objects(stream_or_string), **options):
+            yield obj
+    except GeneratorExit:
+        raise
+    except Exception as e:
+        # Map to deserializer error
+        raise DeserializationError(e)
+
+def iter_objects(stream):
+    """
+    Reads the frames of a stream and yields the objects they hold, as
+    dictionaries in the format of the python serializer.
+    """
+    if stream.read(len(SIGNATURE)) != SIGNATURE:
+        raise ValueError("The data doesn't start with the binary serializer signature.")
+    while True:
+        header = stream.read(FRAME_HEADER.size)
+        if not header:
+            break
+        if len(header) < FRAME_HEADER.size:
+            raise ValueError("Truncated frame header.")
+        flags, length = FRAME_HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated frame.")
+        if flags & COMPRESSED:
+            payload = zlib.decompress(payload)
+        model, names, rows = marshal.loads(payload)
+        if names is None:
+            for row in rows:
+                yield {'model': model, 'pk': row[0], 'deleted': True}
+        else:
+            for row in rows:
+                yield {'model': model, 'pk': row[0], 'fields': dict(zip(names, row[1:]))}
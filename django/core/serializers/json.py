@@ -5,9 +5,11 @@ Serialize data to/from JSON
 # Avoid shadowing the standard library json module
 from __future__ import absolute_import
 
+import codecs
 import datetime
 import decimal
 import json
+import re
 
 from django.core.serializers.base import DeserializationError
 from django.core.serializers.python import Serializer as PythonSerializer
@@ -59,13 +61,16 @@ class Serializer(PythonSerializer):
 def Deserializer(stream_or_string, **options):
     """
     Deserialize a stream or string of JSON data.
+
+    The data is parsed one object at a time, so that large streams don't need
+    to be held in memory all at once.
     """
-    if not isinstance(stream_or_string, (bytes, six.string_types)):
-        stream_or_string = stream_or_string.read()
     if isinstance(stream_or_string, bytes):
         stream_or_string = stream_or_string.decode('utf-8')
+    if isinstance(stream_or_string, six.string_types):
+        stream_or_string = six.StringIO(stream_or_string)
     try:
-        objects = json.loads(stream_or_string)
+        objects = iter_array(stream_or_string)
         for obj in PythonDeserializer(objects, **options):
             yield obj
     except GeneratorExit:
@@ -75,6 +80,90 @@ def Deserializer(stream_or_string, **options):
         raise DeserializationError(e)
 
 
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def iter_array(stream, chunk_size=64 * 1024):
+    """
+    Parses a JSON array from a stream, reading it chunk_size characters at
+    a time, and yields its items one by one as they are decoded.
+
+    Bytes are decoded as UTF-8.
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    state = {'buffer': '', 'eof': False}
+
+    def read(size):
+        """
+        Appends at least size characters to the buffer, unless the end of
+        the stream is reached first. Returns whether anything was appended.
+        """
+        data = ''
+        while not state['eof'] and len(data) < size:
+            chunk = stream.read(size)
+            if not chunk:
+                state['eof'] = True
+            if isinstance(chunk, bytes):
+                chunk = utf8_decoder.decode(chunk, final=not chunk)
+            data += chunk
+        state['buffer'] += data
+        return bool(data)
+
+    def skip_whitespace(pos):
+        """
+        Returns the position of the next non-whitespace character, reading
+        more data as needed.
+        """
+        while True:
+            pos = WHITESPACE.match(state['buffer'], pos).end()
+            if pos < len(state['buffer']) or not read(chunk_size):
+                return pos
+
+    def expect(pos, chars):
+        pos = skip_whitespace(pos)
+        if pos >= len(state['buffer']):
+            raise ValueError("Unexpected end of JSON data, expecting %s"
+                             % " or ".join("'%s'" % c for c in chars))
+        char = state['buffer'][pos]
+        if char not in chars:
+            raise ValueError("Unexpected '%s' in JSON data, expecting %s"
+                             % (char, " or ".join("'%s'" % c for c in chars)))
+        return char, pos + 1
+
+    char, pos = expect(0, '[')
+    pos = skip_whitespace(pos)
+    if state['buffer'][pos:pos + 1] == ']':
+        pos += 1
+    else:
+        while True:
+            # Values spanning more than the buffered data are retried with
+            # twice as much data each time.
+            size = chunk_size
+            pos = skip_whitespace(pos)
+            while True:
+                try:
+                    item, end = decoder.raw_decode(state['buffer'], idx=pos)
+                except ValueError:
+                    if not read(size):
+                        raise
+                else:
+                    # A number at the end of the buffer may go on in the
+                    # next chunk.
+                    if end < len(state['buffer']) or not read(size):
+                        break
+                size *= 2
+            yield item
+            # Drop the parsed data once in a while rather than after each item.
+            if end >= chunk_size:
+                state['buffer'] = state['buffer'][end:]
+                end = 0
+            char, pos = expect(end, ',]')
+            if char == ']':
+                break
+    if skip_whitespace(pos) < len(state['buffer']):
+        raise ValueError("Extra data after the JSON array")
+
+
 class DjangoJSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time and decimal types.
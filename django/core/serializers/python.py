@@ -21,6 +21,7 @@ class Serializer(base.Serializer):
 
     def start_serialization(self):
         self._current = None
+        self._deleted = False
         self.objects = []
 
     def end_serialization(self):
@@ -28,12 +29,19 @@ class Serializer(base.Serializer):
 
     def start_object(self, obj):
         self._current = {}
+        self._deleted = False
 
     def end_object(self, obj):
         self.objects.append(self.get_dump_object(obj))
         self._current = None
 
     def get_dump_object(self, obj):
+        if self._deleted:
+            return {
+                "pk": smart_text(obj._get_pk_val(), strings_only=True),
+                "model": smart_text(obj._meta),
+                "deleted": True
+            }
         return {
             "pk": smart_text(obj._get_pk_val(), strings_only=True),
             "model": smart_text(obj._meta),
@@ -64,11 +72,14 @@ class Serializer(base.Serializer):
     def handle_m2m_field(self, obj, field):
         if field.rel.through._meta.auto_created:
             if self.use_natural_keys and hasattr(field.rel.to, 'natural_key'):
-                m2m_value = lambda value: value.natural_key()
+                self._current[field.name] = [related.natural_key()
+                                   for related in getattr(obj, field.name).all()]
             else:
-                m2m_value = lambda value: smart_text(value._get_pk_val(), strings_only=True)
-            self._current[field.name] = [m2m_value(related)
-                               for related in getattr(obj, field.name).iterator()]
+                self._current[field.name] = [smart_text(pk, strings_only=True)
+                                   for pk in self.get_related_pks(obj, field)]
+
+    def handle_deleted(self, obj):
+        self._deleted = True
 
     def getvalue(self):
         return self.objects
@@ -89,6 +100,9 @@ def Deserializer(object_list, **options):
         # Look up the model and starting build a dict of data for it.
         Model = _get_model(d["model"])
         data = {Model._meta.pk.attname: Model._meta.pk.to_python(d["pk"])}
+        if d.get("deleted"):
+            yield base.DeletedObject(Model(**data))
+            continue
         m2m_data = {}
         model_fields = Model._meta.get_all_field_names()
 
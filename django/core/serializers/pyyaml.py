@@ -50,6 +50,9 @@ class Serializer(PythonSerializer):
 def Deserializer(stream_or_string, **options):
     """
     Deserialize a stream or string of YAML data.
+
+    The objects are constructed one at a time, so that large streams don't
+    need to be held in memory all at once.
     """
     if isinstance(stream_or_string, bytes):
         stream_or_string = stream_or_string.decode('utf-8')
@@ -58,10 +61,39 @@ def Deserializer(stream_or_string, **options):
     else:
         stream = stream_or_string
     try:
-        for obj in PythonDeserializer(yaml.safe_load(stream), **options):
+        for obj in PythonDeserializer(iter_sequence(stream), **options):
             yield obj
     except GeneratorExit:
         raise
     except Exception as e:
         # Map to deserializer error
         raise DeserializationError(e)
+
+def iter_sequence(stream):
+    """
+    Parses a YAML document holding a sequence from a stream and yields its
+    items one by one as they are constructed.
+    """
+    loader = yaml.SafeLoader(stream)
+    try:
+        # Skip the StreamStartEvent.
+        loader.get_event()
+        if not loader.check_event(yaml.DocumentStartEvent):
+            raise ValueError("The YAML data holds no document.")
+        loader.get_event()
+        if not loader.check_event(yaml.SequenceStartEvent):
+            raise ValueError("The YAML document isn't a sequence.")
+        loader.get_event()
+        parent = yaml.SequenceNode('tag:yaml.org,2002:seq', [])
+        index = 0
+        while not loader.check_event(yaml.SequenceEndEvent):
+            # Anchors are kept, aliases may refer to previous items.
+            node = loader.compose_node(parent, index)
+            yield loader.construct_document(node)
+            index += 1
+        loader.get_event()
+        loader.get_event()
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise ValueError("The YAML data holds more than one document.")
+    finally:
+        loader.dispose()
@@ -125,16 +125,23 @@ class Serializer(base.Serializer):
                         self.xml.characters(smart_text(key_value))
                         self.xml.endElement("natural")
                     self.xml.endElement("object")
+                for relobj in getattr(obj, field.name).all():
+                    handle_m2m(relobj)
             else:
-                def handle_m2m(value):
+                for pk in self.get_related_pks(obj, field):
                     self.xml.addQuickElement("object", attrs={
-                        'pk' : smart_text(value._get_pk_val())
+                        'pk' : smart_text(pk)
                     })
-            for relobj in getattr(obj, field.name).iterator():
-                handle_m2m(relobj)
 
             self.xml.endElement("field")
 
+    def handle_deleted(self, obj):
+        """
+        Called to mark an object as deleted, with an empty <deleted> node.
+        """
+        self.indent(2)
+        self.xml.addQuickElement("deleted")
+
     def _start_relational_field(self, field):
         """
         Helper to output the <field> element for relational fields
@@ -164,12 +171,17 @@ class Deserializer(base.Deserializer):
         for event, node in self.event_stream:
             if event == "START_ELEMENT" and node.nodeName == "object":
                 self.event_stream.expandNode(node)
-                return self._handle_object(node)
+                obj = self._handle_object(node)
+                # Objects are parsed one at a time; break the reference
+                # cycles of the DOM nodes so that memory is freed right away.
+                node.unlink()
+                return obj
         raise StopIteration
 
     def _handle_object(self, node):
         """
-        Convert an <object> node to a DeserializedObject.
+        Convert an <object> node to a DeserializedObject, or to a
+        DeletedObject if it has a <deleted> node.
         """
         # Look up the model using the model loading mechanism. If this fails,
         # bail.
@@ -184,6 +196,9 @@ class Deserializer(base.Deserializer):
 
         data = {Model._meta.pk.attname : Model._meta.pk.to_python(pk)}
 
+        if node.getElementsByTagName("deleted"):
+            return base.DeletedObject(Model(**data))
+
         # Also start building a dict of m2m data (this is saved as
         # {m2m_accessor_attribute : [list_of_related_objects]})
         m2m_data = {}
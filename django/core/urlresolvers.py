@@ -8,6 +8,7 @@ a string) and returns a tuple in this format:
 """
 from __future__ import unicode_literals
 
+import itertools
 import re
 from threading import local
 
@@ -19,7 +20,7 @@ from django.utils.functional import memoize, lazy
 from django.utils.http import urlquote
 from django.utils.importlib import import_module
 from django.utils.module_loading import module_has_submodule
-from django.utils.regex_helper import normalize
+from django.utils.regex_helper import normalize, split_groups
 from django.utils import six
 from django.utils.translation import get_language
 
@@ -27,6 +28,12 @@ from django.utils.translation import get_language
 _resolver_cache = {} # Maps URLconf modules to RegexURLResolver instances.
 _ns_resolver_cache = {} # Maps namespaces to RegexURLResolver instances.
 _callable_cache = {} # Maps view and url pattern names to their view functions.
+_prefix_cache = {} # Maps script prefixes to their normalized form.
+_reverse_cache = {} # Maps reverse() arguments to the resulting URL.
+
+# Argument types whose text representation can't change once they have been
+# hashed, which makes reverse() calls using them safe to memoize.
+_REVERSE_CACHEABLE_TYPES = (six.text_type, bytes) + tuple(six.integer_types)
 
 # SCRIPT_NAME prefixes for each thread are stored here. If there's no entry for
 # the current thread (which is the only one we ever access), it is assumed to
@@ -135,6 +142,92 @@ def get_ns_resolver(ns_pattern, resolver):
     return RegexURLResolver(r'^/', [ns_resolver])
 get_ns_resolver = memoize(get_ns_resolver, _ns_resolver_cache, 2)
 
+def _normalize_prefix(prefix):
+    return normalize(urlquote(prefix))[0]
+_normalize_prefix = memoize(_normalize_prefix, _prefix_cache, 1)
+
+def compile_reverse(prefix_norm, prefix_args, result, params, pattern, defaults):
+    """
+    Returns a function building the URL of one form of a pattern, under the
+    normalized prefix, from the args or kwargs of a reverse() call. The
+    function returns None if they don't fit the pattern.
+
+    When the pattern is only made of literal text and capturing groups, each
+    value is checked against the regex of its group, rather than matching the
+    whole URL against the pattern.
+    """
+    regex = re.compile('^%s%s' % (prefix_norm, pattern), re.UNICODE)
+    arg_names = prefix_args + params
+    args_template = prefix_norm + result
+    kwargs_template = prefix_norm.replace('%', '%%') + result
+    kwarg_names = set(params) | set(defaults) | set(prefix_args)
+    default_names = set(defaults)
+    default_items = list(defaults.items())
+    validators = get_validators(prefix_norm, pattern, args_template)
+    # With a single group before the end of the pattern, the group has to
+    # match the value itself. With several, a value the validators reject
+    # might still fit when the URL is split differently between the groups.
+    exact = (validators is not None and len(validators) <= 1 and
+             pattern.endswith('$') and not pattern.endswith('\\$'))
+
+    def format(args, kwargs):
+        if args:
+            if len(args) != len(arg_names):
+                return None
+            values = dict(zip(arg_names, [force_text(val) for val in args]))
+            candidate = args_template % values
+        else:
+            if set(kwargs) | default_names != kwarg_names:
+                return None
+            for k, v in default_items:
+                if kwargs.get(k, v) != v:
+                    return None
+            values = dict([(k, force_text(v)) for (k, v) in kwargs.items()])
+            candidate = kwargs_template % values
+        if validators is not None:
+            for name, validate in validators:
+                if not validate(values[name]):
+                    break
+            else:
+                return candidate
+            # "$" also matches before a trailing newline.
+            if exact and not candidate.endswith('\n'):
+                return None
+        if regex.search(candidate):
+            return candidate
+        return None
+    return format
+
+def get_validators(prefix_norm, pattern, template):
+    """
+    Returns a list of (name, match function) pairs checking the value of each
+    group of the pattern, or None if the URLs built from the template can't
+    be validated group by group.
+    """
+    if '%' in prefix_norm or re.search(r'[.^$*+?{}\[\]\\|()]', prefix_norm):
+        return None
+    pieces = split_groups(pattern)
+    if pieces is None:
+        return None
+    expected = [prefix_norm]
+    validators = []
+    for piece in pieces:
+        if isinstance(piece, tuple):
+            name, group_pattern = piece
+            expected.append('%%(%s)s' % name)
+            try:
+                validators.append((name, re.compile(r'(?:%s)\Z' % group_pattern, re.UNICODE).match))
+            except re.error:
+                return None
+        elif '%' in piece:
+            return None
+        else:
+            expected.append(piece)
+    # The template must be the literal text of the pattern.
+    if ''.join(expected) != template:
+        return None
+    return validators
+
 def get_mod_func(callback):
     # Converts 'django.views.news.stories.story_detail' to
     # ['django.views.news.stories', 'story_detail']
@@ -244,6 +337,7 @@ class RegexURLResolver(LocaleRegexProvider):
         self._reverse_dict = {}
         self._namespace_dict = {}
         self._app_dict = {}
+        self._reverse_formats = {}
 
     def __repr__(self):
         if isinstance(self.urlconf_name, list) and len(self.urlconf_name):
@@ -372,6 +466,28 @@ class RegexURLResolver(LocaleRegexProvider):
     def reverse(self, lookup_view, *args, **kwargs):
         return self._reverse_with_prefix(lookup_view, '', *args, **kwargs)
 
+    def _reverse_formats_for(self, lookup_view, _prefix):
+        """
+        Returns the functions building the URLs of the patterns of the view,
+        compiled once for each language and prefix.
+        """
+        language_code = get_language()
+        key = (language_code, lookup_view, _prefix)
+        try:
+            return self._reverse_formats[key]
+        except KeyError:
+            pass
+        if language_code not in self._reverse_dict:
+            self._populate()
+        prefix_norm, prefix_args = _normalize_prefix(_prefix)
+        formats = [
+            compile_reverse(prefix_norm, prefix_args, result, params, pattern, defaults)
+            for possibility, pattern, defaults in self._reverse_dict[language_code].getlist(lookup_view)
+            for result, params in possibility]
+        if formats:
+            self._reverse_formats[key] = formats
+        return formats
+
     def _reverse_with_prefix(self, lookup_view, _prefix, *args, **kwargs):
         if args and kwargs:
             raise ValueError("Don't mix *args and **kwargs in call to reverse()!")
@@ -379,30 +495,10 @@ class RegexURLResolver(LocaleRegexProvider):
             lookup_view = get_callable(lookup_view, True)
         except (ImportError, AttributeError) as e:
             raise NoReverseMatch("Error importing '%s': %s." % (lookup_view, e))
-        possibilities = self.reverse_dict.getlist(lookup_view)
-
-        prefix_norm, prefix_args = normalize(urlquote(_prefix))[0]
-        for possibility, pattern, defaults in possibilities:
-            for result, params in possibility:
-                if args:
-                    if len(args) != len(params) + len(prefix_args):
-                        continue
-                    unicode_args = [force_text(val) for val in args]
-                    candidate = (prefix_norm + result) % dict(zip(prefix_args + params, unicode_args))
-                else:
-                    if set(kwargs.keys()) | set(defaults.keys()) != set(params) | set(defaults.keys()) | set(prefix_args):
-                        continue
-                    matches = True
-                    for k, v in defaults.items():
-                        if kwargs.get(k, v) != v:
-                            matches = False
-                            break
-                    if not matches:
-                        continue
-                    unicode_kwargs = dict([(k, force_text(v)) for (k, v) in kwargs.items()])
-                    candidate = (prefix_norm.replace('%', '%%') + result) % unicode_kwargs
-                if re.search('^%s%s' % (prefix_norm, pattern), candidate, re.UNICODE):
-                    return candidate
+        for format in self._reverse_formats_for(lookup_view, _prefix):
+            candidate = format(args, kwargs)
+            if candidate is not None:
+                return candidate
         # lookup_view can be URL label, or dotted path, or callable, Any of
         # these can be passed in at the top, but callables are not friendly in
         # error messages.
@@ -439,16 +535,53 @@ def resolve(path, urlconf=None):
         urlconf = get_urlconf()
     return get_resolver(urlconf).resolve(path)
 
+def _reverse_cache_key(viewname, urlconf, args, kwargs, prefix, current_app):
+    """
+    Returns the key under which the result of a reverse() call is memoized, or
+    None if the call can't be memoized safely.
+    """
+    for value in itertools.chain(args, six.itervalues(kwargs)):
+        # Exact type checks: bool is an int subclass that compares equal to
+        # 0 and 1 but renders differently.
+        if type(value) not in _REVERSE_CACHEABLE_TYPES:
+            return None
+    key = (viewname, urlconf, tuple(args), frozenset(six.iteritems(kwargs)),
+           prefix, current_app, get_language())
+    try:
+        hash(key)
+    except TypeError:
+        # e.g. a URLconf given as a list of patterns.
+        return None
+    return key
+
 def reverse(viewname, urlconf=None, args=None, kwargs=None, prefix=None, current_app=None):
     if urlconf is None:
         urlconf = get_urlconf()
-    resolver = get_resolver(urlconf)
     args = args or []
     kwargs = kwargs or {}
 
     if prefix is None:
         prefix = get_script_prefix()
 
+    from django.conf import settings
+    cache_size = settings.URL_REVERSE_CACHE_SIZE
+    if cache_size:
+        key = _reverse_cache_key(viewname, urlconf, args, kwargs, prefix, current_app)
+        if key is not None:
+            try:
+                return _reverse_cache[key]
+            except KeyError:
+                pass
+            url = _reverse(viewname, urlconf, args, kwargs, prefix, current_app)
+            if len(_reverse_cache) >= cache_size:
+                _reverse_cache.clear()
+            _reverse_cache[key] = url
+            return url
+    return _reverse(viewname, urlconf, args, kwargs, prefix, current_app)
+
+def _reverse(viewname, urlconf, args, kwargs, prefix, current_app):
+    resolver = get_resolver(urlconf)
+
     if not isinstance(viewname, six.string_types):
         view = viewname
     else:
@@ -501,9 +634,11 @@ def clear_url_caches():
     global _resolver_cache
     global _ns_resolver_cache
     global _callable_cache
+    global _reverse_cache
     _resolver_cache.clear()
     _ns_resolver_cache.clear()
     _callable_cache.clear()
+    _reverse_cache.clear()
 
 def set_script_prefix(prefix):
     """
@@ -511,6 +646,10 @@ def set_script_prefix(prefix):
     """
     if not prefix.endswith('/'):
         prefix += '/'
+    if prefix != get_script_prefix():
+        # The prefix is part of the memoized reverse() keys, but URLs built
+        # for a prefix that is no longer in use would only take up room.
+        _reverse_cache.clear()
     _prefixes.value = prefix
 
 def get_script_prefix():
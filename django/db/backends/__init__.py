@@ -38,6 +38,10 @@ class BaseDatabaseWrapper(object):
         self.transaction_state = []
         self.savepoint_state = 0
         self._dirty = None
+        # Functions waiting for the current transaction to be committed.
+        self.run_on_commit = []
+        # Number of such functions when each savepoint was created.
+        self.savepoint_run_on_commit = {}
         self._thread_ident = thread.get_ident()
         self.allow_thread_sharing = allow_thread_sharing
 
@@ -96,6 +100,7 @@ class BaseDatabaseWrapper(object):
         if self._dirty:
             self._rollback()
             self._dirty = False
+        self.run_on_commit = []
         while self.transaction_state:
             self.leave_transaction_management()
 
@@ -137,6 +142,9 @@ class BaseDatabaseWrapper(object):
             raise TransactionManagementError(
                 "Transaction managed block ended with pending COMMIT/ROLLBACK")
         self._dirty = False
+        # Nothing is left to commit once transactions aren't managed anymore.
+        if not self.is_managed():
+            self.run_commit_hooks()
 
     def validate_thread_sharing(self):
         """
@@ -186,6 +194,7 @@ class BaseDatabaseWrapper(object):
 
     def clean_savepoints(self):
         self.savepoint_state = 0
+        self.savepoint_run_on_commit = {}
 
     def is_managed(self):
         """
@@ -208,6 +217,8 @@ class BaseDatabaseWrapper(object):
             if not flag and self.is_dirty():
                 self._commit()
                 self.set_clean()
+            if not flag:
+                self.run_commit_hooks()
         else:
             raise TransactionManagementError("This code isn't under transaction "
                 "management")
@@ -220,6 +231,7 @@ class BaseDatabaseWrapper(object):
         if not self.is_managed():
             self._commit()
             self.clean_savepoints()
+            self.run_commit_hooks()
         else:
             self.set_dirty()
 
@@ -230,6 +242,7 @@ class BaseDatabaseWrapper(object):
         self.validate_thread_sharing()
         if not self.is_managed():
             self._rollback()
+            self.run_on_commit = []
         else:
             self.set_dirty()
 
@@ -240,6 +253,7 @@ class BaseDatabaseWrapper(object):
         self.validate_thread_sharing()
         self._commit()
         self.set_clean()
+        self.run_commit_hooks()
 
     def rollback(self):
         """
@@ -248,6 +262,27 @@ class BaseDatabaseWrapper(object):
         self.validate_thread_sharing()
         self._rollback()
         self.set_clean()
+        self.run_on_commit = []
+
+    def on_commit(self, func):
+        """
+        Registers a function to be called without arguments once the current
+        transaction is committed. It's discarded if the transaction is rolled
+        back, and called right away if transactions aren't managed.
+        """
+        if self.is_managed():
+            self.run_on_commit.append(func)
+        else:
+            func()
+
+    def run_commit_hooks(self):
+        """
+        Calls the functions registered with on_commit().
+        """
+        while self.run_on_commit:
+            hooks, self.run_on_commit = self.run_on_commit, []
+            for func in hooks:
+                func()
 
     def savepoint(self):
         """
@@ -262,6 +297,7 @@ class BaseDatabaseWrapper(object):
         tid = str(thread_ident).replace('-', '')
         sid = "s%s_x%d" % (tid, self.savepoint_state)
         self._savepoint(sid)
+        self.savepoint_run_on_commit[sid] = len(self.run_on_commit)
         return sid
 
     def savepoint_rollback(self, sid):
@@ -272,6 +308,10 @@ class BaseDatabaseWrapper(object):
         self.validate_thread_sharing()
         if self.savepoint_state:
             self._savepoint_rollback(sid)
+            # Discard the functions registered with on_commit() since the
+            # savepoint, their changes are rolled back too.
+            if self.features.uses_savepoints and sid in self.savepoint_run_on_commit:
+                del self.run_on_commit[self.savepoint_run_on_commit[sid]:]
 
     def savepoint_commit(self, sid):
         """
@@ -281,6 +321,7 @@ class BaseDatabaseWrapper(object):
         self.validate_thread_sharing()
         if self.savepoint_state:
             self._savepoint_commit(sid)
+            self.savepoint_run_on_commit.pop(sid, None)
 
     @contextmanager
     def constraint_checks_disabled(self):
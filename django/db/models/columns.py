@@ -0,0 +1,142 @@
+"""
+Columnar results for QuerySet.to_columns().
+
+Each column holds the values of a field for all the rows of a query. Integer,
+float and boolean fields are stored in typed arrays, which take a fraction of
+the memory of Python objects, and other values in lists. When NumPy is
+installed, the columns can be returned as NumPy arrays instead.
+"""
+from __future__ import unicode_literals
+
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from django.utils import six
+
+# The typecodes of array.array are native strings.
+try:
+    array(str('q'))
+    INTEGER = str('q')
+except ValueError:
+    # Arrays of long long aren't available before Python 3.3.
+    INTEGER = str('l')
+FLOAT = str('d')
+BOOLEAN = str('b')
+
+typecodes = {
+    'AutoField': INTEGER,
+    'BigIntegerField': INTEGER,
+    'BooleanField': BOOLEAN,
+    'FloatField': FLOAT,
+    'IntegerField': INTEGER,
+    'NullBooleanField': BOOLEAN,
+    'PositiveIntegerField': INTEGER,
+    'PositiveSmallIntegerField': INTEGER,
+    'SmallIntegerField': INTEGER,
+}
+
+
+def get_typecode(field):
+    """
+    Returns the array typecode for the values of a field, or None if they
+    can't be stored in a typed array. The values of relations are the values
+    of the fields they point to.
+    """
+    while getattr(field, 'rel', None) is not None:
+        try:
+            field = field.rel.get_related_field()
+        except AttributeError:
+            return None
+    try:
+        return typecodes.get(field.get_internal_type())
+    except AttributeError:
+        return None
+
+
+class MaskedArray(object):
+    """
+    A typed array of values with nulls. The nulls are stored as zeros in
+    values, and flagged in mask.
+    """
+    def __init__(self, values, mask):
+        self.values = values
+        self.mask = mask
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MaskedArray(self.values[index], self.mask[index])
+        if self.mask[index]:
+            return None
+        return self.values[index]
+
+    def __iter__(self):
+        for value, null in six.moves.zip(self.values, self.mask):
+            yield None if null else value
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '<MaskedArray: %r>' % self.tolist()
+
+    def tolist(self):
+        return list(self)
+
+
+class ColumnBuilder(object):
+    """
+    Accumulates the values of a column, chunk by chunk.
+    """
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        # The mask is only created when a null is found.
+        self.mask = None
+
+    def extend(self, values):
+        if self.typecode and (self.mask is not None or None in values):
+            if self.mask is None:
+                self.mask = array(BOOLEAN, [0]) * len(self.values)
+            self.mask.extend([value is None for value in values])
+            values = [0 if value is None else value for value in values]
+        self.values.extend(values)
+
+    def get_column(self, use_numpy=False):
+        """
+        Returns an array.array, a list, or a MaskedArray if there were nulls
+        in a typed column. With use_numpy, returns a NumPy array, masked if
+        there were nulls in a typed column.
+        """
+        if not use_numpy:
+            if self.mask is not None:
+                return MaskedArray(self.values, self.mask)
+            return self.values
+        if not self.typecode:
+            column = numpy.empty(len(self.values), dtype=object)
+            column[:] = self.values
+            return column
+        dtype = bool if self.typecode == BOOLEAN else self.typecode
+        column = to_numpy(self.values, dtype)
+        if self.mask is not None:
+            return numpy.ma.masked_array(column, mask=to_numpy(self.mask, bool))
+        return column
+
+
+def to_numpy(values, dtype):
+    """
+    Returns a NumPy array sharing the memory of an array.array, rather than
+    converting its values one by one.
+    """
+    if not values:
+        return numpy.empty(0, dtype=dtype)
+    return numpy.frombuffer(values, dtype=dtype)
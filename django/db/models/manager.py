@@ -193,6 +193,9 @@ class Manager(object):
     def values_list(self, *args, **kwargs):
         return self.get_query_set().values_list(*args, **kwargs)
 
+    def to_columns(self, *args, **kwargs):
+        return self.get_query_set().to_columns(*args, **kwargs)
+
     def update(self, *args, **kwargs):
         return self.get_query_set().update(*args, **kwargs)
 
@@ -6,15 +6,19 @@ import copy
 import itertools
 import sys
 import warnings
+from collections import namedtuple
+from operator import itemgetter
 
 from django.core import exceptions
 from django.db import connections, router, transaction, IntegrityError
+from django.db.models import columns
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields import AutoField
 from django.db.models.query_utils import (Q, select_related_descend,
     deferred_class_factory, InvalidQuery)
 from django.db.models.deletion import Collector
 from django.db.models import sql
+from django.utils.datastructures import SortedDict
 from django.utils.functional import partition
 from django.utils import six
 
@@ -23,6 +27,9 @@ from django.utils import six
 CHUNK_SIZE = 100
 ITER_CHUNK_SIZE = CHUNK_SIZE
 
+# The number of rows fetched at once by to_columns().
+COLUMNS_CHUNK_SIZE = 2000
+
 # The maximum number of items to display in a QuerySet.__repr__
 REPR_OUTPUT_SIZE = 20
 
@@ -527,6 +534,45 @@ class QuerySet(object):
         qs = self.filter(pk__in=id_list).order_by()
         return dict([(obj._get_pk_val(), obj) for obj in qs])
 
+    def to_columns(self, *fields, **kwargs):
+        """
+        Returns a SortedDict mapping the names of the given fields, as for
+        values_list(), to the columns of their values. Integer, float and
+        boolean values are stored in typed arrays, others in lists. The rows
+        are fetched chunk_size at a time.
+
+        With numpy, which defaults to True when NumPy is installed, the
+        columns are NumPy arrays.
+        """
+        chunk_size = kwargs.pop('chunk_size', COLUMNS_CHUNK_SIZE)
+        use_numpy = kwargs.pop('numpy', None)
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments to to_columns: %s'
+                    % (list(kwargs),))
+        if use_numpy is None:
+            use_numpy = columns.numpy is not None
+        elif use_numpy and columns.numpy is None:
+            raise ImportError("to_columns() requires NumPy when numpy=True.")
+
+        queryset = self._clone(klass=ValuesListQuerySet, setup=True,
+                flat=False, named=False, _fields=fields)
+        names, convert = queryset._get_row_converter()
+        builders = [columns.ColumnBuilder(columns.get_typecode(field))
+                    for field in queryset._get_value_fields(names)]
+        if not isinstance(self, EmptyQuerySet):
+            results = queryset.query.get_compiler(queryset.db).results_iter(chunk_size)
+            while True:
+                rows = itertools.islice(results, chunk_size)
+                if convert is not tuple:
+                    rows = map(convert, rows)
+                rows = list(rows)
+                if not rows:
+                    break
+                for builder, values in zip(builders, zip(*rows)):
+                    builder.extend(values)
+        return SortedDict([(name, builder.get_column(use_numpy))
+                           for name, builder in zip(names, builders)])
+
     def delete(self):
         """
         Deletes the records in the current QuerySet.
@@ -624,13 +670,16 @@ class QuerySet(object):
 
     def values_list(self, *fields, **kwargs):
         flat = kwargs.pop('flat', False)
+        named = kwargs.pop('named', False)
         if kwargs:
             raise TypeError('Unexpected keyword arguments to values_list: %s'
                     % (list(kwargs),))
         if flat and len(fields) > 1:
             raise TypeError("'flat' is not valid when values_list is called with more than one field.")
+        if flat and named:
+            raise TypeError("'flat' and 'named' can't be used together.")
         return self._clone(klass=ValuesListQuerySet, setup=True, flat=flat,
-                _fields=fields)
+                named=named, _fields=fields)
 
     def dates(self, field_name, kind, order='ASC'):
         """
@@ -1015,8 +1064,12 @@ class ValuesQuerySet(QuerySet):
 
         names = extra_names + field_names + aggregate_names
 
+        # The columns are already in the order of the names, so unlike
+        # values_list() there's nothing to precompute. Pairing them lazily
+        # only saves building a list of pairs for each row.
+        zip_ = six.moves.zip
         for row in self.query.get_compiler(self.db).results_iter():
-            yield dict(zip(names, row))
+            yield dict(zip_(names, row))
 
     def delete(self):
         # values().delete() doesn't work currently - make sure it raises an
@@ -1136,38 +1189,74 @@ class ValuesQuerySet(QuerySet):
 
 class ValuesListQuerySet(ValuesQuerySet):
     def iterator(self):
+        results = self.query.get_compiler(self.db).results_iter()
         if self.flat and len(self._fields) == 1:
-            for row in self.query.get_compiler(self.db).results_iter():
+            for row in results:
                 yield row[0]
-        elif not self.query.extra_select and not self.query.aggregate_select:
-            for row in self.query.get_compiler(self.db).results_iter():
-                yield tuple(row)
+            return
+
+        names, convert = self._get_row_converter()
+        if self.named:
+            row_class = create_namedtuple_class(*names)
+            new = tuple.__new__
+            for row in results:
+                yield new(row_class, convert(row))
         else:
-            # When extra(select=...) or an annotation is involved, the extra
-            # cols are always at the start of the row, and we need to reorder
-            # the fields to match the order in self._fields.
-            extra_names = list(self.query.extra_select)
-            field_names = self.field_names
-            aggregate_names = list(self.query.aggregate_select)
-
-            names = extra_names + field_names + aggregate_names
-
-            # If a field list has been specified, use it. Otherwise, use the
-            # full list of fields, including extras and aggregates.
-            if self._fields:
-                fields = list(self._fields) + [f for f in aggregate_names if f not in self._fields]
-            else:
-                fields = names
+            for row in results:
+                yield convert(row)
+
+    def _get_row_converter(self):
+        """
+        Returns the names of the values of each result, and a function
+        turning a row of the query into a tuple of these values.
+        """
+        if not self.query.extra_select and not self.query.aggregate_select:
+            return self.field_names, tuple
+
+        # When extra(select=...) or an annotation is involved, the extra
+        # cols are always at the start of the row, and we need to reorder
+        # the fields to match the order in self._fields.
+        extra_names = list(self.query.extra_select)
+        field_names = self.field_names
+        aggregate_names = list(self.query.aggregate_select)
+
+        names = extra_names + field_names + aggregate_names
 
-            for row in self.query.get_compiler(self.db).results_iter():
-                data = dict(zip(names, row))
-                yield tuple([data[f] for f in fields])
+        # If a field list has been specified, use it. Otherwise, use the
+        # full list of fields, including extras and aggregates.
+        if self._fields:
+            fields = list(self._fields) + [f for f in aggregate_names if f not in self._fields]
+        else:
+            fields = names
+
+        # The position of each value in the row, computed once rather than
+        # looking the values up by name in each row.
+        positions = dict((name, i) for i, name in enumerate(names))
+        indexes = [positions[f] for f in fields]
+        if indexes == list(range(len(names))):
+            return fields, tuple
+        if len(indexes) == 1:
+            index = indexes[0]
+            return fields, lambda row: (row[index],)
+        return fields, itemgetter(*indexes)
+
+    def _get_value_fields(self, names):
+        """
+        Returns the field of each of the given names of values, the source
+        field for annotations, or None for extra selects.
+        """
+        fields = dict(zip(self.field_names, self.query.select_fields))
+        aggregates = self.query.aggregate_select
+        return [aggregates[name].field if name in aggregates else fields.get(name)
+                for name in names]
 
     def _clone(self, *args, **kwargs):
         clone = super(ValuesListQuerySet, self)._clone(*args, **kwargs)
         if not hasattr(clone, "flat"):
             # Only assign flat if the clone didn't already get it from kwargs
             clone.flat = self.flat
+        if not hasattr(clone, "named"):
+            clone.named = getattr(self, "named", False)
         return clone
 
 
@@ -1328,6 +1417,26 @@ class EmptyQuerySet(QuerySet):
     # situations).
     value_annotation = False
 
+_namedtuple_classes = {}
+
+def create_namedtuple_class(*names):
+    """
+    Returns a namedtuple class with the given field names, created once for
+    each list of names.
+    """
+    try:
+        return _namedtuple_classes[names]
+    except KeyError:
+        pass
+    try:
+        # Names that aren't valid identifiers are replaced by _0, _1, etc.
+        row_class = namedtuple(str('Row'), [str(name) for name in names], rename=True)
+    except TypeError:
+        # Python 2.6 doesn't support rename.
+        row_class = namedtuple(str('Row'), [str(name) for name in names])
+    _namedtuple_classes[names] = row_class
+    return row_class
+
 def get_klass_info(klass, max_depth=0, cur_depth=0, requested=None,
                    only_load=None, local_only=False):
     """
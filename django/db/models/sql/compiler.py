@@ -760,19 +760,24 @@ class SQLCompiler(object):
         self.query.deferred_to_data(columns, self.query.deferred_to_columns_cb)
         return columns
 
-    def results_iter(self):
+    def results_iter(self, chunk_size=GET_ITERATOR_CHUNK_SIZE):
         """
-        Returns an iterator over the results from executing this query.
+        Returns an iterator over the results from executing this query,
+        fetched chunk_size rows at a time.
         """
         resolve_columns = hasattr(self, 'resolve_columns')
         fields = None
         has_aggregate_select = bool(self.query.aggregate_select)
+        if has_aggregate_select:
+            aggregates = list(self.query.aggregate_select.values())
+            resolve_aggregate = self.query.resolve_aggregate
+            aggregate_start = None
         # Set transaction dirty if we're using SELECT FOR UPDATE to ensure
         # a subsequent commit/rollback is executed, so any database locks
         # are released.
         if self.query.select_for_update and transaction.is_managed(self.using):
             transaction.set_dirty(self.using)
-        for rows in self.execute_sql(MULTI):
+        for rows in self.execute_sql(MULTI, chunk_size):
             for row in rows:
                 if resolve_columns:
                     if fields is None:
@@ -803,28 +808,30 @@ class SQLCompiler(object):
                     row = self.resolve_columns(row, fields)
 
                 if has_aggregate_select:
-                    aggregate_start = len(self.query.extra_select) + len(self.query.select)
-                    aggregate_end = aggregate_start + len(self.query.aggregate_select)
+                    if aggregate_start is None:
+                        aggregate_start = len(self.query.extra_select) + len(self.query.select)
+                        aggregate_end = aggregate_start + len(aggregates)
                     row = tuple(row[:aggregate_start]) + tuple([
-                        self.query.resolve_aggregate(value, aggregate, self.connection)
-                        for (alias, aggregate), value
-                        in zip(self.query.aggregate_select.items(), row[aggregate_start:aggregate_end])
+                        resolve_aggregate(value, aggregate, self.connection)
+                        for aggregate, value
+                        in zip(aggregates, row[aggregate_start:aggregate_end])
                     ]) + tuple(row[aggregate_end:])
 
                 yield row
 
-    def execute_sql(self, result_type=MULTI):
+    def execute_sql(self, result_type=MULTI, chunk_size=GET_ITERATOR_CHUNK_SIZE):
         """
         Run the query against the database and returns the result(s). The
         return value is a single data item if result_type is SINGLE, or an
         iterator over the results if the result_type is MULTI.
 
-        result_type is either MULTI (use fetchmany() to retrieve all rows),
-        SINGLE (only retrieve a single row), or None. In this last case, the
-        cursor is returned if any query is executed, since it's used by
-        subclasses such as InsertQuery). It's possible, however, that no query
-        is needed, as the filters describe an empty set. In that case, None is
-        returned, to avoid any unnecessary database interaction.
+        result_type is either MULTI (use fetchmany() to retrieve all rows,
+        chunk_size at a time), SINGLE (only retrieve a single row), or None.
+        In this last case, the cursor is returned if any query is executed,
+        since it's used by subclasses such as InsertQuery). It's possible,
+        however, that no query is needed, as the filters describe an empty
+        set. In that case, None is returned, to avoid any unnecessary database
+        interaction.
         """
         try:
             sql, params = self.as_sql()
@@ -849,9 +856,9 @@ class SQLCompiler(object):
         # The MULTI case.
         if self.query.ordering_aliases:
             result = order_modified_iter(cursor, len(self.query.ordering_aliases),
-                    self.connection.features.empty_fetchmany_value)
+                    self.connection.features.empty_fetchmany_value, chunk_size)
         else:
-            result = iter((lambda: cursor.fetchmany(GET_ITERATOR_CHUNK_SIZE)),
+            result = iter((lambda: cursor.fetchmany(chunk_size)),
                     self.connection.features.empty_fetchmany_value)
         if not self.connection.features.can_use_chunked_reads:
             # If we are using non-chunked reads, we return the same data
@@ -1115,13 +1122,12 @@ class SQLDateCompiler(SQLCompiler):
                 yield date
 
 
-def order_modified_iter(cursor, trim, sentinel):
+def order_modified_iter(cursor, trim, sentinel, chunk_size=GET_ITERATOR_CHUNK_SIZE):
     """
     Yields blocks of rows from a cursor. We use this iterator in the special
     case when extra output columns have been added to support ordering
     requirements. We must trim those extra columns before anything else can use
     the results, since they're only needed to make the SQL valid.
     """
-    for rows in iter((lambda: cursor.fetchmany(GET_ITERATOR_CHUNK_SIZE)),
-            sentinel):
+    for rows in iter((lambda: cursor.fetchmany(chunk_size)), sentinel):
         yield [r[:-trim] for r in rows]
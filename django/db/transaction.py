@@ -160,6 +160,17 @@ def rollback(using=None):
     connection = connections[using]
     connection.rollback()
 
+def on_commit(func, using=None):
+    """
+    Registers a function to be called without arguments once the current
+    transaction is committed. It's discarded if the transaction is rolled back,
+    and called right away if transactions aren't managed.
+    """
+    if using is None:
+        using = DEFAULT_DB_ALIAS
+    connection = connections[using]
+    connection.on_commit(func)
+
 def savepoint(using=None):
     """
     Creates a savepoint (if supported and required by the backend) inside the
@@ -1,5 +1,6 @@
 import weakref
 import threading
+from functools import partial
 
 from django.dispatch import saferef
 from django.utils.six.moves import xrange
@@ -10,6 +11,10 @@ def _make_id(target):
     if hasattr(target, '__func__'):
         return (id(target.__self__), id(target.__func__))
     return id(target)
+NONE_ID = _make_id(None)
+
+# A marker for caching
+NO_RECEIVERS = object()
 
 class Signal(object):
     """
@@ -19,22 +24,43 @@ class Signal(object):
 
         receivers
             { receriverkey (id) : weakref(receiver) }
+
+        background_receivers
+            set of the receiverkeys of receivers run by the executor
     """
 
-    def __init__(self, providing_args=None):
+    def __init__(self, providing_args=None, use_caching=False):
         """
         Create a new signal.
 
         providing_args
             A list of the arguments this signal can pass along in a send() call.
+
+        use_caching
+            Whether to cache the receivers of each sender. Senders must be
+            weak-referencable (e.g. classes) when this is enabled.
         """
         self.receivers = []
+        self.background_receivers = set()
         if providing_args is None:
             providing_args = []
         self.providing_args = set(providing_args)
         self.lock = threading.Lock()
-
-    def connect(self, receiver, sender=None, weak=True, dispatch_uid=None):
+        self.use_caching = use_caching
+        # For convenience we create empty caches even if they are not used.
+        # If use_caching is enabled, the receivers of each distinct sender
+        # are cached in 'sender_receivers_cache' by send(), or NO_RECEIVERS
+        # if there aren't any. The cache is cleared when receivers are
+        # connected, disconnected or garbage collected.
+        self.sender_receivers_cache = weakref.WeakKeyDictionary() if use_caching else {}
+        # Set by _remove_receiver() when a weakly referenced receiver dies.
+        # The dead receivers are then removed the next time the lock is
+        # taken: the garbage collector may call _remove_receiver() while
+        # this thread holds the lock already.
+        self._dead_receivers = False
+
+    def connect(self, receiver, sender=None, weak=True, dispatch_uid=None,
+                background=False):
         """
         Connect receiver to sender for signal.
 
@@ -68,6 +94,12 @@ class Signal(object):
                 An identifier used to uniquely identify a particular instance of
                 a receiver. This will usually be a string, though it may be
                 anything hashable.
+
+            background
+                Whether to hand calls to the receiver to the executor set by
+                the SIGNAL_EXECUTOR setting instead of running them during
+                send(). Calls sent within a managed transaction are only
+                handed over once it is committed.
         """
         from django.conf import settings
 
@@ -101,11 +133,15 @@ class Signal(object):
             receiver = saferef.safeRef(receiver, onDelete=self._remove_receiver)
 
         with self.lock:
+            self._clear_dead_receivers()
             for r_key, _ in self.receivers:
                 if r_key == lookup_key:
                     break
             else:
                 self.receivers.append((lookup_key, receiver))
+                if background:
+                    self.background_receivers.add(lookup_key)
+            self.sender_receivers_cache.clear()
 
     def disconnect(self, receiver=None, sender=None, weak=True, dispatch_uid=None):
         """
@@ -135,14 +171,19 @@ class Signal(object):
             lookup_key = (_make_id(receiver), _make_id(sender))
 
         with self.lock:
+            self._clear_dead_receivers()
             for index in xrange(len(self.receivers)):
                 (r_key, _) = self.receivers[index]
                 if r_key == lookup_key:
                     del self.receivers[index]
                     break
+            self.background_receivers.discard(lookup_key)
+            self.sender_receivers_cache.clear()
 
     def has_listeners(self, sender=None):
-        return bool(self._live_receivers(_make_id(sender)))
+        if self._cached_receivers(sender) is NO_RECEIVERS:
+            return False
+        return bool(self._live_receivers(sender))
 
     def send(self, sender, **named):
         """
@@ -152,6 +193,10 @@ class Signal(object):
         terminating the dispatch loop, so it is quite possible to not have all
         receivers called if a raises an error.
 
+        Receivers connected with background=True aren't called by send(),
+        their response is a PendingResult filled once the executor has run
+        them. Their errors are stored in it rather than raised.
+
         Arguments:
 
             sender
@@ -163,11 +208,14 @@ class Signal(object):
         Returns a list of tuple pairs [(receiver, response), ... ].
         """
         responses = []
-        if not self.receivers:
+        if not self.receivers or self._cached_receivers(sender) is NO_RECEIVERS:
             return responses
 
-        for receiver in self._live_receivers(_make_id(sender)):
-            response = receiver(signal=self, sender=sender, **named)
+        for receiver, background in self._live_receivers(sender):
+            if background:
+                response = self._send_background(receiver, sender, named)
+            else:
+                response = receiver(signal=self, sender=sender, **named)
             responses.append((receiver, response))
         return responses
 
@@ -195,12 +243,15 @@ class Signal(object):
         receiver.
         """
         responses = []
-        if not self.receivers:
+        if not self.receivers or self._cached_receivers(sender) is NO_RECEIVERS:
             return responses
 
         # Call each receiver with whatever arguments it can accept.
         # Return a list of tuple pairs [(receiver, response), ... ].
-        for receiver in self._live_receivers(_make_id(sender)):
+        for receiver, background in self._live_receivers(sender):
+            if background:
+                responses.append((receiver, self._send_background(receiver, sender, named)))
+                continue
             try:
                 response = receiver(signal=self, sender=sender, **named)
             except Exception as err:
@@ -209,44 +260,99 @@ class Signal(object):
                 responses.append((receiver, response))
         return responses
 
-    def _live_receivers(self, senderkey):
+    def _send_background(self, receiver, sender, named):
+        """
+        Hands the call to receiver to the executor, once the transaction of
+        the database the signal is about is committed. Returns its
+        PendingResult.
+        """
+        from django.db import connections, DEFAULT_DB_ALIAS
+        from django.dispatch.executors import PendingResult, get_executor
+
+        executor = get_executor()
+        call = partial(receiver, signal=self, sender=sender, **named)
+        using = named.get('using') or DEFAULT_DB_ALIAS
+        if not executor.defer_until_commit or using not in connections.databases:
+            return executor.submit(call)
+        result = PendingResult()
+        connections[using].on_commit(partial(executor.submit, call, result))
+        return result
+
+    def _cached_receivers(self, sender):
+        """
+        Returns the cached receivers of sender, NO_RECEIVERS, or None if they
+        aren't cached.
+        """
+        if self.use_caching:
+            try:
+                return self.sender_receivers_cache.get(sender)
+            except TypeError:
+                # The sender can't be weakly referenced.
+                pass
+        return None
+
+    def _live_receivers(self, sender):
         """
         Filter sequence of receivers to get resolved, live receivers.
 
         This checks for weak references and resolves them, then returning only
-        live receivers.
+        live receivers, as (receiver, background) pairs.
         """
-        none_senderkey = _make_id(None)
-        receivers = []
-
-        for (receiverkey, r_senderkey), receiver in self.receivers:
-            if r_senderkey == none_senderkey or r_senderkey == senderkey:
-                if isinstance(receiver, WEAKREF_TYPES):
-                    # Dereference the weak reference.
-                    receiver = receiver()
-                    if receiver is not None:
-                        receivers.append(receiver)
-                else:
-                    receivers.append(receiver)
-        return receivers
+        receivers = self._cached_receivers(sender)
+        if receivers is NO_RECEIVERS:
+            # We could end up here with NO_RECEIVERS even if we do check this
+            # case in .send() prior to calling _live_receivers() due to a
+            # concurrent .send() call.
+            return []
+        if receivers is None:
+            with self.lock:
+                self._clear_dead_receivers()
+                senderkey = _make_id(sender)
+                receivers = []
+                for lookup_key, receiver in self.receivers:
+                    if lookup_key[1] == NONE_ID or lookup_key[1] == senderkey:
+                        receivers.append((receiver, lookup_key in self.background_receivers))
+                if self.use_caching:
+                    # Note, we must cache the weakref versions.
+                    try:
+                        self.sender_receivers_cache[sender] = receivers or NO_RECEIVERS
+                    except TypeError:
+                        # The sender can't be weakly referenced.
+                        pass
+        non_weak_receivers = []
+        for receiver, background in receivers:
+            if isinstance(receiver, WEAKREF_TYPES):
+                # Dereference the weak reference.
+                receiver = receiver()
+                if receiver is not None:
+                    non_weak_receivers.append((receiver, background))
+            else:
+                non_weak_receivers.append((receiver, background))
+        return non_weak_receivers
 
-    def _remove_receiver(self, receiver):
+    def _clear_dead_receivers(self):
         """
-        Remove dead receivers from connections.
+        Remove dead receivers from connections. Must be called with the lock
+        held.
         """
+        if self._dead_receivers:
+            self._dead_receivers = False
+            receivers = []
+            for key, receiver in self.receivers:
+                if isinstance(receiver, WEAKREF_TYPES) and receiver() is None:
+                    self.background_receivers.discard(key)
+                else:
+                    receivers.append((key, receiver))
+            self.receivers = receivers
+            self.sender_receivers_cache.clear()
 
-        with self.lock:
-            to_remove = []
-            for key, connected_receiver in self.receivers:
-                if connected_receiver == receiver:
-                    to_remove.append(key)
-            for key in to_remove:
-                last_idx = len(self.receivers) - 1
-                # enumerate in reverse order so that indexes are valid even
-                # after we delete some items
-                for idx, (r_key, _) in enumerate(reversed(self.receivers)):
-                    if r_key == key:
-                        del self.receivers[last_idx-idx]
+    def _remove_receiver(self, receiver=None):
+        """
+        Mark that a receiver was garbage collected.
+        """
+        # Taking the lock here could deadlock: this is called by the garbage
+        # collector, possibly in a thread holding the lock already.
+        self._dead_receivers = True
 
 
 def receiver(signal, **kwargs):
@@ -0,0 +1,226 @@
+"""
+Executors running the signal receivers connected with ``background=True``.
+
+The executor is chosen with the SIGNAL_EXECUTOR setting and created with the
+keyword arguments of the SIGNAL_EXECUTOR_OPTIONS setting.
+"""
+from __future__ import unicode_literals
+
+import logging
+import sys
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_by_path
+from django.utils.six.moves import queue
+
+logger = logging.getLogger('django.dispatch')
+
+
+class ResultTimeout(Exception):
+    """
+    The result of a background call wasn't ready in time.
+    """
+    pass
+
+
+class PendingResult(object):
+    """
+    The result of a call handed to an executor.
+
+    Once the call has run, ``value`` holds what it returned, or ``exception``
+    the error it raised.
+    """
+    def __init__(self):
+        self.value = None
+        self.exception = None
+        self._event = threading.Event()
+
+    def __repr__(self):
+        if not self.ready():
+            state = 'pending'
+        elif self.exception is not None:
+            state = 'failed: %r' % self.exception
+        else:
+            state = 'done: %r' % self.value
+        return str('<PendingResult %s>' % state)
+
+    def ready(self):
+        return self._event.is_set()
+
+    def successful(self):
+        """
+        Returns whether the call returned without raising an error. Raises
+        ValueError if it hasn't run yet.
+        """
+        if not self.ready():
+            raise ValueError("The call hasn't run yet.")
+        return self.exception is None
+
+    def wait(self, timeout=None):
+        """
+        Waits until the call has run, for at most timeout seconds.
+        """
+        self._event.wait(timeout)
+
+    def get(self, timeout=None):
+        """
+        Waits for the call to run and returns its value, or raises its error.
+        Raises ResultTimeout if it hasn't run after timeout seconds.
+        """
+        self.wait(timeout)
+        if not self.ready():
+            raise ResultTimeout("The call hasn't run after %s seconds." % timeout)
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def set_value(self, value):
+        self.value = value
+        self._event.set()
+
+    def set_exception(self, exception):
+        self.exception = exception
+        self._event.set()
+
+
+def run_call(func, result):
+    """
+    Calls func and stores its outcome in result. Errors are logged to the
+    'django.dispatch' logger rather than raised.
+    """
+    try:
+        value = func()
+    except Exception as e:
+        logger.error('Error in background call to %r: %s', func, e,
+            exc_info=sys.exc_info())
+        result.set_exception(e)
+    else:
+        result.set_value(value)
+
+
+class BaseExecutor(object):
+    # Whether calls sent within a managed transaction wait for it to be
+    # committed before being submitted.
+    defer_until_commit = True
+
+    def __init__(self, **options):
+        pass
+
+    def submit(self, func, result=None):
+        """
+        Schedules func to be called without arguments. Returns a
+        PendingResult, or fills the one given.
+        """
+        raise NotImplementedError
+
+    def join(self):
+        """
+        Blocks until all the submitted calls have run.
+        """
+        pass
+
+    def shutdown(self, wait=True):
+        """
+        Stops the executor once the submitted calls have run. If wait is
+        False, doesn't wait for them.
+        """
+        pass
+
+
+class SynchronousExecutor(BaseExecutor):
+    """
+    Runs calls right away in the current thread, without waiting for the
+    transaction to be committed. Meant for tests, where the transaction of
+    each test is never committed.
+    """
+    defer_until_commit = False
+
+    def submit(self, func, result=None):
+        if result is None:
+            result = PendingResult()
+        run_call(func, result)
+        return result
+
+
+class ThreadExecutor(BaseExecutor):
+    """
+    Runs calls in a pool of ``workers`` daemon threads, started on demand.
+
+    At most ``queue_size`` calls wait for a worker; submitting more blocks
+    until one is free, so that senders are slowed down rather than letting
+    the backlog grow without bounds.
+    """
+    def __init__(self, workers=4, queue_size=1000, **options):
+        self.workers = workers
+        self.queue = queue.Queue(queue_size)
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def submit(self, func, result=None):
+        if result is None:
+            result = PendingResult()
+        if len(self.threads) < self.workers:
+            self._start_workers()
+        self.queue.put((func, result))
+        return result
+
+    def _start_workers(self):
+        with self.lock:
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+
+    def _work(self):
+        from django.db import connections
+
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    break
+                run_call(*item)
+                # Workers outlive the calls, their connections mustn't.
+                for conn in connections.all():
+                    conn.close()
+            finally:
+                self.queue.task_done()
+
+    def join(self):
+        self.queue.join()
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            threads, self.threads = self.threads, []
+        for thread in threads:
+            self.queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+_executor = None
+_executor_settings = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """
+    Returns the executor configured by the SIGNAL_EXECUTOR and
+    SIGNAL_EXECUTOR_OPTIONS settings. A new one replaces the previous one
+    when they change.
+    """
+    global _executor, _executor_settings
+    current = (settings.SIGNAL_EXECUTOR, settings.SIGNAL_EXECUTOR_OPTIONS)
+    if _executor_settings != current:
+        with _executor_lock:
+            if _executor_settings != current:
+                previous = _executor
+                executor_class = import_by_path(current[0],
+                    error_prefix="Error importing SIGNAL_EXECUTOR: ")
+                _executor = executor_class(**current[1])
+                _executor_settings = (current[0], dict(current[1]))
+                if previous is not None:
+                    previous.shutdown(wait=False)
+    return _executor
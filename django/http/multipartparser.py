@@ -8,6 +8,8 @@ from __future__ import unicode_literals
 
 import base64
 import cgi
+import re
+from collections import deque
 
 from django.conf import settings
 from django.core.exceptions import SuspiciousOperation
@@ -269,6 +271,10 @@ class LazyStream(six.Iterator):
     Given a producer object (an iterator that yields bytestrings), the
     LazyStream object will support iteration, reading, and keeping a "look-back"
     variable in case you need to "unget" some bytes.
+
+    Bytes placed back onto the stream are kept as windows over the chunks
+    they come from, so that reading a few bytes off a large chunk doesn't
+    copy the rest of it.
     """
     def __init__(self, producer, length=None):
         """
@@ -279,18 +285,20 @@ class LazyStream(six.Iterator):
         """
         self._producer = producer
         self._empty = False
-        self._leftover = b''
+        # (bytes, start) windows placed back onto the stream, the next one to
+        # be read last.
+        self._leftover = []
         self.length = length
         self.position = 0
         self._remaining = length
-        self._unget_history = []
+        self._unget_history = deque(maxlen=50)
 
     def tell(self):
         return self.position
 
     def read(self, size=None):
         def parts():
-            remaining = (size is not None and [size] or [self._remaining])[0]
+            remaining = self._remaining if size is None else size
             # do the whole thing in one shot if no limit was provided.
             if remaining is None:
                 yield b''.join(self)
@@ -302,16 +310,33 @@ class LazyStream(six.Iterator):
             while remaining != 0:
                 assert remaining > 0, 'remaining bytes to read should never go negative'
 
-                chunk = next(self)
+                try:
+                    chunk, start = self.next_window()
+                except StopIteration:
+                    return
 
-                emitting = chunk[:remaining]
-                self.unget(chunk[remaining:])
+                end = start + remaining
+                emitting = chunk[start:end]
+                self.unget_window(chunk, end)
                 remaining -= len(emitting)
                 yield emitting
 
         out = b''.join(parts())
         return out
 
+    def next_window(self):
+        """
+        Returns the next bytes of the stream as a ``(chunk, start)`` tuple,
+        the bytes being ``chunk[start:]``, without copying them.
+        """
+        if self._leftover:
+            chunk, start = self._leftover.pop()
+        else:
+            chunk, start = next(self._producer), 0
+            self._unget_history.clear()
+        self.position += len(chunk) - start
+        return chunk, start
+
     def __next__(self):
         """
         Used when the exact number of bytes to read is unimportant.
@@ -320,14 +345,8 @@ class LazyStream(six.Iterator):
         from the iterator instead. Useful to avoid unnecessary bookkeeping if
         performance is an issue.
         """
-        if self._leftover:
-            output = self._leftover
-            self._leftover = b''
-        else:
-            output = next(self._producer)
-            self._unget_history = []
-        self.position += len(output)
-        return output
+        chunk, start = self.next_window()
+        return chunk[start:] if start else chunk
 
     def close(self):
         """
@@ -348,11 +367,19 @@ class LazyStream(six.Iterator):
         Future calls to read() will return those bytes first. The
         stream position and thus tell() will be rewound.
         """
-        if not bytes:
+        self.unget_window(bytes, 0)
+
+    def unget_window(self, chunk, start):
+        """
+        Places ``chunk[start:]`` back onto the front of the lazy stream,
+        without copying it.
+        """
+        num_bytes = len(chunk) - start
+        if num_bytes <= 0:
             return
-        self._update_unget_history(len(bytes))
-        self.position -= len(bytes)
-        self._leftover = b''.join([bytes, self._leftover])
+        self._update_unget_history(num_bytes)
+        self.position -= num_bytes
+        self._leftover.append((chunk, start))
 
     def _update_unget_history(self, num_bytes):
         """
@@ -362,11 +389,8 @@ class LazyStream(six.Iterator):
         infinite loop of some sort. This is usually caused by a
         maliciously-malformed MIME request.
         """
-        self._unget_history = [num_bytes] + self._unget_history[:49]
-        number_equal = len([current_number for current_number in self._unget_history
-                            if current_number == num_bytes])
-
-        if number_equal > 40:
+        self._unget_history.appendleft(num_bytes)
+        if list(self._unget_history).count(num_bytes) > 40:
             raise SuspiciousOperation(
                 "The multipart parser got stuck, which shouldn't happen with"
                 " normal uploaded files. Check for malicious upload activity;"
@@ -403,13 +427,15 @@ class InterBoundaryIter(six.Iterator):
     def __init__(self, stream, boundary):
         self._stream = stream
         self._boundary = boundary
+        self._partial_boundary = compile_partial_boundary(boundary)
 
     def __iter__(self):
         return self
 
     def __next__(self):
         try:
-            return LazyStream(BoundaryIter(self._stream, self._boundary))
+            return LazyStream(BoundaryIter(self._stream, self._boundary,
+                                           self._partial_boundary))
         except InputStreamExhausted:
             raise StopIteration()
 
@@ -421,29 +447,29 @@ class BoundaryIter(six.Iterator):
     before the boundary, throw away the boundary bytes themselves, and push the
     post-boundary bytes back on the stream.
 
+    The chunks of the underlying stream are searched with ``bytes.find`` and
+    yielded whole, unless they end with what may be the start of a boundary,
+    in which case only those few bytes are held back.
+
     The future calls to next() after locating the boundary will raise a
     StopIteration exception.
     """
 
-    def __init__(self, stream, boundary):
+    def __init__(self, stream, boundary, partial_boundary=None):
         self._stream = stream
         self._boundary = boundary
         self._done = False
         # rollback an additional six bytes because the format is like
         # this: CRLF<boundary>[--CRLF]
         self._rollback = len(boundary) + 6
+        if partial_boundary is None:
+            partial_boundary = compile_partial_boundary(boundary)
+        self._partial_boundary = partial_boundary
 
-        # Try to use mx fast string search if available. Otherwise
-        # use Python find. Wrap the latter for consistency.
         unused_char = self._stream.read(1)
         if not unused_char:
             raise InputStreamExhausted()
         self._stream.unget(unused_char)
-        try:
-            from mx.TextTools import FS
-            self._fs = FS(boundary).find
-        except ImportError:
-            self._fs = lambda data: data.find(boundary)
 
     def __iter__(self):
         return self
@@ -455,43 +481,51 @@ class BoundaryIter(six.Iterator):
         stream = self._stream
         rollback = self._rollback
 
+        # Make sure there's enough data to hold a whole boundary. This only
+        # joins chunks after a few bytes were held back, or when the producer
+        # yields tiny chunks.
         bytes_read = 0
-        chunks = []
-        for bytes in stream:
-            bytes_read += len(bytes)
-            chunks.append(bytes)
-            if bytes_read > rollback:
-                break
-            if not bytes:
+        windows = []
+        eof = False
+        while bytes_read <= rollback:
+            try:
+                chunk, start = stream.next_window()
+            except StopIteration:
+                eof = True
                 break
-        else:
-            self._done = True
+            bytes_read += len(chunk) - start
+            windows.append((chunk, start))
 
-        if not chunks:
+        if not windows:
+            self._done = True
             raise StopIteration()
 
-        chunk = b''.join(chunks)
-        boundary = self._find_boundary(chunk, len(chunk) < self._rollback)
+        if len(windows) == 1:
+            chunk, start = windows[0]
+        else:
+            chunk, start = b''.join([c[s:] for c, s in windows]), 0
+        boundary = self._find_boundary(chunk, start)
 
         if boundary:
-            end, next = boundary
-            stream.unget(chunk[next:])
+            end, next_start = boundary
+            stream.unget_window(chunk, next_start)
+            self._done = True
+            return chunk[start:end]
+        elif eof:
+            # There's nothing left, we should just return and mark as done.
             self._done = True
-            return chunk[:end]
+            return chunk[start:]
         else:
             # make sure we dont treat a partial boundary (and
-            # its separators) as data
-            if not chunk[:-rollback]:# and len(chunk) >= (len(self._boundary) + 6):
-                # There's nothing left, we should just return and mark as done.
-                self._done = True
-                return chunk
-            else:
-                stream.unget(chunk[-rollback:])
-                return chunk[:-rollback]
-
-    def _find_boundary(self, data, eof = False):
+            # its separators) as data. Since no whole boundary was found,
+            # at least one byte is always returned.
+            keep = self._partial_boundary.search(chunk, len(chunk) - rollback).start()
+            stream.unget_window(chunk, keep)
+            return chunk[start:keep]
+
+    def _find_boundary(self, data, start=0):
         """
-        Finds a multipart boundary in data.
+        Finds a multipart boundary in data, from the index start on.
 
         Should no boundry exist in the data None is returned instead. Otherwise
         a tuple containing the indices of the following are returned:
@@ -499,21 +533,31 @@ class BoundaryIter(six.Iterator):
          * the end of current encapsulation
          * the start of the next encapsulation
         """
-        index = self._fs(data)
+        index = data.find(self._boundary, start)
         if index < 0:
             return None
         else:
             end = index
             next = index + len(self._boundary)
             # backup over CRLF
-            last = max(0, end-1)
+            last = max(start, end-1)
             if data[last:last+1] == b'\n':
                 end -= 1
-            last = max(0, end-1)
+            last = max(start, end-1)
             if data[last:last+1] == b'\r':
                 end -= 1
             return end, next
 
+def compile_partial_boundary(boundary):
+    """
+    Returns a compiled regular expression that matches, at the end of some
+    data, the beginning of ``boundary`` and the line break preceding it.
+    """
+    pattern = b''
+    for i in reversed(range(len(boundary))):
+        pattern = re.escape(boundary[i:i+1]) + b'(?:' + pattern + b')?'
+    return re.compile(b'\r?\n?(?:' + pattern + b')?\\Z')
+
 def exhaust(stream_or_iterable):
     """
     Completely exhausts an iterator or stream.
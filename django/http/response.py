@@ -1,6 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
 import datetime
+import os
 import time
 import warnings
 from email.header import Header
@@ -16,7 +17,7 @@ from django.core.exceptions import SuspiciousOperation
 from django.http.cookie import SimpleCookie
 from django.utils import six, timezone
 from django.utils.encoding import force_bytes, iri_to_uri
-from django.utils.http import cookie_date
+from django.utils.http import cookie_date, parse_range_header
 from django.utils.six.moves import map
 
 
@@ -352,6 +353,90 @@ class StreamingHttpResponse(HttpResponseBase):
             self._closable_objects.append(value)
 
 
+class FileResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response class optimized for files.
+
+    The file is handed to the ``wsgi.file_wrapper`` of the WSGI server when
+    there is one, so that it can be sent by efficient platform-specific
+    means, and is read in chunks of ``block_size`` bytes otherwise.
+    """
+    block_size = 4096
+
+    @property
+    def streaming_content(self):
+        return super(FileResponse, self).streaming_content
+
+    @streaming_content.setter
+    def streaming_content(self, value):
+        if hasattr(value, 'read'):
+            self.file_to_stream = filelike = value
+            if hasattr(filelike, 'close'):
+                self._closable_objects.append(filelike)
+            value = iter(lambda: filelike.read(self.block_size), b'')
+        else:
+            # The content no longer is the plain content of the file, for
+            # instance because a middleware wrapped it.
+            self.file_to_stream = None
+        StreamingHttpResponse.streaming_content.fset(self, value)
+
+    def _get_file_size(self):
+        try:
+            return os.fstat(self.file_to_stream.fileno()).st_size
+        except (AttributeError, EnvironmentError, ValueError):
+            pass
+        if self.has_header('Content-Length'):
+            return int(self['Content-Length'])
+        return None
+
+    def _read_range(self, filelike, length):
+        while length > 0:
+            data = filelike.read(min(self.block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+    def set_range(self, request):
+        """
+        Restricts the response to the single byte range requested by the
+        Range header of ``request``, if any, turning it into a 206 Partial
+        Content response, or into a 416 Requested Range Not Satisfiable one
+        if the range lies beyond the end of the file.
+
+        The file must be seekable and positioned at its beginning.
+        """
+        self['Accept-Ranges'] = 'bytes'
+        header = request.META.get('HTTP_RANGE')
+        filelike = self.file_to_stream
+        if not header or filelike is None or self.status_code != 200:
+            return
+        # Only honor the range if the client's copy is still current.
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if if_range and if_range not in (self.get('ETag'), self.get('Last-Modified')):
+            return
+        size = self._get_file_size()
+        if size is None:
+            return
+        try:
+            byte_range = parse_range_header(header, size)
+        except ValueError:
+            self.status_code = 416
+            self['Content-Range'] = 'bytes */%d' % size
+            self['Content-Length'] = '0'
+            self.streaming_content = []
+            return
+        if byte_range is None:
+            return
+        first, last = byte_range
+        length = last - first + 1
+        filelike.seek(first)
+        self.streaming_content = self._read_range(filelike, length)
+        self.status_code = 206
+        self['Content-Range'] = 'bytes %d-%d/%d' % (first, last, size)
+        self['Content-Length'] = str(length)
+
+
 class CompatibleStreamingHttpResponse(StreamingHttpResponse):
     """
     This class maintains compatibility with middleware that doesn't know how
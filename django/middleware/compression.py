@@ -0,0 +1,229 @@
+import hashlib
+import re
+import threading
+import zlib
+
+from django.utils.cache import patch_vary_headers
+
+re_accept_encoding = re.compile(r'\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*')
+
+
+def parse_accept_encoding(header):
+    """
+    Returns a dictionary mapping the content-codings listed in an
+    Accept-Encoding header to their quality value.
+    """
+    codings = {}
+    for item in header.split(','):
+        match = re_accept_encoding.match(item)
+        if not match or not match.group(1):
+            continue
+        coding, qvalue = match.groups()
+        try:
+            qvalue = float(qvalue) if qvalue is not None else 1.0
+        except ValueError:
+            continue
+        codings[coding.lower()] = qvalue
+    return codings
+
+
+class Codec(object):
+    """
+    A content-coding the CompressionMiddleware can apply to responses.
+
+    Subclasses set ``name`` to the content-coding token used in the
+    Accept-Encoding and Content-Encoding headers, and implement
+    ``compressobj()``.
+    """
+    name = None
+
+    def compressobj(self, level):
+        """
+        Returns an object with ``compress(data)`` and ``flush(mode)`` methods
+        that behave like those of ``zlib.compressobj()``.
+        """
+        raise NotImplementedError
+
+    def compress(self, data, level):
+        compressor = self.compressobj(level)
+        return compressor.compress(data) + compressor.flush()
+
+
+class GZipCodec(Codec):
+    name = 'gzip'
+
+    def compressobj(self, level):
+        # A window size of 16 + MAX_WBITS makes zlib write a gzip header.
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class DeflateCodec(Codec):
+    # The "deflate" content-coding is the zlib format (RFC 2616, 3.5).
+    name = 'deflate'
+
+    def compressobj(self, level):
+        return zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS)
+
+
+def compress_stream(sequence, compressor, flush_size):
+    """
+    Compresses an iterator of bytestrings, only flushing the compressor once
+    at least ``flush_size`` bytes were written since the last flush, so that
+    many small chunks don't each end a compressed block.
+    """
+    pending = 0
+    for item in sequence:
+        data = compressor.compress(item)
+        pending += len(item)
+        if pending >= flush_size:
+            data += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionMiddleware(object):
+    """
+    This middleware compresses responses with the best content-coding the
+    client accepts, according to the quality values of its Accept-Encoding
+    header. It sets the Vary header accordingly, so that caches will base
+    their storage on the Accept-Encoding header.
+
+    The compression level depends on the size and type of the response,
+    streamed responses are flushed to the client in chunks of at least
+    ``stream_flush_size`` bytes, and the compressed content of responses with
+    a strong ETag is kept for reuse.
+
+    The class attributes can be overridden in subclasses.
+    """
+    # Codecs in order of preference when the client accepts several of them
+    # with the same quality.
+    codecs = (GZipCodec(), DeflateCodec())
+    # It's not worth attempting to compress really short responses.
+    min_length = 200
+    # (maximum length, level) pairs, in increasing order of length; None
+    # applies to any length. Small responses are cheap to compress well,
+    # large ones are compressed faster.
+    levels = ((64 * 1024, 9), (1024 * 1024, 6), (None, 4))
+    # (content type prefix, levels) pairs used instead of ``levels`` for the
+    # matching responses. Binary formats gain little from the slower levels.
+    type_levels = (('application/octet-stream', ((None, 1),)),
+                   ('application/pdf', ((None, 1),)),
+                   ('font/', ((None, 1),)))
+    # Level used for streamed responses, whose length isn't known.
+    streaming_level = 6
+    # Content types that are compressed already.
+    incompressible_types = ('image/', 'video/', 'audio/', 'application/zip',
+                            'application/gzip', 'application/x-gzip')
+    # Content types starting with one of incompressible_types that can still
+    # be compressed.
+    compressible_types = ('image/svg+xml',)
+    stream_flush_size = 16 * 1024
+    # Number of compressed responses with a strong ETag kept for reuse; 0
+    # disables the cache.
+    etag_cache_size = 100
+    # Maximum length of the responses kept by ETag.
+    etag_cache_max_length = 1024 * 1024
+
+    def __init__(self):
+        self._etag_cache = {}
+        self._etag_cache_lock = threading.Lock()
+
+    def select_codec(self, request):
+        """
+        Returns the codec to use for the request, or None.
+        """
+        accepted = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        default_qvalue = accepted.get('*', 0)
+        best, best_qvalue = None, 0
+        for codec in self.codecs:
+            qvalue = accepted.get(codec.name, default_qvalue)
+            if qvalue > best_qvalue:
+                best, best_qvalue = codec, qvalue
+        return best
+
+    def get_level(self, length, content_type=''):
+        levels = self.levels
+        for prefix, type_levels in self.type_levels:
+            if content_type.startswith(prefix):
+                levels = type_levels
+                break
+        for max_length, level in levels:
+            if max_length is None or length <= max_length:
+                return level
+        return self.streaming_level
+
+    def is_compressible(self, request, response):
+        ctype = response.get('Content-Type', '').lower()
+        if (ctype.startswith(self.incompressible_types) and
+                not ctype.startswith(self.compressible_types)):
+            return False
+        # MSIE have issues with compressed response of various content types.
+        if "msie" in request.META.get('HTTP_USER_AGENT', '').lower():
+            if not ctype.startswith("text/") or "javascript" in ctype:
+                return False
+        return True
+
+    def compress_content(self, response, codec):
+        content = response.content
+        ctype = response.get('Content-Type', '').lower()
+        level = self.get_level(len(content), ctype)
+        etag = response.get('ETag', '')
+        if (not self.etag_cache_size or not etag or etag.startswith('W/') or
+                len(content) > self.etag_cache_max_length):
+            return codec.compress(content, level)
+        # A strong ETag only marks content likely to be served again: it's
+        # set by the view, and the same value may well be used for other
+        # content on another URL. The content itself is the key.
+        key = (codec.name, level, hashlib.md5(content).hexdigest())
+        try:
+            return self._etag_cache[key]
+        except KeyError:
+            pass
+        compressed = codec.compress(content, level)
+        with self._etag_cache_lock:
+            if len(self._etag_cache) >= self.etag_cache_size:
+                self._etag_cache.clear()
+            self._etag_cache[key] = compressed
+        return compressed
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        # Avoid compressing if we've already got a content-encoding, or if
+        # the response only holds a part of the content.
+        if response.has_header('Content-Encoding') or response.has_header('Content-Range'):
+            return response
+
+        if not self.is_compressible(request, response):
+            return response
+
+        codec = self.select_codec(request)
+        if codec is None:
+            return response
+
+        if response.streaming:
+            # Delete the `Content-Length` header for streaming content, because
+            # we won't know the compressed size until we stream it.
+            response.streaming_content = compress_stream(
+                response.streaming_content,
+                codec.compressobj(self.streaming_level),
+                self.stream_flush_size)
+            del response['Content-Length']
+        else:
+            # Return the compressed content only if it's actually shorter.
+            compressed_content = self.compress_content(response, codec)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response['Content-Length'] = str(len(response.content))
+
+        if response.has_header('ETag'):
+            response['ETag'] = re.sub('"$', ';%s"' % codec.name, response['ETag'])
+        response['Content-Encoding'] = codec.name
+
+        return response
@@ -830,8 +830,10 @@ class NodeList(list):
                 bit = self.render_node(node, context)
             else:
                 bit = node
-            bits.append(force_text(bit))
-        return mark_safe(''.join(bits))
+            bits.append(bit)
+        # Converting to text only once every node has rendered gives includes
+        # rendered in threads the time to run alongside each other.
+        return mark_safe(''.join([force_text(bit) for bit in bits]))
 
     def get_nodes_by_type(self, nodetype):
         "Return a list of all nodes of the given type"
@@ -13,67 +13,184 @@ class ContextPopException(Exception):
     "pop() has been called more times than push()"
     pass
 
+_missing = object()
+
+class ContextDict(dict):
+    """
+    A dict pushed on a context by push(). Changes made to it directly, rather
+    than through the context, also discard the lookups memoized by the
+    context.
+    """
+    def __init__(self, context, *args, **kwargs):
+        super(ContextDict, self).__init__(*args, **kwargs)
+        self.context = context
+
+    def __setitem__(self, key, value):
+        super(ContextDict, self).__setitem__(key, value)
+        self.context._forget(key)
+
+    def __delitem__(self, key):
+        super(ContextDict, self).__delitem__(key)
+        self.context._forget(key)
+
+    def _forgetting(method):
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.context._forget_all()
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    clear = _forgetting(dict.clear)
+    pop = _forgetting(dict.pop)
+    popitem = _forgetting(dict.popitem)
+    setdefault = _forgetting(dict.setdefault)
+    update = _forgetting(dict.update)
+    del _forgetting
+
 class BaseContext(object):
+    """
+    A stack of dictionaries.
+
+    Name lookups are memoized in a flattened view of the stack. The dicts
+    created by push() report their changes, so a memoized name is returned
+    as is when only such dicts are above it. Other dicts may be changed by
+    their owner, so they're checked again before returning a name found in
+    or under them.
+
+    The stack remains available as ``dicts``. Since the caller may then
+    change the stack itself, accessing it stops the memoization.
+    """
     def __init__(self, dict_=None):
         self._reset_dicts(dict_)
 
     def _reset_dicts(self, value=None):
-        builtins = {'True': True, 'False': False, 'None': None}
-        self.dicts = [builtins]
+        self._builtins = {'True': True, 'False': False, 'None': None}
+        self._dicts = [self._builtins]
         if value is not None:
-            self.dicts.append(value)
+            self._dicts.append(value)
+        self._flat = {}
+
+    def _get_dicts(self):
+        self._flat = None
+        return self._dicts
+
+    def _set_dicts(self, value):
+        self._dicts = value
+        self._flat = None
+
+    dicts = property(_get_dicts, _set_dicts)
+
+    def _forget(self, key):
+        if self._flat is not None:
+            self._flat.pop(key, None)
+
+    def _forget_all(self):
+        if self._flat is not None:
+            self._flat = {}
 
     def __copy__(self):
         duplicate = copy(super(BaseContext, self))
-        duplicate.dicts = self.dicts[:]
+        duplicate._dicts = self._dicts[:]
+        if self._flat is not None:
+            duplicate._flat = {}
         return duplicate
 
     def __repr__(self):
-        return repr(self.dicts)
+        return repr(self._dicts)
 
     def __iter__(self):
-        for d in reversed(self.dicts):
+        for d in reversed(self._dicts):
             yield d
 
-    def push(self):
-        d = {}
-        self.dicts.append(d)
+    def push(self, *args, **kwargs):
+        """
+        Pushes a new dict to the stack and returns it. The arguments, if any,
+        are those of dict() and give the initial content of the new dict.
+        """
+        d = ContextDict(self, *args, **kwargs)
+        self._dicts.append(d)
+        for key in d:
+            self._forget(key)
         return d
 
     def pop(self):
-        if len(self.dicts) == 1:
+        if len(self._dicts) == 1:
             raise ContextPopException
-        return self.dicts.pop()
+        d = self._dicts.pop()
+        if self._flat is not None:
+            flat = self._flat
+            for key in d:
+                flat.pop(key, None)
+        return d
 
     def __setitem__(self, key, value):
         "Set a variable in the current context"
-        self.dicts[-1][key] = value
+        d = self._dicts[-1]
+        d[key] = value
+        if type(d) is not ContextDict:
+            self._forget(key)
 
-    def __getitem__(self, key):
-        "Get a variable's value, starting at the current context and going upward"
-        for d in reversed(self.dicts):
+    def _lookup(self, key):
+        # Raises KeyError if the key isn't in any of the dicts.
+        flat = self._flat
+        builtins = self._builtins
+        unreported = []
+        for d in reversed(self._dicts):
+            reported = d is builtins or (type(d) is ContextDict and d.context is self)
             if key in d:
-                return d[key]
+                value = d[key]
+                if flat is not None:
+                    # Keep the dicts that can change the value without the
+                    # context knowing: the unreported ones above it, and the
+                    # one holding it if it's unreported too.
+                    if unreported or not reported:
+                        flat[key] = (value, (unreported, None if reported else d))
+                    else:
+                        flat[key] = (value, None)
+                return value
+            if not reported:
+                unreported.append(d)
         raise KeyError(key)
 
+    def __getitem__(self, key):
+        "Get a variable's value, starting at the current context and going upward"
+        try:
+            value, guard = self._flat[key]
+        except (KeyError, TypeError):
+            return self._lookup(key)
+        if guard is not None:
+            unreported, owner = guard
+            for d in unreported:
+                if key in d:
+                    return self._lookup(key)
+            if owner is not None and owner.get(key, _missing) is not value:
+                return self._lookup(key)
+        return value
+
     def __delitem__(self, key):
         "Delete a variable from the current context"
-        del self.dicts[-1][key]
+        d = self._dicts[-1]
+        del d[key]
+        if type(d) is not ContextDict:
+            self._forget(key)
 
     def has_key(self, key):
-        for d in self.dicts:
-            if key in d:
-                return True
-        return False
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
 
     def __contains__(self, key):
         return self.has_key(key)
 
     def get(self, key, otherwise=None):
-        for d in reversed(self.dicts):
-            if key in d:
-                return d[key]
-        return otherwise
+        try:
+            return self[key]
+        except KeyError:
+            return otherwise
 
     def new(self, values=None):
         """
@@ -104,7 +221,10 @@ class Context(BaseContext):
         "Pushes other_dict to the stack of dictionaries in the Context"
         if not hasattr(other_dict, '__getitem__'):
             raise TypeError('other_dict must be a mapping (dictionary-like) object.')
-        self.dicts.append(other_dict)
+        self._dicts.append(other_dict)
+        # The memoized lookups don't check other_dict, which its owner may
+        # still change.
+        self._forget_all()
         return other_dict
 
 class RenderContext(BaseContext):
@@ -123,18 +243,69 @@ class RenderContext(BaseContext):
     template context.
     """
     def __iter__(self):
-        for d in self.dicts[-1]:
+        for d in self._dicts[-1]:
             yield d
 
     def has_key(self, key):
-        return key in self.dicts[-1]
+        return key in self._dicts[-1]
 
     def get(self, key, otherwise=None):
-        d = self.dicts[-1]
+        d = self._dicts[-1]
         if key in d:
             return d[key]
         return otherwise
 
+class LazyContextDict(object):
+    """
+    The dictionary returned by a context processor that declared the names it
+    provides (see ``provides``). The processor is only run the first time one
+    of those names is looked up.
+    """
+    def __init__(self, processor, request):
+        self.processor = processor
+        self.request = request
+        self._dict = None
+
+    def _evaluate(self):
+        if self._dict is None:
+            self._dict = self.processor(self.request)
+        return self._dict
+
+    def __contains__(self, key):
+        return key in self.processor.provides and key in self._evaluate()
+
+    def __getitem__(self, key):
+        return self._evaluate()[key]
+
+    def __iter__(self):
+        return iter(self._evaluate())
+
+    def __len__(self):
+        return len(self._evaluate())
+
+    def __repr__(self):
+        if self._dict is None:
+            return '<%s %s: %s>' % (self.__class__.__name__,
+                self.processor.__name__, sorted(self.processor.provides))
+        return repr(self._dict)
+
+    def keys(self):
+        return self._evaluate().keys()
+
+    def get(self, key, otherwise=None):
+        return self._evaluate().get(key, otherwise)
+
+def provides(*names):
+    """
+    Decorator for context processors, declaring the names of the variables a
+    processor adds to the context. RequestContext then defers running the
+    processor until a template looks up one of these names.
+    """
+    def decorator(processor):
+        processor.provides = frozenset(names)
+        return processor
+    return decorator
+
 # This is a function rather than module-level procedural code because we only
 # want it to execute if somebody uses RequestContext.
 def get_standard_processors():
@@ -176,4 +347,8 @@ class RequestContext(Context):
         else:
             processors = tuple(processors)
         for processor in get_standard_processors() + processors:
-            self.update(processor(request))
+            if getattr(processor, 'provides', None) is not None:
+                self._dicts.append(LazyContextDict(processor, request))
+                self._forget_all()
+            else:
+                self.push(processor(request))
@@ -92,7 +92,7 @@ class FilterNode(Node):
     def render(self, context):
         output = self.nodelist.render(context)
         # Apply filters.
-        context.update({'var': output})
+        context.push(var=output)
         filtered = self.filter_expr.resolve(context)
         context.pop()
         return filtered
@@ -178,7 +178,7 @@ class ForNode(Node):
                     pass
                 else:
                     pop_context = True
-                    context.update(unpacked_vars)
+                    context.push(unpacked_vars)
             else:
                 context[self.loopvars[0]] = item
             # In TEMPLATE_DEBUG mode provide source of the node which
@@ -481,7 +481,7 @@ class WithNode(Node):
     def render(self, context):
         values = dict([(key, val.resolve(context)) for key, val in
                        six.iteritems(self.extra_context)])
-        context.update(values)
+        context.push(values)
         output = self.nodelist.render(context)
         context.pop()
         return output
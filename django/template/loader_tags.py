@@ -1,7 +1,11 @@
+import threading
+from copy import copy
+
 from django.conf import settings
 from django.template.base import TemplateSyntaxError, Library, Node, TextNode,\
     token_kwargs, Variable
 from django.template.loader import get_template
+from django.utils.encoding import python_2_unicode_compatible
 from django.utils.safestring import mark_safe
 from django.utils import six
 
@@ -9,6 +13,32 @@ register = Library()
 
 BLOCK_CONTEXT_KEY = 'block_context'
 
+# Thread pool rendering {% include ... async %} tags, created on first use.
+_include_pool = None
+_include_pool_lock = threading.Lock()
+# Marks the threads of the pool while they render an include.
+_include_worker = threading.local()
+
+def get_include_pool():
+    """
+    Returns the thread pool used to render asynchronous includes, or None if
+    TEMPLATE_ASYNC_INCLUDE_THREADS disables them.
+    """
+    global _include_pool
+    if _include_pool is None and settings.TEMPLATE_ASYNC_INCLUDE_THREADS:
+        with _include_pool_lock:
+            if _include_pool is None:
+                from multiprocessing.pool import ThreadPool
+                _include_pool = ThreadPool(settings.TEMPLATE_ASYNC_INCLUDE_THREADS)
+    return _include_pool
+
+def reset_include_pool():
+    global _include_pool
+    with _include_pool_lock:
+        if _include_pool is not None:
+            _include_pool.close()
+            _include_pool = None
+
 class ExtendsError(Exception):
     pass
 
@@ -123,18 +153,102 @@ class ExtendsNode(Node):
         # the same.
         return compiled_parent._render(context)
 
+@python_2_unicode_compatible
+class DeferredInclude(object):
+    """
+    The output of an include rendered in the include thread pool. Converting
+    it to text waits for the rendering to finish.
+    """
+    def __init__(self, result):
+        self.result = result
+
+    def __str__(self):
+        return self.result.get()
+
+def snapshot_context(context):
+    """
+    Returns a copy of the context that a thread can render on its own, while
+    the original keeps changing (e.g. in the next iteration of a for loop).
+    """
+    snapshot = copy(context)
+    snapshot._dicts = [copy_forloop(dict(d)) if isinstance(d, dict) else d
+                       for d in context._dicts]
+    # Nodes keep their state in the render context, give the snapshot its
+    # own.
+    snapshot.render_context = copy(context.render_context)
+    snapshot.render_context._dicts = [dict(d) for d in
+                                      context.render_context._dicts]
+    return snapshot
+
+def copy_forloop(d):
+    """
+    Copies the forloop variable of the dict ``d`` along with the loops it's
+    nested in, which the for tag updates in place. Returns ``d``.
+    """
+    loop, key = d, 'forloop'
+    while isinstance(loop.get(key), dict):
+        loop[key] = dict(loop[key])
+        loop, key = loop[key], 'parentloop'
+    return d
+
+def render_in_thread(render, context):
+    """
+    Renders ``render(context)`` in the include thread pool, under the same
+    language, time zone, URLconf and script prefix as the current thread.
+    An include nested in one rendered by the pool is rendered in place:
+    waiting for another thread of the pool could wait forever once every
+    thread waits.
+    """
+    if getattr(_include_worker, 'active', False):
+        return render(context)
+
+    from django.core import urlresolvers
+    from django.db import connections
+    from django.utils import timezone, translation
+
+    language = translation.get_language()
+    tz = timezone.get_current_timezone()
+    urlconf = urlresolvers.get_urlconf()
+    script_prefix = urlresolvers.get_script_prefix()
+
+    def job():
+        _include_worker.active = True
+        translation.activate(language)
+        timezone.activate(tz)
+        urlresolvers.set_urlconf(urlconf)
+        urlresolvers.set_script_prefix(script_prefix)
+        try:
+            return render(context)
+        finally:
+            translation.deactivate()
+            timezone.deactivate()
+            urlresolvers.set_urlconf(None)
+            _include_worker.active = False
+            # Worker threads outlive the request, their connections mustn't.
+            for conn in connections.all():
+                conn.close()
+
+    return DeferredInclude(get_include_pool().apply_async(job))
+
 class BaseIncludeNode(Node):
     def __init__(self, *args, **kwargs):
         self.extra_context = kwargs.pop('extra_context', {})
         self.isolated_context = kwargs.pop('isolated_context', False)
+        self.threaded = kwargs.pop('threaded', False)
         super(BaseIncludeNode, self).__init__(*args, **kwargs)
 
+    def render(self, context):
+        if (self.threaded and not settings.TEMPLATE_DEBUG and
+                get_include_pool() is not None):
+            return render_in_thread(self.render_include, snapshot_context(context))
+        return self.render_include(context)
+
     def render_template(self, template, context):
         values = dict([(name, var.resolve(context)) for name, var
                        in six.iteritems(self.extra_context)])
         if self.isolated_context:
             return template.render(context.new(values))
-        context.update(values)
+        context.push(values)
         output = template.render(context)
         context.pop()
         return output
@@ -150,7 +264,7 @@ class ConstantIncludeNode(BaseIncludeNode):
                 raise
             self.template = None
 
-    def render(self, context):
+    def render_include(self, context):
         if not self.template:
             return ''
         return self.render_template(self.template, context)
@@ -160,7 +274,7 @@ class IncludeNode(BaseIncludeNode):
         super(IncludeNode, self).__init__(*args, **kwargs)
         self.template_name = template_name
 
-    def render(self, context):
+    def render_include(self, context):
         try:
             template_name = self.template_name.resolve(context)
             template = get_template(template_name)
@@ -233,6 +347,11 @@ def do_include(parser, token):
 
         {% include "foo/some_include" only %}
         {% include "foo/some_include" with bar="1" only %}
+
+    Use the ``async`` argument to render the included template in a thread
+    pool while the rest of the current template renders::
+
+        {% include "foo/some_include" async %}
     """
     bits = token.split_contents()
     if len(bits) < 2:
@@ -249,17 +368,19 @@ def do_include(parser, token):
             if not value:
                 raise TemplateSyntaxError('"with" in %r tag needs at least '
                                           'one keyword argument.' % bits[0])
-        elif option == 'only':
+        elif option in ('only', 'async'):
             value = True
         else:
             raise TemplateSyntaxError('Unknown argument for %r tag: %r.' %
                                       (bits[0], option))
         options[option] = value
     isolated_context = options.get('only', False)
+    threaded = options.get('async', False)
     namemap = options.get('with', {})
     path = bits[1]
     if path[0] in ('"', "'") and path[-1] == path[0]:
         return ConstantIncludeNode(path[1:-1], extra_context=namemap,
-                                   isolated_context=isolated_context)
+                                   isolated_context=isolated_context,
+                                   threaded=threaded)
     return IncludeNode(parser.compile_filter(bits[1]), extra_context=namemap,
-                       isolated_context=isolated_context)
+                       isolated_context=isolated_context, threaded=threaded)
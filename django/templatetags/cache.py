@@ -1,14 +1,18 @@
 from __future__ import unicode_literals
 
-import hashlib
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models.query import QuerySet
 from django.template import Library, Node, TemplateSyntaxError, Variable, VariableDoesNotExist
 from django.template import resolve_variable
-from django.core.cache import cache
-from django.utils.encoding import force_bytes
-from django.utils.http import urlquote
+from django.template.defaulttags import ForNode
 
 register = Library()
 
+# Key of the enclosing {% prefetchcache %} block's FragmentBatch in the render
+# context.
+FRAGMENT_BATCH_KEY = 'fragment_batch'
+
 class CacheNode(Node):
     def __init__(self, nodelist, expire_time_var, fragment_name, vary_on):
         self.nodelist = nodelist
@@ -16,25 +20,147 @@ class CacheNode(Node):
         self.fragment_name = fragment_name
         self.vary_on = vary_on
 
-    def render(self, context):
+    def get_expire_time(self, context):
         try:
             expire_time = self.expire_time_var.resolve(context)
         except VariableDoesNotExist:
             raise TemplateSyntaxError('"cache" tag got an unknown variable: %r' % self.expire_time_var.var)
         try:
-            expire_time = int(expire_time)
+            return int(expire_time)
         except (ValueError, TypeError):
             raise TemplateSyntaxError('"cache" tag got a non-integer timeout value: %r' % expire_time)
+
+    def get_cache_key(self, context):
         # Build a key for this fragment and all vary-on's.
-        key = ':'.join([urlquote(resolve_variable(var, context)) for var in self.vary_on])
-        args = hashlib.md5(force_bytes(key))
-        cache_key = 'template.cache.%s.%s' % (self.fragment_name, args.hexdigest())
+        vary_on = [resolve_variable(var, context) for var in self.vary_on]
+        return make_template_fragment_key(self.fragment_name, vary_on)
+
+    def render(self, context):
+        expire_time = self.get_expire_time(context)
+        cache_key = self.get_cache_key(context)
+        batch = context.render_context.get(FRAGMENT_BATCH_KEY)
+        if batch is not None:
+            value = batch.get(cache_key)
+            if value is None:
+                value = self.nodelist.render(context)
+                batch.set(cache_key, value, expire_time)
+            return value
         value = cache.get(cache_key)
         if value is None:
             value = self.nodelist.render(context)
             cache.set(cache_key, value, expire_time)
         return value
 
+class FragmentBatch(object):
+    """
+    Cached fragments fetched together by a {% prefetchcache %} block, and
+    the fragments rendered within it that are to be cached together.
+    """
+    def __init__(self, keys):
+        self.fetched = keys
+        self.values = cache.get_many(list(keys)) if keys else {}
+        # Maps timeouts to the fragments to cache with that timeout.
+        self.pending = {}
+
+    def get(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            if key in self.fetched:
+                return None
+            return cache.get(key)
+
+    def set(self, key, value, timeout):
+        self.values[key] = value
+        self.pending.setdefault(timeout, {})[key] = value
+
+    def flush(self):
+        for timeout, values in self.pending.items():
+            cache.set_many(values, timeout)
+        self.pending = {}
+
+def collect_cache_keys(nodelist, context, keys):
+    """
+    Adds to ``keys`` the cache keys of the {% cache %} tags in ``nodelist``,
+    as far as they can be computed without rendering: the body of a {% for %}
+    loop is visited once per item of its sequence, other tags are visited
+    with the context as it is. Keys that turn out to be wrong only cost a
+    cache miss.
+    """
+    for node in nodelist:
+        if isinstance(node, CacheNode):
+            try:
+                keys.add(node.get_cache_key(context))
+            except Exception:
+                pass
+            continue
+        if isinstance(node, ForNode):
+            collect_loop_cache_keys(node, context, keys)
+            continue
+        child_nodelists = [getattr(node, attr, None) for attr in node.child_nodelists]
+        # {% if %} keeps its nodelists along with their conditions.
+        child_nodelists.extend([nl for _, nl in getattr(node, 'conditions_nodelists', ())])
+        for child_nodelist in child_nodelists:
+            if child_nodelist:
+                collect_cache_keys(child_nodelist, context, keys)
+
+def collect_loop_cache_keys(node, context, keys):
+    if not node.nodelist_loop.get_nodes_by_type(CacheNode):
+        return
+    try:
+        values = node.sequence.resolve(context, True)
+    except VariableDoesNotExist:
+        return
+    # Only sequences that can be iterated again when the loop renders.
+    if values is None or not hasattr(values, '__len__'):
+        return
+    # A sequence such as obj.related.all resolves to a new QuerySet each time;
+    # evaluating it here would run its query twice.
+    if (isinstance(values, QuerySet) and values._result_cache is None and
+            node.sequence.resolve(context, True) is not values):
+        return
+    len_values = len(values)
+    if node.is_reversed:
+        values = reversed(values)
+    unpack = len(node.loopvars) > 1
+    context.push()
+    try:
+        for i, item in enumerate(values):
+            context['forloop'] = {
+                'counter0': i, 'counter': i + 1,
+                'revcounter': len_values - i, 'revcounter0': len_values - i - 1,
+                'first': i == 0, 'last': i == len_values - 1,
+            }
+            if unpack:
+                try:
+                    context.push(zip(node.loopvars, item))
+                except TypeError:
+                    continue
+                collect_cache_keys(node.nodelist_loop, context, keys)
+                context.pop()
+            else:
+                context[node.loopvars[0]] = item
+                collect_cache_keys(node.nodelist_loop, context, keys)
+    finally:
+        context.pop()
+
+class PrefetchCacheNode(Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        keys = set()
+        collect_cache_keys(self.nodelist, context, keys)
+        batch = FragmentBatch(keys)
+        outer_batch = context.render_context.get(FRAGMENT_BATCH_KEY)
+        context.render_context[FRAGMENT_BATCH_KEY] = batch
+        try:
+            output = self.nodelist.render(context)
+        finally:
+            context.render_context[FRAGMENT_BATCH_KEY] = outer_batch
+        batch.flush()
+        return output
+
 @register.tag('cache')
 def do_cache(parser, token):
     """
@@ -63,3 +189,26 @@ def do_cache(parser, token):
     if len(tokens) < 3:
         raise TemplateSyntaxError("'%r' tag requires at least 2 arguments." % tokens[0])
     return CacheNode(nodelist, tokens[1], tokens[2], tokens[3:])
+
+@register.tag('prefetchcache')
+def do_prefetchcache(parser, token):
+    """
+    Fetches the fragments of all the ``{% cache %}`` tags in the block,
+    including those in ``{% for %}`` loops, with a single request to the
+    cache, and stores the fragments that weren't cached with a single request
+    once the block has rendered.
+
+    Usage::
+
+        {% load cache %}
+        {% prefetchcache %}
+            {% for item in items %}
+                {% cache 500 row item.pk %} .. {% endcache %}
+            {% endfor %}
+        {% endprefetchcache %}
+    """
+    nodelist = parser.parse(('endprefetchcache',))
+    parser.delete_first_token()
+    if len(token.contents.split()) != 1:
+        raise TemplateSyntaxError("'%s' tag takes no arguments." % token.contents.split()[0])
+    return PrefetchCacheNode(nodelist)
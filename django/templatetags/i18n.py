@@ -124,9 +124,8 @@ class BlockTranslateNode(Node):
         tmp_context = {}
         for var, val in self.extra_context.items():
             tmp_context[var] = val.resolve(context)
-        # Update() works like a push(), so corresponding context.pop() is at
-        # the end of function
-        context.update(tmp_context)
+        # The corresponding context.pop() is at the end of the function
+        context.push(tmp_context)
         singular, vars = self.render_token_list(self.singular)
         if self.plural and self.countervar and self.counter:
             count = self.counter.resolve(context)
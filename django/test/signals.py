@@ -52,6 +52,13 @@ def clear_context_processors_cache(**kwargs):
         context._standard_context_processors = None
 
 
+@receiver(setting_changed)
+def reset_template_include_pool(**kwargs):
+    if kwargs['setting'] == 'TEMPLATE_ASYNC_INCLUDE_THREADS':
+        from django.template import loader_tags
+        loader_tags.reset_include_pool()
+
+
 @receiver(setting_changed)
 def clear_template_loaders_cache(**kwargs):
     if kwargs['setting'] == 'TEMPLATE_LOADERS':
@@ -68,10 +75,10 @@ def clear_serializers_cache(**kwargs):
 
 @receiver(setting_changed)
 def language_changed(**kwargs):
-    if kwargs['setting'] in ('LOCALE_PATHS', 'LANGUAGE_CODE'):
+    if kwargs['setting'] in ('LOCALE_PATHS', 'LANGUAGE_CODE', 'MERGED_CATALOGS_DIR'):
         from django.utils.translation import trans_real
         trans_real._default = None
-        if kwargs['setting'] == 'LOCALE_PATHS':
+        if kwargs['setting'] in ('LOCALE_PATHS', 'MERGED_CATALOGS_DIR'):
             trans_real._translations = {}
 
 @receiver(setting_changed)
@@ -4,6 +4,7 @@ from xml.dom.minidom import parseString, Node
 
 from django.conf import settings, UserSettingsHolder
 from django.core import mail
+from django.dispatch import dispatcher
 from django.http import request
 from django.template import Template, loader, TemplateDoesNotExist
 from django.template.loaders import cached
@@ -71,6 +72,7 @@ def setup_test_environment():
 
         - Installing the instrumented test renderer
         - Set the email backend to the locmem email backend.
+        - Running background signal receivers synchronously.
         - Setting the active locale to match the LANGUAGE_CODE setting.
     """
     Template._original_render = Template._render
@@ -85,6 +87,9 @@ def setup_test_environment():
     request._original_allowed_hosts = settings.ALLOWED_HOSTS
     settings.ALLOWED_HOSTS = ['*']
 
+    dispatcher._original_signal_executor = settings.SIGNAL_EXECUTOR
+    settings.SIGNAL_EXECUTOR = 'django.dispatch.executors.SynchronousExecutor'
+
     mail.outbox = []
 
     deactivate()
@@ -95,6 +100,7 @@ def teardown_test_environment():
 
         - Restoring the original test renderer
         - Restoring the email sending functions
+        - Restoring the signal executor
 
     """
     Template._render = Template._original_render
@@ -106,6 +112,9 @@ def teardown_test_environment():
     settings.ALLOWED_HOSTS = request._original_allowed_hosts
     del request._original_allowed_hosts
 
+    settings.SIGNAL_EXECUTOR = dispatcher._original_signal_executor
+    del dispatcher._original_signal_executor
+
     del mail.outbox
 
 
@@ -27,14 +27,47 @@ from django.utils.timezone import is_aware, is_naive
 re_formatchars = re.compile(r'(?<!\\)([aAbBcdDeEfFgGhHiIjlLmMnNoOPrsStTUuwWyYzZ])')
 re_escaped = re.compile(r'\\(.)')
 
+# Compiled format strings, see compile_format().
+_compiled_formats = {}
+# Maximum number of compiled format strings kept.
+COMPILED_FORMATS_SIZE = 1000
+
+def compile_format(formatstr):
+    """
+    Splits a format string into a tuple of (piece, is_specifier) pairs, where
+    pieces are either the names of Formatter methods or literal text. The
+    result is cached; it doesn't depend on the language, since specifiers
+    are only translated when they're formatted.
+    """
+    formatstr = force_text(formatstr)
+    try:
+        return _compiled_formats[formatstr]
+    except KeyError:
+        pass
+    compiled = []
+    for i, piece in enumerate(re_formatchars.split(formatstr)):
+        if i % 2:
+            compiled.append((piece, True))
+        elif piece:
+            compiled.append((re_escaped.sub(r'\1', piece), False))
+    compiled = tuple(compiled)
+    if len(_compiled_formats) >= COMPILED_FORMATS_SIZE:
+        _compiled_formats.clear()
+    _compiled_formats[formatstr] = compiled
+    return compiled
+
 class Formatter(object):
     def format(self, formatstr):
+        return self.format_compiled(compile_format(formatstr))
+
+    def format_compiled(self, compiled):
+        "Formats with the result of compile_format()"
         pieces = []
-        for i, piece in enumerate(re_formatchars.split(force_text(formatstr))):
-            if i % 2:
+        for piece, is_specifier in compiled:
+            if is_specifier:
                 pieces.append(force_text(getattr(self, piece)()))
-            elif piece:
-                pieces.append(re_escaped.sub(r'\1', piece))
+            else:
+                pieces.append(piece)
         return ''.join(pieces)
 
 class TimeFormat(Formatter):
@@ -315,3 +348,13 @@ def time_format(value, format_string):
     "Convenience function"
     tf = TimeFormat(value)
     return tf.format(format_string)
+
+def format_many(values, format_string):
+    "Formats each of the date or datetime values, returns a list"
+    compiled = compile_format(format_string)
+    return [DateFormat(value).format_compiled(compiled) for value in values]
+
+def time_format_many(values, format_string):
+    "Formats each of the time values, returns a list"
+    compiled = compile_format(format_string)
+    return [TimeFormat(value).format_compiled(compiled) for value in values]
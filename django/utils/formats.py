@@ -133,18 +133,51 @@ def number_format(value, decimal_pos=None, use_l10n=None, force_grouping=False):
     If use_l10n is provided and is not None, that will force the value to
     be localized (or not), overriding the value of settings.USE_L10N.
     """
+    return _number_formatter(decimal_pos, use_l10n, force_grouping)(value)
+
+def date_format_many(values, format=None, use_l10n=None):
+    """
+    Formats a sequence of datetime.date or datetime.datetime objects like
+    date_format(), looking the format up once. Returns a list.
+    """
+    return dateformat.format_many(values, get_format(format or 'DATE_FORMAT', use_l10n=use_l10n))
+
+def time_format_many(values, format=None, use_l10n=None):
+    """
+    Formats a sequence of datetime.time objects like time_format(), looking
+    the format up once. Returns a list.
+    """
+    return dateformat.time_format_many(values, get_format(format or 'TIME_FORMAT', use_l10n=use_l10n))
+
+def _number_formatter(decimal_pos=None, use_l10n=None, force_grouping=False):
+    """
+    Returns a function formatting numbers like number_format(), with the
+    formats of the current language.
+    """
     if use_l10n or (use_l10n is None and settings.USE_L10N):
         lang = get_language()
     else:
         lang = None
-    return numberformat.format(
-        value,
-        get_format('DECIMAL_SEPARATOR', lang, use_l10n=use_l10n),
-        decimal_pos,
-        get_format('NUMBER_GROUPING', lang, use_l10n=use_l10n),
-        get_format('THOUSAND_SEPARATOR', lang, use_l10n=use_l10n),
-        force_grouping=force_grouping
-    )
+    decimal_sep = get_format('DECIMAL_SEPARATOR', lang, use_l10n=use_l10n)
+    # The grouping formats are only looked up when grouping is used.
+    grouping, thousand_sep = 0, ''
+    if force_grouping or (settings.USE_L10N and settings.USE_THOUSAND_SEPARATOR):
+        grouping = get_format('NUMBER_GROUPING', lang, use_l10n=use_l10n)
+        thousand_sep = get_format('THOUSAND_SEPARATOR', lang, use_l10n=use_l10n)
+    format = numberformat.format
+
+    def formatter(value):
+        # Grouping was decided above, a grouping of 0 disables it.
+        return format(value, decimal_sep, decimal_pos, grouping, thousand_sep,
+                      force_grouping=True)
+    return formatter
+
+def number_format_many(values, decimal_pos=None, use_l10n=None, force_grouping=False):
+    """
+    Formats a sequence of numeric values like number_format(), looking the
+    formats up once. Returns a list.
+    """
+    return list(map(_number_formatter(decimal_pos, use_l10n, force_grouping), values))
 
 def localize(value, use_l10n=None):
     """
@@ -167,6 +200,37 @@ def localize(value, use_l10n=None):
     else:
         return value
 
+def localize_many(values, use_l10n=None):
+    """
+    Localizes a sequence of values like localize(), looking the formats of
+    each type up once. Returns a list.
+    """
+    number = None
+    compiled = {}
+
+    def format_with(formatter_class, value, format_type):
+        if format_type not in compiled:
+            compiled[format_type] = dateformat.compile_format(
+                get_format(format_type, use_l10n=use_l10n))
+        return formatter_class(value).format_compiled(compiled[format_type])
+
+    localized = []
+    for value in values:
+        if isinstance(value, bool):
+            value = mark_safe(six.text_type(value))
+        elif isinstance(value, (decimal.Decimal, float) + six.integer_types):
+            if number is None:
+                number = _number_formatter(use_l10n=use_l10n)
+            value = number(value)
+        elif isinstance(value, datetime.datetime):
+            value = format_with(dateformat.DateFormat, value, 'DATETIME_FORMAT')
+        elif isinstance(value, datetime.date):
+            value = format_with(dateformat.DateFormat, value, 'DATE_FORMAT')
+        elif isinstance(value, datetime.time):
+            value = format_with(dateformat.TimeFormat, value, 'TIME_FORMAT')
+        localized.append(value)
+    return localized
+
 def localize_input(value, default=None):
     """
     Checks if an input value is a localizable type and returns it
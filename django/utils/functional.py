@@ -51,7 +51,7 @@ class Promise(object):
     the closure of the lazy function. It can be used to recognize
     promises in code.
     """
-    pass
+    __slots__ = ()
 
 def lazy(func, *resultclasses):
     """
@@ -60,6 +60,28 @@ def lazy(func, *resultclasses):
     the lazy evaluation code is triggered. Results are not memoized; the
     function is evaluated on every access.
     """
+    proxy_class = _lazy_proxy_class(resultclasses)
+
+    @wraps(func)
+    def __wrapper__(*args, **kw):
+        # Creates the proxy object, instead of the actual value.
+        return proxy_class(func, args, kw)
+
+    return __wrapper__
+
+# Proxy classes by tuple of result classes.
+_lazy_proxy_classes = {}
+
+def _lazy_proxy_class(resultclasses):
+    """
+    Returns the class of the proxies created by lazy() for the given result
+    classes. It's shared by all the functions with the same result classes,
+    so that their methods are only set up once.
+    """
+    try:
+        return _lazy_proxy_classes[resultclasses]
+    except KeyError:
+        pass
 
     @total_ordering
     class __proxy__(Promise):
@@ -68,18 +90,18 @@ def lazy(func, *resultclasses):
         called on the result of that function. The function is not evaluated
         until one of the methods on the result is called.
         """
+        __slots__ = ('__func', '__args', '__kw')
         __dispatch = None
 
-        def __init__(self, args, kw):
+        def __init__(self, func, args, kw):
+            self.__func = func
             self.__args = args
             self.__kw = kw
-            if self.__dispatch is None:
-                self.__prepare_class__()
 
         def __reduce__(self):
             return (
                 _lazy_proxy_unpickle,
-                (func, self.__args, self.__kw) + resultclasses
+                (self.__func, self.__args, self.__kw) + resultclasses
             )
 
         def __prepare_class__(cls):
@@ -116,7 +138,7 @@ def lazy(func, *resultclasses):
             def __wrapper__(self, *args, **kw):
                 # Automatically triggers the evaluation of a lazy value and
                 # applies the given magic method of the result type.
-                res = func(*self.__args, **self.__kw)
+                res = self.__func(*self.__args, **self.__kw)
                 for t in type(res).mro():
                     if t in self.__dispatch:
                         return self.__dispatch[t][funcname](res, *args, **kw)
@@ -129,10 +151,10 @@ def lazy(func, *resultclasses):
         __promise__ = classmethod(__promise__)
 
         def __text_cast(self):
-            return func(*self.__args, **self.__kw)
+            return self.__func(*self.__args, **self.__kw)
 
         def __bytes_cast(self):
-            return bytes(func(*self.__args, **self.__kw))
+            return bytes(self.__func(*self.__args, **self.__kw))
 
         def __cast(self):
             if self._delegate_bytes:
@@ -140,7 +162,7 @@ def lazy(func, *resultclasses):
             elif self._delegate_text:
                 return self.__text_cast()
             else:
-                return func(*self.__args, **self.__kw)
+                return self.__func(*self.__args, **self.__kw)
 
         def __eq__(self, other):
             if isinstance(other, Promise):
@@ -170,12 +192,9 @@ def lazy(func, *resultclasses):
             memo[id(self)] = self
             return self
 
-    @wraps(func)
-    def __wrapper__(*args, **kw):
-        # Creates the proxy object, instead of the actual value.
-        return __proxy__(args, kw)
-
-    return __wrapper__
+    __proxy__.__prepare_class__()
+    _lazy_proxy_classes[resultclasses] = __proxy__
+    return __proxy__
 
 def _lazy_proxy_unpickle(func, args, kwargs, *resultclasses):
     return lazy(func, *resultclasses)(*args, **kwargs)
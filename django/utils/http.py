@@ -20,6 +20,7 @@ from django.utils.functional import allow_lazy
 from django.utils import six
 
 ETAG_MATCH = re.compile(r'(?:W/)?"((?:\\.|[^"])*)"')
+BYTE_RANGE_RE = re.compile(r'^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$')
 
 MONTHS = 'jan feb mar apr may jun jul aug sep oct nov dec'.split()
 __D = r'(?P<day>\d{2})'
@@ -221,6 +222,36 @@ def quote_etag(etag):
     """
     return '"%s"' % etag.replace('\\', '\\\\').replace('"', '\\"')
 
+def parse_range_header(header, size):
+    """
+    Parses a Range header asking for a single byte range of a resource that
+    is ``size`` bytes long, by the rules in RFC 2616, section 14.35.
+
+    Returns the positions of the first and last bytes of the range, both
+    inclusive, or None if the header is malformed or asks for several ranges,
+    in which case it should be ignored. Raises ValueError if the range can't
+    be satisfied.
+    """
+    m = BYTE_RANGE_RE.match(header)
+    if not m:
+        return None
+    first, last = m.groups()
+    if not first:
+        if not last:
+            return None
+        # A suffix range: the last ``last`` bytes of the resource.
+        suffix_length = int(last)
+        if not suffix_length or not size:
+            raise ValueError("Unsatisfiable range: %r" % header)
+        return max(size - suffix_length, 0), size - 1
+    first = int(first)
+    if last and int(last) < first:
+        return None
+    if first >= size:
+        raise ValueError("Unsatisfiable range: %r" % header)
+    last = min(int(last), size - 1) if last else size - 1
+    return first, last
+
 def same_origin(url1, url2):
     """
     Checks if two URLs are 'same-origin'
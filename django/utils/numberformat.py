@@ -14,8 +14,7 @@ def format(number, decimal_sep, decimal_pos=None, grouping=0, thousand_sep='',
     * grouping: Number of digits in every group limited by thousand separator
     * thousand_sep: Thousand separator symbol (for example ",")
     """
-    use_grouping = settings.USE_L10N and settings.USE_THOUSAND_SEPARATOR
-    use_grouping = use_grouping or force_grouping
+    use_grouping = force_grouping or (settings.USE_L10N and settings.USE_THOUSAND_SEPARATOR)
     use_grouping = use_grouping and grouping > 0
     # Make the common case fast
     if isinstance(number, int) and not use_grouping and not decimal_pos:
@@ -39,10 +38,10 @@ def format(number, decimal_sep, decimal_pos=None, grouping=0, thousand_sep='',
         dec_part = decimal_sep + dec_part
     # grouping
     if use_grouping:
-        int_part_gd = ''
-        for cnt, digit in enumerate(int_part[::-1]):
-            if cnt and not cnt % grouping:
-                int_part_gd += thousand_sep
-            int_part_gd += digit
-        int_part = int_part_gd[::-1]
+        groups = []
+        while len(int_part) > grouping:
+            groups.append(int_part[-grouping:])
+            int_part = int_part[:-grouping]
+        groups.append(int_part)
+        int_part = thousand_sep.join(reversed(groups))
     return sign + int_part + dec_part
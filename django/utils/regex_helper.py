@@ -340,3 +340,85 @@ def flatten_result(source):
             result[i] += piece
     return result, result_args
 
+
+def split_groups(pattern):
+    """
+    Splits a pattern made only of literal text and capturing groups into a
+    list of literal strings and (name, pattern) pairs for the groups, named
+    as in normalize(). Returns None for any other pattern, e.g. one with
+    quantifiers, alternatives or character classes outside the groups, or
+    with nested groups.
+    """
+    pieces = []
+    literal = []
+    num_args = 0
+    pos = 1 if pattern.startswith('^') else 0
+    end = len(pattern)
+    if pattern.endswith('$') and not pattern.endswith('\\$'):
+        end -= 1
+    while pos < end:
+        ch = pattern[pos]
+        if ch == '(':
+            if pattern.startswith('(?P<', pos):
+                start = pattern.find('>', pos) + 1
+                if not start:
+                    return None
+                name = pattern[pos + 4:start - 1]
+            elif pattern.startswith('(?', pos):
+                return None
+            else:
+                start = pos + 1
+                name = '_%d' % num_args
+                num_args += 1
+            pos = find_group_end(pattern, start, end)
+            if pos is None:
+                return None
+            if literal:
+                pieces.append(''.join(literal))
+                literal = []
+            pieces.append((name, pattern[start:pos]))
+            pos += 1
+        elif ch == '\\':
+            if pos + 1 >= end or pattern[pos + 1].isalnum():
+                return None
+            literal.append(pattern[pos + 1])
+            pos += 2
+        elif ch in '.^$*+?{}[]|)':
+            return None
+        else:
+            literal.append(ch)
+            pos += 1
+        if pos < end and pattern[pos] in '*+?{':
+            return None
+    if literal:
+        pieces.append(''.join(literal))
+    return pieces
+
+def find_group_end(pattern, pos, end):
+    """
+    Returns the position of the parenthesis closing the group whose content
+    starts at pos, or None if the group contains another group or an anchor,
+    which wouldn't match the same way outside of the pattern.
+    """
+    in_class = False
+    while pos < end:
+        ch = pattern[pos]
+        if ch == '\\':
+            if not in_class and pattern[pos + 1:pos + 2] in ('A', 'Z', 'b', 'B'):
+                return None
+            pos += 1
+        elif in_class:
+            in_class = ch != ']'
+        elif ch == '[':
+            in_class = True
+            # A closing bracket right at the start of a class is literal.
+            if pattern.startswith('^', pos + 1):
+                pos += 1
+            if pattern.startswith(']', pos + 1):
+                pos += 1
+        elif ch in '(^$':
+            return None
+        elif ch == ')':
+            return pos
+        pos += 1
+    return None
@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import locale
+import marshal
 import os
 import re
 import sys
@@ -31,6 +32,12 @@ _accepted = {}
 # magic gettext number to separate context from message
 CONTEXT_SEPARATOR = "\x04"
 
+# Maximum number of translated messages memoized by each translation object.
+MEMO_SIZE = 10000
+
+# Version of the format of the catalogs written by the mergecatalogs command.
+MERGED_CATALOG_VERSION = 2
+
 # Format of Accept-Language header values. From RFC 2616, section 14.4 and 3.9
 # and RFC 3066, section 2.1
 accept_language_re = re.compile(r'''
@@ -70,19 +77,27 @@ class DjangoTranslation(gettext_module.GNUTranslations):
     """
     This class sets up the GNUTranslations context with regard to output
     charset.
+
+    It also memoizes the translated messages in ``memo``, keyed by
+    translation function and message.
     """
     def __init__(self, *args, **kw):
         gettext_module.GNUTranslations.__init__(self, *args, **kw)
         self.set_output_charset('utf-8')
         self.django_output_charset = 'utf-8'
         self.__language = '??'
+        self.memo = {}
 
     def merge(self, other):
         self._catalog.update(other._catalog)
+        self.memo = {}
 
     def set_language(self, language):
         self.__language = language
         self.__to_language = to_language(language)
+        # gettext hands out shallow copies of the translation objects it
+        # caches; don't share the memo of another language.
+        self.memo = {}
 
     def language(self):
         return self.__language
@@ -110,69 +125,180 @@ def translation(language):
 
     from django.conf import settings
 
-    globalpath = os.path.join(os.path.dirname(upath(sys.modules[settings.__module__].__file__)), 'locale')
+    default_translation = _fetch(settings.LANGUAGE_CODE)
+    current_translation = _fetch(language, fallback=default_translation)
 
-    def _fetch(lang, fallback=None):
+    return current_translation
+
+def _fetch(lang, fallback=None):
 
-        global _translations
+    global _translations
 
-        res = _translations.get(lang, None)
-        if res is not None:
-            return res
+    res = _translations.get(lang, None)
+    if res is not None:
+        return res
 
-        loc = to_locale(lang)
+    res = load_merged_catalog(lang)
+    if res is None:
+        res = merge_catalogs(lang)
 
-        def _translation(path):
-            try:
-                t = gettext_module.translation('django', path, [loc], DjangoTranslation)
-                t.set_language(lang)
-                return t
-            except IOError:
-                return None
-
-        res = _translation(globalpath)
-
-        # We want to ensure that, for example,  "en-gb" and "en-us" don't share
-        # the same translation object (thus, merging en-us with a local update
-        # doesn't affect en-gb), even though they will both use the core "en"
-        # translation. So we have to subvert Python's internal gettext caching.
-        base_lang = lambda x: x.split('-', 1)[0]
-        if base_lang(lang) in [base_lang(trans) for trans in _translations]:
-            res._info = res._info.copy()
-            res._catalog = res._catalog.copy()
-
-        def _merge(path):
-            t = _translation(path)
-            if t is not None:
-                if res is None:
-                    return t
-                else:
-                    res.merge(t)
-            return res
+    if res is None:
+        if fallback is not None:
+            res = fallback
+        else:
+            return gettext_module.NullTranslations()
+    _translations[lang] = res
+    return res
 
-        for appname in reversed(settings.INSTALLED_APPS):
-            app = import_module(appname)
-            apppath = os.path.join(os.path.dirname(upath(app.__file__)), 'locale')
+def merge_catalogs(lang):
+    """
+    Returns a translation object for lang merging the catalogs of Django, of
+    the applications in INSTALLED_APPS and of LOCALE_PATHS, or None if there
+    aren't any.
+    """
+    from django.conf import settings
 
-            if os.path.isdir(apppath):
-                res = _merge(apppath)
+    globalpath = os.path.join(os.path.dirname(upath(sys.modules[settings.__module__].__file__)), 'locale')
 
-        for localepath in reversed(settings.LOCALE_PATHS):
-            if os.path.isdir(localepath):
-                res = _merge(localepath)
+    loc = to_locale(lang)
 
-        if res is None:
-            if fallback is not None:
-                res = fallback
+    def _translation(path):
+        try:
+            t = gettext_module.translation('django', path, [loc], DjangoTranslation)
+            t.set_language(lang)
+            return t
+        except IOError:
+            return None
+
+    res = _translation(globalpath)
+
+    # We want to ensure that, for example,  "en-gb" and "en-us" don't share
+    # the same translation object (thus, merging en-us with a local update
+    # doesn't affect en-gb), even though they will both use the core "en"
+    # translation. So we have to subvert Python's internal gettext caching.
+    base_lang = lambda x: x.split('-', 1)[0]
+    if base_lang(lang) in [base_lang(trans) for trans in _translations]:
+        res._info = res._info.copy()
+        res._catalog = res._catalog.copy()
+
+    def _merge(path):
+        t = _translation(path)
+        if t is not None:
+            if res is None:
+                return t
             else:
-                return gettext_module.NullTranslations()
-        _translations[lang] = res
+                res.merge(t)
         return res
 
-    default_translation = _fetch(settings.LANGUAGE_CODE)
-    current_translation = _fetch(language, fallback=default_translation)
+    for appname in reversed(settings.INSTALLED_APPS):
+        app = import_module(appname)
+        apppath = os.path.join(os.path.dirname(upath(app.__file__)), 'locale')
 
-    return current_translation
+        if os.path.isdir(apppath):
+            res = _merge(apppath)
+
+    for localepath in reversed(settings.LOCALE_PATHS):
+        if os.path.isdir(localepath):
+            res = _merge(localepath)
+
+    return res
+
+def _message_files(lang):
+    """
+    Returns the [path, modification time, size] of each message file that
+    merge_catalogs() reads for lang.
+    """
+    from django.conf import settings
+
+    dirs = [os.path.join(os.path.dirname(upath(sys.modules[settings.__module__].__file__)), 'locale')]
+    for appname in settings.INSTALLED_APPS:
+        app = import_module(appname)
+        dirs.append(os.path.join(os.path.dirname(upath(app.__file__)), 'locale'))
+    dirs.extend(settings.LOCALE_PATHS)
+
+    files = []
+    loc = to_locale(lang)
+    for path in dirs:
+        for mofile in gettext_module.find('django', path, [loc], all=True):
+            stat = os.stat(mofile)
+            files.append([mofile, stat.st_mtime, stat.st_size])
+    return files
+
+def _merged_catalog_key(lang):
+    """
+    Identifies what the merged catalog of lang is built from. Catalogs
+    written with another key are ignored. Looking up the message files only
+    takes a few stat() calls per locale directory, much less than reading
+    them.
+    """
+    from django.conf import settings
+    return [MERGED_CATALOG_VERSION, list(sys.version_info[:2]),
+            list(settings.INSTALLED_APPS), list(settings.LOCALE_PATHS),
+            _message_files(lang)]
+
+def merged_catalog_path(lang):
+    from django.conf import settings
+    return os.path.join(settings.MERGED_CATALOGS_DIR, '%s.catalog' % to_locale(lang))
+
+def write_merged_catalog(lang):
+    """
+    Writes the merged catalog of lang to MERGED_CATALOGS_DIR. Returns False if
+    lang doesn't have any catalogs.
+    """
+    t = merge_catalogs(lang)
+    if t is None:
+        return False
+    path = merged_catalog_path(lang)
+    # Write to a temporary file first, so that processes loading the catalog
+    # never see it half-written.
+    # gettext falls back to the catalogs of less specific locales (e.g. es
+    # for es_MX); fold them in, lowest priority first.
+    fallbacks = []
+    fallback = t._fallback
+    while fallback is not None:
+        fallbacks.append(fallback)
+        fallback = getattr(fallback, '_fallback', None)
+    catalog = {}
+    for fallback in reversed(fallbacks):
+        catalog.update(getattr(fallback, '_catalog', {}))
+    catalog.update(t._catalog)
+    temp_path = '%s.%s.tmp' % (path, os.getpid())
+    with open(temp_path, 'wb') as f:
+        marshal.dump((_merged_catalog_key(lang), t._charset, t._info, catalog), f)
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(temp_path, path)
+    return True
+
+def load_merged_catalog(lang):
+    """
+    Returns a translation object for lang from the catalog written to
+    MERGED_CATALOGS_DIR by the mergecatalogs command, or None if there isn't
+    an up to date one.
+    """
+    from django.conf import settings
+
+    if not settings.MERGED_CATALOGS_DIR:
+        return None
+    try:
+        with open(merged_catalog_path(lang), 'rb') as f:
+            key, charset, info, catalog = marshal.load(f)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+    if key != _merged_catalog_key(lang):
+        return None
+    t = DjangoTranslation()
+    t._charset = charset
+    t._info = info
+    t._catalog = catalog
+    plural_forms = info.get('plural-forms')
+    if plural_forms:
+        # As parsed by GNUTranslations.
+        t.plural = gettext_module.c2py(plural_forms.split(';')[1].split('plural=')[1])
+    else:
+        t.plural = lambda n: int(n != 1)
+    t.set_language(lang)
+    return t
 
 def activate(language):
     """
@@ -247,20 +373,36 @@ def do_translate(message, translation_function):
     """
     global _default
 
-    # str() is allowing a bytestring message to remain bytestring on Python 2
-    eol_message = message.replace(str('\r\n'), str('\n')).replace(str('\r'), str('\n'))
     t = getattr(_active, "value", None)
-    if t is not None:
-        result = getattr(t, translation_function)(eol_message)
-    else:
+    if t is None:
         if _default is None:
             from django.conf import settings
             _default = translation(settings.LANGUAGE_CODE)
-        result = getattr(_default, translation_function)(eol_message)
+        t = _default
+    # Translation objects of other languages have their own memo, so
+    # activating a language switches memos too.
+    memo = getattr(t, 'memo', None)
+    if memo is not None and isinstance(message, (six.text_type, bytes)):
+        # On Python 2, untranslated messages are returned unchanged, so their
+        # type matters too.
+        key = (translation_function, type(message), message)
+        result = memo.get(key)
+        if result is None:
+            result = _translate(t, message, translation_function)
+            if len(memo) >= MEMO_SIZE:
+                memo.clear()
+            memo[key] = result
+    else:
+        result = _translate(t, message, translation_function)
     if isinstance(message, SafeData):
         return mark_safe(result)
     return result
 
+def _translate(t, message, translation_function):
+    # str() is allowing a bytestring message to remain bytestring on Python 2
+    eol_message = message.replace(str('\r\n'), str('\n')).replace(str('\r'), str('\n'))
+    return getattr(t, translation_function)(eol_message)
+
 def gettext(message):
     """
     Returns a string of the translation of the message.
@@ -4,6 +4,7 @@ from django.views.generic.dates import (ArchiveIndexView, YearArchiveView, Month
                                      DateDetailView)
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import FormView, CreateView, UpdateView, DeleteView
+from django.views.generic.export import ExportView
 from django.views.generic.list import ListView
 
 
@@ -0,0 +1,179 @@
+from __future__ import unicode_literals
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import six
+from django.utils.encoding import force_text
+from django.utils.text import compress_sequence
+from django.views.generic.base import View
+from django.views.generic.list import MultipleObjectMixin
+
+
+class Echo(object):
+    """
+    A file-like object whose write() returns what it's given, so that
+    csv.writer's writerow() returns the formatted row.
+    """
+    def write(self, value):
+        return value
+
+
+class CSVWriter(object):
+    """
+    Formats rows as comma-separated values, preceded by a row of headers.
+    """
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self, fields, encoding='utf-8'):
+        self.fields = fields
+        self.encoding = encoding
+        self.writer = csv.writer(Echo())
+
+    def start(self):
+        return self.write_rows([[force_text(field) for field in self.fields]])
+
+    def write_rows(self, rows):
+        writerow = self.writer.writerow
+        if six.PY3:
+            return ''.join([writerow(row) for row in rows]).encode(self.encoding)
+        # The csv module of Python 2 doesn't support unicode.
+        encoding = self.encoding
+        return b''.join([
+            writerow([value.encode(encoding) if isinstance(value, six.text_type) else value
+                      for value in row])
+            for row in rows])
+
+
+class JSONLinesWriter(object):
+    """
+    Formats rows as JSON objects mapping the fields to their values, one per
+    line.
+    """
+    content_type = 'application/x-ndjson'
+    extension = 'jsonl'
+
+    def __init__(self, fields, encoding='utf-8'):
+        self.encoding = encoding
+        self.encode = DjangoJSONEncoder().encode
+        self.keys = ['%s: ' % json.dumps(force_text(field)) for field in fields]
+
+    def start(self):
+        return b''
+
+    def write_rows(self, rows):
+        encode, keys = self.encode, self.keys
+        return ''.join([
+            '{%s}\n' % ', '.join([key + encode(value) for key, value in zip(keys, row)])
+            for row in rows]).encode(self.encoding)
+
+
+writers = {
+    'csv': CSVWriter,
+    'jsonl': JSONLinesWriter,
+}
+
+
+def iter_chunks(queryset, fields, chunk_size):
+    """
+    Yields the values of the fields for the objects of the queryset, as lists
+    of at most chunk_size rows, in primary key order whatever the ordering of
+    the queryset.
+
+    Each chunk is fetched with its own query, starting after the primary key
+    of the previous one, so memory use doesn't depend on the number of rows,
+    even when the database driver buffers whole results. The fields mustn't
+    span many-valued relations, whose rows would repeat primary keys.
+    """
+    queryset = queryset.order_by('pk').values_list('pk', *fields)
+    last_pk = None
+    while True:
+        if last_pk is None:
+            rows = list(queryset[:chunk_size])
+        else:
+            rows = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+        yield [row[1:] for row in rows]
+        if len(rows) < chunk_size:
+            break
+
+
+def export_response(queryset, fields, format='csv', filename=None,
+                    chunk_size=1000, compress=False):
+    """
+    Returns a StreamingHttpResponse with the values of the fields for the
+    objects of the queryset, as an attachment in the given format, 'csv' or
+    'jsonl' (JSON lines). With compress, the file is compressed with gzip.
+    """
+    try:
+        writer = writers[format](fields)
+    except KeyError:
+        raise ValueError("Unknown export format: %s" % format)
+    # The chunks are fetched by filtering and slicing the queryset.
+    if not queryset.query.can_filter():
+        raise TypeError("Cannot export a queryset once a slice has been taken.")
+
+    def stream():
+        yield writer.start()
+        for rows in iter_chunks(queryset, fields, chunk_size):
+            yield writer.write_rows(rows)
+
+    content = stream()
+    content_type = '%s; charset=utf-8' % writer.content_type
+    filename = '%s.%s' % (filename or queryset.model._meta.module_name, writer.extension)
+    if compress:
+        content = compress_sequence(content)
+        content_type = 'application/gzip'
+        filename += '.gz'
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename="%s"' % filename
+    return response
+
+
+class ExportMixin(object):
+    """
+    A mixin for views streaming the objects of a queryset as a file.
+    """
+    export_fields = None
+    export_format = 'csv'
+    export_filename = None
+    export_chunk_size = 1000
+    export_compress = False
+
+    def get_export_fields(self, queryset):
+        """
+        Returns the names of the fields to export, all the fields of the
+        model by default.
+        """
+        if self.export_fields is not None:
+            return list(self.export_fields)
+        return [field.name for field in queryset.model._meta.fields]
+
+    def get_export_format(self):
+        return self.export_format
+
+    def get_export_filename(self, queryset):
+        """
+        Returns the name of the file, without extension.
+        """
+        return self.export_filename or queryset.model._meta.module_name
+
+    def render_to_export_response(self, queryset):
+        return export_response(queryset, self.get_export_fields(queryset),
+                               format=self.get_export_format(),
+                               filename=self.get_export_filename(queryset),
+                               chunk_size=self.export_chunk_size,
+                               compress=self.export_compress)
+
+
+class ExportView(ExportMixin, MultipleObjectMixin, View):
+    """
+    Streams the objects of the queryset of the view as a file.
+    """
+    def get(self, request, *args, **kwargs):
+        return self.render_to_export_response(self.get_queryset())
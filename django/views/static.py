@@ -14,12 +14,20 @@ try:
 except ImportError:     # Python 2
     from urllib import unquote
 
-from django.http import (CompatibleStreamingHttpResponse, Http404,
+from django.http import (CompatibleStreamingHttpResponse, FileResponse, Http404,
     HttpResponse, HttpResponseRedirect, HttpResponseNotModified)
 from django.template import loader, Template, Context, TemplateDoesNotExist
 from django.utils.http import http_date, parse_http_date
 from django.utils.translation import ugettext as _, ugettext_noop
 
+class CompatibleFileResponse(FileResponse, CompatibleStreamingHttpResponse):
+    """
+    A FileResponse that keeps exposing the deprecated `content` attribute,
+    like the responses previously returned by `serve`.
+    """
+    pass
+
+
 def serve(request, path, document_root=None, show_indexes=False):
     """
     Serve static files below a given point in the directory structure.
@@ -63,10 +71,11 @@ def serve(request, path, document_root=None, show_indexes=False):
     if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
                               statobj.st_mtime, statobj.st_size):
         return HttpResponseNotModified()
-    response = CompatibleStreamingHttpResponse(open(fullpath, 'rb'), content_type=mimetype)
+    response = CompatibleFileResponse(open(fullpath, 'rb'), content_type=mimetype)
     response["Last-Modified"] = http_date(statobj.st_mtime)
     if stat.S_ISREG(statobj.st_mode):
         response["Content-Length"] = statobj.st_size
+        response.set_range(request)
     if encoding:
         response["Content-Encoding"] = encoding
     return response
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Measures the throughput of the multipart/form-data parser.
+
+Parses request bodies holding a single file of random data, a file of data
+full of line breaks and dashes that look like the start of a boundary, and
+many small fields, with the upload handlers discarding the data so that only
+the parser is measured, and prints the throughput in MB/s.
+
+Usage: python multipart.py [--size MB] [--chunk-size BYTES] [--repeat N]
+"""
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from django.conf import settings
+if not settings.configured:
+    settings.configure()
+
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http.multipartparser import MultiPartParser
+
+BOUNDARY = b'----BenchmarkBoundary7MA4YWxkTrZu0gW'
+
+
+class DiscardingUploadHandler(FileUploadHandler):
+    def new_file(self, *args, **kwargs):
+        pass
+
+    def receive_data_chunk(self, raw_data, start):
+        return None
+
+    def file_complete(self, file_size):
+        return None
+
+
+def file_body(data):
+    return (b'--' + BOUNDARY + b'\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="data.bin"\r\n'
+            b'Content-Type: application/octet-stream\r\n\r\n' +
+            data + b'\r\n--' + BOUNDARY + b'--\r\n')
+
+
+def fields_body(size):
+    field = (b'--' + BOUNDARY + b'\r\n'
+             b'Content-Disposition: form-data; name="field"\r\n\r\n' +
+             b'x' * 100 + b'\r\n')
+    return field * (size // len(field)) + b'--' + BOUNDARY + b'--\r\n'
+
+
+def parse(body, chunk_size):
+    handler = DiscardingUploadHandler()
+    handler.chunk_size = chunk_size
+    meta = {
+        'CONTENT_TYPE': 'multipart/form-data; boundary=%s' % BOUNDARY.decode('ascii'),
+        'CONTENT_LENGTH': str(len(body)),
+    }
+    MultiPartParser(meta, BytesIO(body), [handler], 'utf-8').parse()
+
+
+def main():
+    parser = optparse.OptionParser(usage='%prog [options]')
+    parser.add_option('--size', type='int', default=100,
+                      help='Size of the request bodies in MB [default: %default].')
+    parser.add_option('--chunk-size', type='int', default=64 * 1024,
+                      help='Chunk size of the upload handler [default: %default].')
+    parser.add_option('--repeat', type='int', default=3,
+                      help='Number of runs, the best one is reported [default: %default].')
+    options, args = parser.parse_args()
+
+    size = options.size * 1024 * 1024
+    pattern = b'\r\n--' + BOUNDARY[:10] + b'\r\n-'
+    bodies = [
+        ('random file', file_body(os.urandom(size))),
+        ('boundary-like file', file_body(pattern * (size // len(pattern)))),
+        ('small fields', fields_body(size)),
+    ]
+    for name, body in bodies:
+        best = None
+        for i in range(options.repeat):
+            start = time.time()
+            parse(body, options.chunk_size)
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print('%-20s %8.1f MB/s' % (name, len(body) / best / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measures the throughput of the serializers, as used by dumpdata.
+
+Fills an in-memory SQLite database with users belonging to a couple of groups,
+serializes them with each format, and prints the number of objects serialized
+per second, for the best of several runs. With --dumpdata, the dumpdata
+command is run on the auth and contenttypes applications instead, which
+serializes several models (content types, permissions, groups and users).
+The script uses the Django of the tree it's in, so running it from two
+checkouts compares them.
+
+Usage: python serializers.py [--objects N] [--fields NAMES] [--repeat N] [--dumpdata] [FORMAT ...]
+"""
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from django.conf import settings
+if not settings.configured:
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        INSTALLED_APPS=['django.contrib.auth', 'django.contrib.contenttypes'],
+    )
+
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.core.management import call_command
+from django.utils.six import StringIO
+
+
+def populate(count):
+    call_command('syncdb', interactive=False, verbosity=0)
+    groups = [Group.objects.create(name='group%d' % i) for i in range(2)]
+    User.objects.bulk_create([
+        User(username='user%d' % i, email='user%d@example.com' % i,
+             first_name='First', last_name='Last')
+        for i in range(count)])
+    through = User.groups.through
+    through.objects.bulk_create([
+        through(user_id=pk, group_id=group.pk)
+        for pk in User.objects.values_list('pk', flat=True)
+        for group in groups])
+
+
+def main():
+    parser = optparse.OptionParser(usage='%prog [options] [format ...]')
+    parser.add_option('--objects', type='int', default=10000,
+                      help='Number of users to serialize [default: %default].')
+    parser.add_option('--fields', default=None,
+                      help='Comma-separated names of the fields to serialize [default: all].')
+    parser.add_option('--repeat', type='int', default=3,
+                      help='Number of runs, the best one is reported [default: %default].')
+    parser.add_option('--dumpdata', action='store_true', default=False,
+                      help='Run the dumpdata command on the auth and contenttypes applications.')
+    options, formats = parser.parse_args()
+
+    populate(options.objects)
+    objects = list(User.objects.all())
+    kwargs = {}
+    if options.fields:
+        kwargs['fields'] = options.fields.split(',')
+    if options.dumpdata:
+        count = sum(model.objects.count() for model in (ContentType, Permission, Group, User))
+    else:
+        count = len(objects)
+    for format in formats or serializers.get_public_serializer_formats():
+        best = None
+        for i in range(options.repeat):
+            # Drop the related objects fetched by the previous run.
+            for obj in objects:
+                obj.__dict__.pop('_prefetched_objects_cache', None)
+            start = time.time()
+            if options.dumpdata:
+                call_command('dumpdata', 'auth', 'contenttypes', format=format,
+                             stdout=StringIO())
+            else:
+                serializers.serialize(format, objects, **kwargs)
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print('%-10s %10.0f objects/s' % (format, count / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,11 @@
 from __future__ import absolute_import
 
+import datetime
+import json
+import os
+import shutil
+import tempfile
+
 from django.contrib.sites.models import Site
 from django.core import management
 from django.db import connection, IntegrityError
@@ -262,6 +268,142 @@ class FixtureLoadingTests(DumpDataAssertMixin, TestCase):
             management.call_command('loaddata', 'invalid.json', verbosity=0, commit=False)
             self.assertIn("Could not load fixtures.Article(pk=1):", cm.exception.args[0])
 
+    def test_bulk_loading(self):
+        management.call_command('loaddata', 'fixture1.json', 'fixture6.json', 'fixture8.json',
+                                verbosity=0, commit=False, bulk=True)
+        self.assertQuerysetEqual(Article.objects.all(), [
+            '<Article: Time to reform copyright>',
+            '<Article: Poker has no place on ESPN>',
+        ])
+        self.assertQuerysetEqual(Visa.objects.all(), [
+            '<Visa: Django Reinhardt Can add user, Can change user, Can delete user>',
+            '<Visa: Stephane Grappelli Can add user>',
+            '<Visa: Prince >'
+        ])
+
+        # Existing objects are updated, new ones are inserted.
+        management.call_command('loaddata', 'fixture9.xml', verbosity=0, commit=False, bulk=True)
+        self.assertQuerysetEqual(Visa.objects.all(), [
+            '<Visa: Django Reinhardt Can add user, Can change user, Can delete user>',
+            '<Visa: Stephane Grappelli Can add user, Can delete user>',
+            '<Visa: Artist formerly known as "Prince" Can change user>'
+        ])
+        self.assertQuerysetEqual(Book.objects.all(), [
+            '<Book: Achieving self-awareness of Python programs>',
+            '<Book: Music for all ages by Artist formerly known as "Prince" and Django Reinhardt>'
+        ])
+
+    def test_bulk_loading_error_message(self):
+        if connection.vendor == 'mysql':
+            connection.cursor().execute("SET sql_mode = 'TRADITIONAL'")
+        with self.assertRaises(IntegrityError) as cm:
+            management.call_command('loaddata', 'invalid.json', verbosity=0, commit=False, bulk=True)
+        self.assertIn("Could not load fixtures.Article objects:", cm.exception.args[0])
+
+    def test_dump_and_load_directory(self):
+        management.call_command('loaddata', 'fixture1.json', 'fixture6.json', 'fixture8.json',
+                                verbosity=0, commit=False)
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        management.call_command('dumpdata', 'fixtures', output_dir=output_dir,
+                                partition_size=2, verbosity=0)
+        with open(os.path.join(output_dir, 'manifest.json')) as manifest:
+            levels = json.load(manifest)['levels']
+        # Models only depend on those of the previous levels, the fixtures
+        # of a model hold at most 2 objects ordered by primary key.
+        self.assertEqual([[group['files'] for group in level] for level in levels], [
+            [['fixtures.category.0001.json'], ['fixtures.article.0001.json'],
+             ['fixtures.tag.0001.json'], ['fixtures.person.0001.json'],
+             ['fixtures.person.0002.json']],
+            [['fixtures.visa.0001.json'], ['fixtures.visa.0002.json'],
+             ['fixtures.book.0001.json']],
+        ])
+        with open(os.path.join(output_dir, 'fixtures.person.0002.json')) as fixture:
+            self.assertEqual([obj['pk'] for obj in json.load(fixture)], [3])
+
+        for model in (Visa, Book, Tag, Article):
+            model.objects.all().delete()
+        management.call_command('loaddata', output_dir, verbosity=0, commit=False)
+        self.assertQuerysetEqual(Visa.objects.all(), [
+            '<Visa: Django Reinhardt Can add user, Can change user, Can delete user>',
+            '<Visa: Stephane Grappelli Can add user>',
+            '<Visa: Prince >'
+        ])
+        self.assertEqual(Tag.objects.count(), 2)
+        self.assertQuerysetEqual(Book.objects.all(), [
+            '<Book: Achieving self-awareness of Python programs>'
+        ])
+
+    def test_dump_and_load_delta(self):
+        management.call_command('loaddata', 'fixture1.json', verbosity=0, commit=False)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        state_file = os.path.join(directory, 'state.json')
+        deleted_file = os.path.join(directory, 'deleted.json')
+        delta_file = os.path.join(directory, 'delta.json')
+
+        def dumpdata(**options):
+            new_io = six.StringIO()
+            management.call_command('dumpdata', 'fixtures.article', stdout=new_io, **options)
+            return [(obj['pk'], obj.get('deleted', False)) for obj in json.loads(new_io.getvalue())]
+
+        # The state file records the highest primary key of each model.
+        self.assertEqual(dumpdata(state_file=state_file), [(2, False), (3, False)])
+        with open(state_file) as f:
+            self.assertEqual(json.load(f), {'fixtures.Article': 3})
+        Article.objects.create(pk=4, headline='Django conquers world!',
+                               pub_date=datetime.datetime(2006, 6, 16, 15, 0))
+        self.assertEqual(dumpdata(state_file=state_file), [(4, False)])
+        with open(state_file) as f:
+            self.assertEqual(json.load(f), {'fixtures.Article': 4})
+        self.assertEqual(dumpdata(state_file=state_file), [])
+
+        self.assertEqual(dumpdata(pk_gt=['fixtures.Article=2']), [(3, False), (4, False)])
+        with open(deleted_file, 'w') as f:
+            json.dump({'fixtures.Article': [2]}, f)
+        self.assertEqual(dumpdata(since=['fixtures.Article.pub_date=2006-06-16 15:00'],
+                                  deleted=deleted_file), [(4, False), (2, True)])
+
+        with self.assertRaisesMessage(management.CommandError, "Unknown field: fixtures.Article.date"):
+            dumpdata(since=['fixtures.Article.date=2006-06-16'])
+        with self.assertRaisesMessage(management.CommandError,
+                                      "--pk-gt expects app_label.ModelName=value, not 'fixtures.Article'."):
+            dumpdata(pk_gt=['fixtures.Article'])
+
+        # Loading the delta updates, creates and deletes objects.
+        with open(delta_file, 'w') as f:
+            management.call_command('dumpdata', 'fixtures.article', stdout=f,
+                                    pk_gt=['fixtures.Article=2'], deleted=deleted_file)
+        Article.objects.filter(pk=3).update(headline='Updated headline')
+        Article.objects.filter(pk=4).delete()
+        management.call_command('loaddata', delta_file, verbosity=0, commit=False)
+        self.assertQuerysetEqual(Article.objects.all(), [
+            '<Article: Django conquers world!>',
+            '<Article: Time to reform copyright>',
+        ])
+
+    def test_dump_added_and_changed(self):
+        management.call_command('loaddata', 'fixture1.json', verbosity=0, commit=False)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        state_file = os.path.join(directory, 'state.json')
+
+        def dumpdata(**options):
+            new_io = six.StringIO()
+            management.call_command('dumpdata', 'fixtures.article', stdout=new_io, **options)
+            return [obj['pk'] for obj in json.loads(new_io.getvalue())]
+
+        self.assertEqual(dumpdata(state_file=state_file), [2, 3])
+        Article.objects.create(pk=4, headline='Django conquers world!',
+                               pub_date=datetime.datetime(2006, 6, 16, 15, 0))
+        Article.objects.filter(pk=2).update(pub_date=datetime.datetime(2006, 6, 17))
+        # The changed object has an old primary key, but is dumped along with
+        # the added one.
+        self.assertEqual(dumpdata(state_file=state_file,
+                                  since=['fixtures.Article.pub_date=2006-06-17']), [2, 4])
+        self.assertEqual(dumpdata(pk_gt=['fixtures.Article=4'],
+                                  since=['fixtures.Article.pub_date=2006-06-17']), [2])
+
     def test_loading_using(self):
         # Load db fixtures 1 and 2. These will load using the 'default' database identifier explicitly
         management.call_command('loaddata', 'db_fixture_1', verbosity=0, using='default', commit=False)
@@ -1,10 +1,14 @@
 from __future__ import absolute_import, unicode_literals
 
+from array import array
 from datetime import datetime
 from operator import attrgetter
 
 from django.core.exceptions import FieldError
+from django.db.models import Count
+from django.db.models.columns import MaskedArray, numpy
 from django.test import TestCase, skipUnlessDBFeature
+from django.utils import unittest
 
 from .models import Author, Article, Tag, Game, Season, Player
 
@@ -320,6 +324,86 @@ class LookupTests(TestCase):
             ], transform=identity)
         self.assertRaises(TypeError, Article.objects.values_list, 'id', 'headline', flat=True)
 
+    def test_values_list_named(self):
+        # With named=True, values_list() returns namedtuples.
+        rows = list(Article.objects.values_list('id', 'headline', named=True).order_by('id')[:2])
+        self.assertEqual(rows, [(self.a1.id, 'Article 1'), (self.a2.id, 'Article 2')])
+        self.assertEqual(rows[0].id, self.a1.id)
+        self.assertEqual(rows[0].headline, 'Article 1')
+        self.assertIs(type(rows[0]), type(rows[1]))
+        # The namedtuple class is reused by later queries.
+        row = Article.objects.values_list('id', 'headline', named=True).filter(id=self.a3.id).get()
+        self.assertIs(type(row), type(rows[0]))
+
+        # Extra selects and annotations come in the order of the fields.
+        row = (Article.objects.extra(select={'id_plus_one': 'id+1'})
+               .values_list('id', 'id_plus_one', named=True).get(id=self.a1.id))
+        self.assertEqual((row.id, row.id_plus_one), (self.a1.id, self.a1.id + 1))
+        row = (Author.objects.annotate(articles=Count('article'))
+               .values_list('name', 'articles', named=True).get(id=self.au1.id))
+        self.assertEqual((row.name, row.articles), (self.au1.name, 4))
+        row = (Author.objects.values_list('name', named=True)
+               .annotate(articles=Count('article')).get(id=self.au1.id))
+        self.assertEqual(row, (self.au1.name, 4))
+        self.assertEqual(row._fields, ('name', 'articles'))
+        # Without fields, all the fields of the model are returned.
+        row = Tag.objects.values_list(named=True).get(id=self.t1.id)
+        self.assertEqual(row._fields, ('id', 'name'))
+        self.assertRaises(TypeError, Article.objects.values_list, 'id', flat=True, named=True)
+
+    def test_to_columns(self):
+        Season.objects.create(year=2009, gt=100)
+        Season.objects.create(year=2010)
+        Season.objects.create(year=2011, gt=50)
+        # Integers are stored in typed arrays, other values in lists. The
+        # rows are fetched chunk_size at a time.
+        with self.assertNumQueries(1):
+            cols = Season.objects.order_by('year').to_columns('year', 'gt', chunk_size=2, numpy=False)
+        self.assertEqual(list(cols), ['year', 'gt'])
+        self.assertIsInstance(cols['year'], array)
+        self.assertEqual(cols['year'].tolist(), [2009, 2010, 2011])
+        # Nulls are masked.
+        self.assertIsInstance(cols['gt'], MaskedArray)
+        self.assertEqual(cols['gt'].tolist(), [100, None, 50])
+        self.assertEqual(cols['gt'].values.tolist(), [100, 0, 50])
+        self.assertEqual(cols['gt'].mask.tolist(), [0, 1, 0])
+
+        # Relations hold the type of the related field, annotations the type
+        # of the aggregate, and extra selects are left untyped.
+        cols = (Author.objects.annotate(articles=Count('article')).order_by('name')
+                .to_columns('name', 'articles', numpy=False))
+        self.assertEqual(list(cols), ['name', 'articles'])
+        self.assertEqual(cols['name'], ['Author 1', 'Author 2'])
+        self.assertIsInstance(cols['articles'], array)
+        self.assertEqual(cols['articles'].tolist(), [4, 3])
+        cols = (Author.objects.extra(select={'id_plus_one': 'id+1'}).order_by('name')
+                .to_columns('id_plus_one', 'id', numpy=False))
+        self.assertEqual(list(cols), ['id_plus_one', 'id'])
+        self.assertEqual(cols['id_plus_one'], [self.au1.id + 1, self.au2.id + 1])
+        self.assertEqual(cols['id'].tolist(), [self.au1.id, self.au2.id])
+        cols = Article.objects.filter(headline__in=['Article 1', 'Article 5']).order_by('headline').to_columns('author', numpy=False)
+        self.assertEqual(cols['author'].tolist(), [self.au1.id, self.au2.id])
+
+        # Without fields, all the fields of the model are returned.
+        cols = Article.objects.none().to_columns(numpy=False)
+        self.assertEqual(list(cols), ['id', 'headline', 'pub_date', 'author_id'])
+        self.assertEqual([len(col) for col in cols.values()], [0, 0, 0, 0])
+        self.assertRaises(TypeError, Article.objects.to_columns, 'id', flat=True)
+
+    @unittest.skipIf(numpy is None, "NumPy isn't installed.")
+    def test_to_columns_numpy(self):
+        Season.objects.create(year=2009, gt=100)
+        Season.objects.create(year=2010)
+        cols = Season.objects.order_by('year').to_columns('year', 'gt', 'games__home')
+        self.assertIsInstance(cols['year'], numpy.ndarray)
+        self.assertEqual(cols['year'].sum(), 4019)
+        self.assertIsInstance(cols['gt'], numpy.ma.MaskedArray)
+        self.assertEqual(cols['gt'].tolist(), [100, None])
+        self.assertEqual(cols['games__home'].dtype, object)
+        self.assertEqual(cols['games__home'].tolist(), [None, None])
+        cols = Season.objects.none().to_columns('year')
+        self.assertEqual(cols['year'].shape, (0,))
+
     def test_get_next_previous_by(self):
         # Every DateField and DateTimeField creates get_next_by_FOO() and
         # get_previous_by_FOO() methods. In the case of identical date values,
@@ -2,15 +2,19 @@ from __future__ import absolute_import, unicode_literals
 
 # -*- coding: utf-8 -*-
 import json
+import marshal
 from datetime import datetime
 from xml.dom import minidom
 
 from django.conf import settings
 from django.core import serializers
+from django.core.serializers import binary
+from django.core.serializers.base import DeletedObject
+from django.core.serializers.json import iter_array
 from django.db import transaction, connection
 from django.test import TestCase, TransactionTestCase, Approximate
 from django.utils import six
-from django.utils.six import StringIO
+from django.utils.six import BytesIO, StringIO
 from django.utils import unittest
 
 from .models import (Category, Author, Article, AuthorProfile, Actor, Movie,
@@ -102,6 +106,76 @@ class SerializersTestBase(object):
                                            Article.objects.all())
         self.assertTrue(self._validate_output(serial_str))
 
+    def test_serialize_prefetch_related(self):
+        """
+        The objects of many-to-many fields are fetched with one query per
+        field and chunk of objects, rather than one per object.
+        """
+        with self.assertNumQueries(2):
+            serializers.serialize(self.serializer_name, Article.objects.all())
+
+        serializer = serializers.get_serializer(self.serializer_name)()
+        serializer.prefetch_chunk_size = 1
+        with self.assertNumQueries(3):
+            serializer.serialize(Article.objects.all())
+
+    def test_serialize_m2m_fetches_pks_only(self):
+        """
+        Only the primary keys of the objects of many-to-many fields are
+        fetched.
+        """
+        old_debug_cursor = connection.use_debug_cursor
+        connection.use_debug_cursor = True
+        try:
+            serializers.serialize(self.serializer_name, Article.objects.all())
+        finally:
+            connection.use_debug_cursor = old_debug_cursor
+        name_column = '%s.%s' % (connection.ops.quote_name(Category._meta.db_table),
+                                 connection.ops.quote_name('name'))
+        select = connection.queries[-1]['sql'].split(' FROM ')[0]
+        self.assertNotIn(name_column, select)
+
+    def test_serialization_plan(self):
+        """
+        The fields to serialize are looked up once per model.
+        """
+        serializer = serializers.get_serializer(self.serializer_name)()
+        models = []
+        get_serialization_plan = serializer.get_serialization_plan
+        def get_plan(model):
+            models.append(model)
+            return get_serialization_plan(model)
+        serializer.get_serialization_plan = get_plan
+        serializer.serialize(list(Article.objects.all()) + list(Category.objects.all()),
+                             fields=('headline', 'author', 'categories'))
+        self.assertEqual(models, [Article, Category])
+
+        plan = get_serialization_plan(Article)
+        self.assertEqual([(handler.__name__, field.name) for handler, field in plan], [
+            ('handle_fk_field', 'author'),
+            ('handle_field', 'headline'),
+            ('handle_m2m_field', 'categories'),
+        ])
+
+    def test_deleted_object(self):
+        """
+        Deleted objects are serialized as tombstones, which delete the
+        objects when saved.
+        """
+        serial_str = serializers.serialize(self.serializer_name,
+                                           [self.a2, DeletedObject(self.a1)])
+        objects = list(serializers.deserialize(self.serializer_name, serial_str))
+        self.assertEqual(len(objects), 2)
+        self.assertIsInstance(objects[1], DeletedObject)
+        self.assertEqual(objects[1].object.pk, self.a1.pk)
+        self.assertIsInstance(objects[1].object, Article)
+
+        for obj in objects:
+            obj.save()
+        self.assertQuerysetEqual(Article.objects.all(), ['<Article: Time to reform copyright>'])
+        # Objects already deleted are ignored.
+        objects[1].save()
+
     def test_serializer_roundtrip(self):
         """Tests that serialized content can be deserialized."""
         serial_str = serializers.serialize(self.serializer_name,
@@ -379,6 +453,27 @@ class JsonSerializerTestCase(SerializersTestBase, TestCase):
                 ret_list.append(obj_dict["fields"][field_name])
         return ret_list
 
+    def test_deserialize_incrementally(self):
+        """
+        Objects are returned before the whole stream has been read.
+        """
+        data = serializers.serialize("json", [Category(pk=pk, name="Category %s" % pk)
+                                              for pk in range(1, 4)], indent=2)
+        stream = StringIO(data)
+        items = iter_array(stream, chunk_size=10)
+        self.assertEqual(next(items)["pk"], 1)
+        self.assertLess(stream.tell(), len(data))
+        self.assertEqual([item["pk"] for item in items], [2, 3])
+
+        objects = list(serializers.deserialize("json", StringIO(data)))
+        self.assertEqual([obj.object.name for obj in objects],
+                         ["Category 1", "Category 2", "Category 3"])
+
+    def test_deserialize_invalid(self):
+        for data in ("", "{}", "[{}", "[1 2]", "[] []"):
+            with self.assertRaises(serializers.base.DeserializationError):
+                list(serializers.deserialize("json", StringIO(data)))
+
 class JsonSerializerTransactionTestCase(SerializersTransactionTestBase, TransactionTestCase):
     serializer_name = "json"
     fwd_ref_str = """[
@@ -485,3 +580,82 @@ else:
     name: Agnes
   pk: 1
   model: serializers.author"""
+
+
+def _pack_binary(model, names, rows):
+    payload = marshal.dumps((model, names, rows), binary.MARSHAL_VERSION)
+    return binary.FRAME_HEADER.pack(0, len(payload)) + payload
+
+
+class BinarySerializerTestCase(SerializersTestBase, TestCase):
+    serializer_name = "binary"
+    pkless_str = binary.SIGNATURE + _pack_binary(
+        "serializers.category", ["name"], [(None, "Reference")])
+
+    @staticmethod
+    def _validate_output(serial_str):
+        try:
+            list(binary.iter_objects(BytesIO(serial_str)))
+        except Exception:
+            return False
+        else:
+            return True
+
+    @staticmethod
+    def _get_pk_values(serial_str):
+        return [obj_dict["pk"] for obj_dict in binary.iter_objects(BytesIO(serial_str))]
+
+    @staticmethod
+    def _get_field_values(serial_str, field_name):
+        return [obj_dict["fields"][field_name]
+                for obj_dict in binary.iter_objects(BytesIO(serial_str))
+                if field_name in obj_dict["fields"]]
+
+    @unittest.skip("Binary data is length-prefixed, it can't be edited in place.")
+    def test_altering_serialized_output(self):
+        pass
+
+    def test_compress(self):
+        for i in range(100):
+            Category.objects.create(name="Category")
+        serial_str = serializers.serialize(self.serializer_name, Category.objects.all())
+        compressed = serializers.serialize(self.serializer_name, Category.objects.all(),
+                                           compress=True)
+        self.assertLess(len(compressed), len(serial_str))
+        self.assertEqual(self._get_pk_values(compressed), self._get_pk_values(serial_str))
+
+    def test_frames(self):
+        """
+        Each frame holds the objects of one model, frame_size at most.
+        """
+        serializer = serializers.get_serializer(self.serializer_name)()
+        serializer.frame_size = 2
+        serial_str = serializer.serialize(list(Category.objects.all()) +
+                                          list(Author.objects.all()))
+        stream = BytesIO(serial_str)
+        stream.read(len(binary.SIGNATURE))
+        frames = []
+        while True:
+            header = stream.read(binary.FRAME_HEADER.size)
+            if not header:
+                break
+            flags, length = binary.FRAME_HEADER.unpack(header)
+            model, names, rows = marshal.loads(stream.read(length))
+            frames.append((model, len(rows)))
+        self.assertEqual(frames, [("serializers.category", 2), ("serializers.category", 1),
+                                  ("serializers.author", 2)])
+
+    def test_deserialize_invalid(self):
+        serial_str = serializers.serialize(self.serializer_name, Category.objects.all())
+        for data in (b"", b"[]", serial_str[:-1]):
+            with self.assertRaises(serializers.base.DeserializationError):
+                list(serializers.deserialize(self.serializer_name, data))
+
+
+class BinarySerializerTransactionTestCase(SerializersTransactionTestBase, TransactionTestCase):
+    serializer_name = "binary"
+    fwd_ref_str = (binary.SIGNATURE +
+        _pack_binary("serializers.article", ["headline", "pub_date", "categories", "author"],
+                     [(1, "Forward references pose no problem", "2006-06-16T15:00:00", [1], 1)]) +
+        _pack_binary("serializers.category", ["name"], [(1, "Reference")]) +
+        _pack_binary("serializers.author", ["name"], [(1, "Agnes")]))
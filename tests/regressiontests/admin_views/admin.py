@@ -6,6 +6,7 @@ import os
 
 from django import forms
 from django.contrib import admin
+from django.contrib.admin.actions import export_as_csv, export_as_json_lines
 from django.contrib.admin.views.main import ChangeList
 from django.core.files.storage import FileSystemStorage
 from django.core.mail import EmailMessage
@@ -201,7 +202,8 @@ class PersonaAdmin(admin.ModelAdmin):
 
 
 class SubscriberAdmin(admin.ModelAdmin):
-    actions = ['mail_admin']
+    actions = ['mail_admin', export_as_csv, export_as_json_lines]
+    export_fields = ('name', 'email')
 
     def mail_admin(self, request, selected):
         EmailMessage(
@@ -2293,6 +2293,25 @@ class AdminActionsTest(TestCase):
         response = self.client.post('/test_admin/admin/admin_views/subscriber/', delete_confirmation_data)
         self.assertEqual(Subscriber.objects.count(), 0)
 
+    def test_export_actions(self):
+        "Tests the actions streaming the selected objects as a file"
+        action_data = {
+            ACTION_CHECKBOX_NAME: [1, 2],
+            'action': 'export_as_csv',
+            'index': 0,
+        }
+        response = self.client.post('/test_admin/admin/admin_views/subscriber/', action_data)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="subscriber.csv"')
+        self.assertEqual(b''.join(response.streaming_content),
+                         b'name,email\r\nJohn Doe,john@example.org\r\nMax Mustermann,max@example.org\r\n')
+
+        action_data['action'] = 'export_as_json_lines'
+        action_data[ACTION_CHECKBOX_NAME] = [2]
+        response = self.client.post('/test_admin/admin/admin_views/subscriber/', action_data)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="subscriber.jsonl"')
+        self.assertEqual(b''.join(response.streaming_content),
+                         b'{"name": "Max Mustermann", "email": "max@example.org"}\n')
+
     def test_non_localized_pk(self):
         """If USE_THOUSAND_SEPARATOR is set, make sure that the ids for
         the objects selected for deletion are rendered without separators.
@@ -18,12 +18,14 @@ from django.core import management
 from django.core.cache import get_cache
 from django.core.cache.backends.base import (CacheKeyWarning,
     InvalidCacheBackendError)
+from django.core.cache.utils import make_template_fragment_key
 from django.db import router
 from django.http import (HttpResponse, HttpRequest, StreamingHttpResponse,
     QueryDict)
 from django.middleware.cache import (FetchFromCacheMiddleware,
     UpdateCacheMiddleware, CacheMiddleware)
-from django.template import Template
+from django.templatetags import cache as cache_tags
+from django.template import Context, Template
 from django.template.response import TemplateResponse
 from django.test import TestCase, TransactionTestCase, RequestFactory
 from django.test.utils import override_settings, six
@@ -1809,3 +1811,90 @@ class TestEtagWithAdmin(TestCase):
             response = self.client.get('/test_admin/admin/')
             self.assertEqual(response.status_code, 200)
             self.assertTrue(response.has_header('ETag'))
+
+
+class TestMakeTemplateFragmentKey(TestCase):
+    def test_without_vary_on(self):
+        key = make_template_fragment_key('a.fragment')
+        self.assertEqual(key, 'template.cache.a.fragment.d41d8cd98f00b204e9800998ecf8427e')
+
+    def test_with_one_vary_on(self):
+        key = make_template_fragment_key('foo', ['abc'])
+        self.assertEqual(key,
+            'template.cache.foo.900150983cd24fb0d6963f7d28e17f72')
+
+    def test_with_many_vary_on(self):
+        key = make_template_fragment_key('bar', ['abc', 'def'])
+        self.assertEqual(key,
+            'template.cache.bar.4b35f12ab03cec09beec4c21b2d2fa88')
+
+    def test_proper_escaping(self):
+        key = make_template_fragment_key('spam', ['abc:def%'])
+        self.assertEqual(key,
+            'template.cache.spam.f27688177baec990cdf3fbd9d9c3f469')
+
+
+class CountingCache(object):
+    """
+    Records the calls made to the wrapped cache.
+    """
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.cache, name)
+        def record(*args, **kwargs):
+            self.calls.append(name)
+            return method(*args, **kwargs)
+        return record
+
+
+class PrefetchCacheTagTests(TestCase):
+    def setUp(self):
+        self.cache = CountingCache(get_cache('locmem://'))
+        self.old_cache, cache_tags.cache = cache_tags.cache, self.cache
+
+    def tearDown(self):
+        cache_tags.cache = self.old_cache
+
+    def render(self, items):
+        t = Template('{% load cache %}{% prefetchcache %}'
+                     '{% for item in items %}{% cache 10 row item %}[{{ item }}]{% endcache %}{% endfor %}'
+                     '{% cache 10 footer %}footer{% endcache %}'
+                     '{% endprefetchcache %}')
+        return t.render(Context({'items': items}))
+
+    def test_prefetch(self):
+        self.cache.cache.set(make_template_fragment_key('row', [2]), '(2)')
+        self.assertEqual(self.render([1, 2, 3]), '[1](2)[3]footer')
+        self.assertEqual(self.cache.calls, ['get_many', 'set_many'])
+        self.cache.calls = []
+        self.assertEqual(self.render([1, 2, 3]), '[1](2)[3]footer')
+        self.assertEqual(self.cache.calls, ['get_many'])
+
+    def test_keys_not_known_in_advance(self):
+        self.assertEqual(self.render(iter([1, 2])), '[1][2]footer')
+        self.assertEqual(self.cache.calls, ['get_many', 'get', 'get', 'set_many'])
+        self.assertEqual(self.cache.cache.get(make_template_fragment_key('row', [2])), '[2]')
+
+    def test_queryset_evaluated_once(self):
+        Poll.objects.all().delete()
+        pub_date = timezone.now()
+        Poll.objects.create(question='q1', answer='a1', pub_date=pub_date)
+        Poll.objects.create(question='q2', answer='a2', pub_date=pub_date)
+        template = ('{% load cache %}{% prefetchcache %}'
+                    '{% for poll in SEQUENCE %}{% cache 10 poll poll.pk %}{{ poll.question }}{% endcache %}{% endfor %}'
+                    '{% endprefetchcache %}')
+        context = {'polls': Poll.objects.order_by('pk')}
+        # polls.all resolves to a new queryset each time, the prefetch skips it.
+        t = Template(template.replace('SEQUENCE', 'polls.all'))
+        with self.assertNumQueries(1):
+            self.assertEqual(t.render(Context(context)), 'q1q2')
+        self.assertEqual(self.cache.calls, ['get', 'get', 'set_many'])
+        # polls is evaluated once and its results are reused by the loop.
+        self.cache.calls = []
+        t = Template(template.replace('SEQUENCE', 'polls'))
+        with self.assertNumQueries(1):
+            self.assertEqual(t.render(Context(context)), 'q1q2')
+        self.assertEqual(self.cache.calls, ['get_many'])
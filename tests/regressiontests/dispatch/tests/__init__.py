@@ -4,5 +4,6 @@ Unit-tests for the dispatch project
 
 from __future__ import absolute_import
 
-from .test_dispatcher import DispatcherTests, ReceiverTestCase
+from .test_dispatcher import (DispatcherTests, BackgroundReceiverTests,
+    ReceiverTestCase)
 from .test_saferef import SaferefTests
@@ -1,8 +1,14 @@
 import gc
 import sys
+import threading
 import time
 
+from django.db import connection
 from django.dispatch import Signal, receiver
+from django.dispatch.dispatcher import NO_RECEIVERS
+from django.dispatch.executors import (PendingResult, ThreadExecutor,
+    get_executor)
+from django.test.utils import override_settings
 from django.utils import unittest
 
 
@@ -35,12 +41,15 @@ class Callable(object):
 a_signal = Signal(providing_args=["val"])
 b_signal = Signal(providing_args=["val"])
 c_signal = Signal(providing_args=["val"])
+d_signal = Signal(providing_args=["val"], use_caching=True)
 
 class DispatcherTests(unittest.TestCase):
     """Test suite for dispatcher (barely started)"""
 
     def _testIsClean(self, signal):
         """Assert that everything has been cleaned up automatically"""
+        # Dead receivers are removed the next time the signal is used.
+        self.assertFalse(signal.has_listeners())
         self.assertEqual(signal.receivers, [])
 
         # force cleanup just in case
@@ -137,6 +146,141 @@ class DispatcherTests(unittest.TestCase):
         self.assertFalse(a_signal.has_listeners())
         self.assertFalse(a_signal.has_listeners(sender=object()))
 
+    def test_cached_receivers(self):
+        d_signal.connect(receiver_1_arg, sender=Callable)
+        self.assertEqual(d_signal.send(sender=Callable, val="test"),
+                         [(receiver_1_arg, "test")])
+        self.assertEqual(d_signal.send(sender=self, val="test"), [])
+        self.assertEqual(d_signal.sender_receivers_cache[self], NO_RECEIVERS)
+        self.assertFalse(d_signal.has_listeners(self))
+        # Connecting clears the cache.
+        d_signal.connect(receiver_1_arg, sender=self)
+        self.assertEqual(d_signal.send(sender=self, val="test"),
+                         [(receiver_1_arg, "test")])
+        d_signal.disconnect(receiver_1_arg, sender=Callable)
+        self.assertEqual(d_signal.send(sender=Callable, val="test"), [])
+        d_signal.disconnect(receiver_1_arg, sender=self)
+        self._testIsClean(d_signal)
+
+    def test_cached_garbage_collected(self):
+        a = Callable()
+        d_signal.connect(a.a, sender=self)
+        self.assertEqual(d_signal.send(sender=self, val="test"), [(a.a, "test")])
+        del a
+        garbage_collect()
+        self.assertEqual(d_signal.send(sender=self, val="test"), [])
+        self._testIsClean(d_signal)
+
+    def test_cached_sender_not_weakly_referencable(self):
+        d_signal.connect(receiver_1_arg)
+        self.assertEqual(d_signal.send(sender=None, val="test"),
+                         [(receiver_1_arg, "test")])
+        d_signal.disconnect(receiver_1_arg)
+        self._testIsClean(d_signal)
+
+    def test_garbage_collected_while_locked(self):
+        # The garbage collector can run while the signal's lock is held,
+        # e.g. when _live_receivers() allocates.
+        a = Callable()
+        a_signal.connect(a.a)
+        with a_signal.lock:
+            del a
+            garbage_collect()
+        self.assertEqual(a_signal.send(sender=self, val="test"), [])
+        self._testIsClean(a_signal)
+
+
+def receiver_fails(val, **kwargs):
+    raise ValueError(val)
+
+
+class BackgroundReceiverTests(unittest.TestCase):
+    thread_executor = override_settings(
+        SIGNAL_EXECUTOR='django.dispatch.executors.ThreadExecutor',
+        SIGNAL_EXECUTOR_OPTIONS={'workers': 2, 'queue_size': 2})
+
+    def tearDown(self):
+        a_signal.receivers = []
+        a_signal.background_receivers.clear()
+
+    def test_synchronous(self):
+        # The test runner sets the SynchronousExecutor.
+        a_signal.connect(receiver_1_arg, background=True)
+        a_signal.connect(receiver_fails, background=True)
+        responses = a_signal.send(sender=self, val="test")
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(responses[0][0], receiver_1_arg)
+        self.assertTrue(responses[0][1].ready())
+        self.assertEqual(responses[0][1].get(), "test")
+        # Errors are kept in the result rather than raised by send().
+        self.assertFalse(responses[1][1].successful())
+        self.assertRaises(ValueError, responses[1][1].get)
+        self.assertEqual(responses[1][1].exception.args, ("test",))
+
+    def test_background_and_immediate(self):
+        a_signal.connect(receiver_1_arg)
+        a_signal.connect(receiver_fails, background=True)
+        responses = a_signal.send_robust(sender=self, val="test")
+        self.assertEqual(responses[0], (receiver_1_arg, "test"))
+        self.assertTrue(isinstance(responses[1][1], PendingResult))
+        a_signal.disconnect(receiver_fails)
+        self.assertEqual(a_signal.background_receivers, set())
+        self.assertEqual(a_signal.send(sender=self, val="test"),
+                         [(receiver_1_arg, "test")])
+
+    def test_thread_executor(self):
+        a_signal.connect(receiver_1_arg, background=True)
+        with self.thread_executor:
+            try:
+                results = [a_signal.send(sender=self, val=i)[0][1]
+                           for i in range(10)]
+                self.assertEqual([result.get(timeout=5) for result in results],
+                                 list(range(10)))
+            finally:
+                get_executor().shutdown()
+
+    def test_deferred_until_commit(self):
+        a_signal.connect(receiver_1_arg, background=True)
+        with self.thread_executor:
+            executor = get_executor()
+            connection.enter_transaction_management()
+            try:
+                connection.managed(True)
+                committed = a_signal.send(sender=self, val="committed")[0][1]
+                connection.set_dirty()
+                executor.join()
+                self.assertFalse(committed.ready())
+                connection.commit()
+                self.assertEqual(committed.get(timeout=5), "committed")
+
+                rolled_back = a_signal.send(sender=self, val="rolled back")[0][1]
+                connection.set_dirty()
+                connection.rollback()
+                executor.join()
+                self.assertFalse(rolled_back.ready())
+            finally:
+                connection.leave_transaction_management()
+                executor.shutdown()
+        self.assertEqual(connection.run_on_commit, [])
+
+    def test_bounded_queue(self):
+        executor = ThreadExecutor(workers=1, queue_size=1)
+        release = threading.Event()
+        try:
+            executor.submit(release.wait)
+            executor.submit(release.wait)
+            # The worker and the queue are busy, a third call must wait.
+            thread = threading.Thread(target=executor.submit, args=(lambda: 3,))
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            release.set()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        finally:
+            release.set()
+            executor.shutdown()
+
 
 class ReceiverTestCase(unittest.TestCase):
     """
@@ -8,9 +8,11 @@ import json
 import os
 import shutil
 import tempfile as sys_tempfile
+from io import BytesIO
 
 from django.core.files import temp as tempfile
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
 from django.http.multipartparser import MultiPartParser
 from django.test import TestCase, client
 from django.test.utils import override_settings
@@ -249,6 +251,27 @@ class FileUploadTests(TestCase):
         got = json.loads(response.content.decode('utf-8'))
         self.assertTrue('f' not in got)
 
+    def test_mapped_upload_handler(self):
+        content = b'abcdefgh' * (2 ** 17)
+        bigfile = tempfile.NamedTemporaryFile()
+        bigfile.write(content)
+        bigfile.seek(0)
+        emptyfile = tempfile.NamedTemporaryFile()
+
+        response = self.client.post('/file_uploads/mapped/',
+                                    {'big': bigfile, 'empty': emptyfile})
+        got = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(got['big']['size'], len(content))
+        self.assertTrue(got['big']['mapped'])
+        self.assertEqual(got['big']['digests'], {
+            'md5': hashlib.md5(content).hexdigest(),
+            'sha256': hashlib.sha256(content).hexdigest(),
+        })
+        self.assertEqual(got['empty']['size'], 0)
+        self.assertTrue(got['empty']['mapped'])
+        self.assertEqual(got['empty']['digests']['sha256'],
+                         hashlib.sha256(b'').hexdigest())
+
     def test_broken_custom_upload_handler(self):
         f = tempfile.NamedTemporaryFile()
         f.write(b'a' * (2 ** 21))
@@ -413,3 +436,27 @@ class MultiParserTests(unittest.TestCase):
             'CONTENT_TYPE':     'multipart/form-data; boundary=_foo',
             'CONTENT_LENGTH':   '1'
         }, StringIO('x'), [], 'utf-8')
+
+    def test_boundary_across_chunks(self):
+        """
+        Data that looks like the start of a boundary is kept intact, whatever
+        the chunks the request body is read in.
+        """
+        content = (b'a\r\n--_fox' + b'\r\n--_fo' * 20 + b'\r' + b'x' * 100 +
+                   b'\r\n--_f')
+        body = (b'--_foo\r\n'
+                b'Content-Disposition: form-data; name="field"\r\n\r\n'
+                b'value\r\n'
+                b'--_foo\r\n'
+                b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n'
+                b'Content-Type: text/plain\r\n\r\n' + content +
+                b'\r\n--_foo--\r\n')
+        for chunk_size in (4, 7, 16, 64 * 1024):
+            handler = MemoryFileUploadHandler()
+            handler.chunk_size = chunk_size
+            post, files = MultiPartParser({
+                'CONTENT_TYPE': 'multipart/form-data; boundary=_foo',
+                'CONTENT_LENGTH': str(len(body)),
+            }, BytesIO(body), [handler], 'utf-8').parse()
+            self.assertEqual(post['field'], 'value')
+            self.assertEqual(files['file'].read(), content)
@@ -13,6 +13,7 @@ urlpatterns = patterns('',
     (r'^echo_content/$',    views.file_upload_echo_content),
     (r'^quota/$',           views.file_upload_quota),
     (r'^quota/broken/$',    views.file_upload_quota_broken),
+    (r'^mapped/$',          views.file_upload_mapped),
     (r'^getlist_count/$',   views.file_upload_getlist_count),
     (r'^upload_errors/$',   views.file_upload_errors),
     (r'^filename_case/$',   views.file_upload_filename_case_view),
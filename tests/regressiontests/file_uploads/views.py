@@ -5,6 +5,7 @@ import json
 import os
 
 from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import MappedFileUploadHandler
 from django.http import HttpResponse, HttpResponseServerError
 from django.utils import six
 from django.utils.encoding import force_bytes
@@ -106,6 +107,24 @@ def file_upload_quota(request):
     request.upload_handlers.insert(0, QuotaUploadHandler())
     return file_upload_echo(request)
 
+def file_upload_mapped(request):
+    """
+    Upload files with the MappedFileUploadHandler, and check that the memory
+    map and the digests match the content.
+    """
+    request.upload_handlers = [MappedFileUploadHandler()]
+    r = {}
+    for key, f in request.FILES.items():
+        content = f.read()
+        r[key] = {
+            'digests': f.digests,
+            'mapped': f.mmap[:] == content,
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'size': f.size,
+        }
+        f.close()
+    return HttpResponse(json.dumps(r))
+
 def file_upload_quota_broken(request):
     """
     You can't change handlers after reading FILES; this view shouldn't work.
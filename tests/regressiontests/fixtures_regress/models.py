@@ -235,3 +235,8 @@ class ExternalDependency(models.Model):
 # Model for regression test of #11101
 class Thingy(models.Model):
     name = models.CharField(max_length=255)
+
+
+class Timestamped(models.Model):
+    created = models.DateTimeField(auto_now_add=True)
+    modified = models.DateTimeField(auto_now=True)
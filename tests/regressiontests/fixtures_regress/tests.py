@@ -2,6 +2,7 @@
 # Unittests for fixtures.
 from __future__ import absolute_import, unicode_literals
 
+import datetime
 import os
 import re
 
@@ -22,7 +23,7 @@ import json
 
 from .models import (Animal, Stuff, Absolute, Parent, Child, Article, Widget,
     Store, Person, Book, NKChild, RefToNKChild, Circle1, Circle2, Circle3,
-    ExternalDependency, Thingy)
+    ExternalDependency, Thingy, Timestamped)
 
 
 class TestFixtures(TestCase):
@@ -437,6 +438,18 @@ class TestFixtures(TestCase):
         self.assertTrue("No xml fixture 'this_fixture_doesnt_exist' in" in
             force_text(stdout_output.getvalue()))
 
+    def test_bulk_loading_keeps_auto_now_values(self):
+        management.call_command(
+            'loaddata',
+            'timestamped.json',
+            verbosity=0,
+            commit=False,
+            bulk=True,
+        )
+        obj = Timestamped.objects.get(pk=1)
+        self.assertEqual(obj.created, datetime.datetime(2001, 2, 3, 4, 5, 6))
+        self.assertEqual(obj.modified, datetime.datetime(2002, 3, 4, 5, 6, 7))
+
 
 class NaturalKeyFixtureTests(TestCase):
 
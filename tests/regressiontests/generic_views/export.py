@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import gzip
+import json
+
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.utils.six import BytesIO
+from django.views.generic import ExportView
+from django.views.generic.export import export_response
+
+from .models import Author, Book
+
+
+class ExportViewTests(TestCase):
+    rf = RequestFactory()
+
+    def setUp(self):
+        self.authors = [Author.objects.create(name=name, slug=name.lower())
+                        for name in ('Zoë', 'Scott', 'Adrian', 'Jacob', 'Simon')]
+
+    def get(self, **initkwargs):
+        response = ExportView.as_view(**initkwargs)(self.rf.get('/'))
+        return response, b''.join(response.streaming_content)
+
+    def test_csv(self):
+        response, content = self.get(model=Author)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="author.csv"')
+        lines = content.decode('utf-8').split('\r\n')
+        self.assertEqual(lines[0], 'id,name,slug')
+        # The rows are in primary key order.
+        self.assertEqual(lines[1:], ['%s,%s,%s' % (author.pk, author.name, author.slug)
+                                     for author in self.authors] + [''])
+
+    def test_json_lines(self):
+        response, content = self.get(model=Author, export_format='jsonl',
+                                     export_fields=['slug', 'name'])
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="author.jsonl"')
+        lines = content.decode('utf-8').splitlines()
+        self.assertEqual(lines[0], '{"slug": "zo\\u00eb", "name": "Zo\\u00eb"}')
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{'slug': author.slug, 'name': author.name} for author in self.authors])
+
+    def test_chunks(self):
+        """
+        The rows are fetched export_chunk_size at a time, one query each.
+        """
+        view = ExportView.as_view(queryset=Author.objects.exclude(name='Adrian'),
+                                  export_fields=['name'], export_chunk_size=2)
+        response = view(self.rf.get('/'))
+        with self.assertNumQueries(3):
+            chunks = list(response.streaming_content)
+        self.assertEqual(chunks, [b'name\r\n', 'Zoë\r\nScott\r\n'.encode('utf-8'),
+                                  b'Jacob\r\nSimon\r\n'])
+
+    def test_primary_key_order(self):
+        response, content = self.get(queryset=Author.objects.order_by('name'),
+                                     export_fields=['name'])
+        self.assertEqual(content.decode('utf-8'),
+                         'name\r\nZoë\r\nScott\r\nAdrian\r\nJacob\r\nSimon\r\n')
+
+    def test_sliced_queryset(self):
+        with self.assertRaisesMessage(TypeError,
+                "Cannot export a queryset once a slice has been taken."):
+            self.get(queryset=Author.objects.all()[:2])
+
+    def test_compress(self):
+        response, content = self.get(model=Author, export_fields=['name'],
+                                     export_filename='authors', export_compress=True)
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="authors.csv.gz"')
+        self.assertEqual(gzip.GzipFile(fileobj=BytesIO(content)).read().decode('utf-8'),
+                         'name\r\nZoë\r\nScott\r\nAdrian\r\nJacob\r\nSimon\r\n')
+
+    def test_values(self):
+        Book.objects.create(name='Dreaming in Code', slug='dreaming-in-code',
+                            pages=300, pubdate='2006-11-28')
+        response = export_response(Book.objects.all(), ['name', 'pages', 'pubdate'], 'jsonl')
+        self.assertEqual(b''.join(response.streaming_content),
+                         b'{"name": "Dreaming in Code", "pages": 300, "pubdate": "2006-11-28"}\n')
+
+    def test_unknown_format(self):
+        with self.assertRaisesMessage(ValueError, "Unknown export format: xls"):
+            export_response(Author.objects.all(), ['name'], 'xls')
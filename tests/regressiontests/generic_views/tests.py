@@ -8,4 +8,5 @@ from .dates import (ArchiveIndexViewTests, YearArchiveViewTests,
 from .detail import DetailViewTest
 from .edit import (FormMixinTests, BasicFormTests, ModelFormMixinTests,
     CreateViewTests, UpdateViewTests, DeleteViewTests)
+from .export import ExportViewTests
 from .list import ListViewTests
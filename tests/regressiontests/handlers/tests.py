@@ -1,5 +1,6 @@
+from django.core.exceptions import ImproperlyConfigured
 from django.core.handlers.wsgi import WSGIHandler
-from django.core import signals
+from django.core import signals, urlresolvers
 from django.test import RequestFactory, TestCase
 from django.test.utils import override_settings
 from django.utils import six
@@ -21,6 +22,37 @@ class HandlerTests(TestCase):
             handler(None, None)
         self.assertEqual(handler.initLock.locked(), False)
 
+    def test_file_wrapper(self):
+        """
+        FileResponse files are handed to wsgi.file_wrapper, and closing the
+        wrapper closes the response.
+        """
+        class FileWrapper(object):
+            def __init__(self, filelike, block_size=8192):
+                self.filelike = filelike
+                self.block_size = block_size
+
+            def close(self):
+                self.filelike.close()
+
+        finished = []
+        def register_finished(**kwargs):
+            finished.append(True)
+        signals.request_finished.connect(register_finished)
+        self.addCleanup(signals.request_finished.disconnect, register_finished)
+
+        environ = RequestFactory().get('/file/').environ
+        environ['wsgi.file_wrapper'] = FileWrapper
+        handler = WSGIHandler()
+        with override_settings(ROOT_URLCONF='regressiontests.handlers.urls'):
+            response = handler(environ, lambda *a, **k: None)
+        self.assertIsInstance(response, FileWrapper)
+        self.assertEqual(response.block_size, 4096)
+        self.assertEqual(response.filelike.read(), b'file content')
+        response.close()
+        self.assertTrue(response.filelike.closed)
+        self.assertEqual(finished, [True])
+
     def test_bad_path_info(self):
         """Tests for bug #15672 ('request' referenced before assignment)"""
         environ = RequestFactory().get('/').environ
@@ -58,3 +90,143 @@ class SignalsTests(TestCase):
         self.assertEqual(self.signals, ['started'])
         self.assertEqual(b''.join(response.streaming_content), b"streaming content")
         self.assertEqual(self.signals, ['started', 'finished'])
+
+
+calls = []
+
+
+class RecordingMiddleware(object):
+    def process_request(self, request):
+        calls.append((self.__class__.__name__, 'request'))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        calls.append((self.__class__.__name__, 'view'))
+
+    def process_response(self, request, response):
+        calls.append((self.__class__.__name__, 'response'))
+        return response
+
+
+class OtherMiddleware(RecordingMiddleware):
+    pass
+
+
+class ResponseOnlyMiddleware(RecordingMiddleware):
+    middleware_phases = ('response',)
+
+
+class APIMiddleware(RecordingMiddleware):
+    url_prefixes = ('/regular/',)
+
+
+class BadPhaseMiddleware(object):
+    middleware_phases = ('requests',)
+
+
+class MissingPhaseMiddleware(object):
+    middleware_phases = ('request',)
+
+
+class URLconfMiddleware(object):
+    def process_request(self, request):
+        calls.append(urlresolvers.get_urlconf())
+
+
+class BrokenChainHandler(WSGIHandler):
+    def get_middleware_chain(self, path):
+        raise ValueError
+
+
+@override_settings(ROOT_URLCONF='regressiontests.handlers.urls')
+class MiddlewareChainTests(TestCase):
+
+    def get(self, path):
+        del calls[:]
+        handler = WSGIHandler()
+        handler(RequestFactory().get(path).environ, lambda *a, **k: None)
+        return calls
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.RecordingMiddleware',
+        'regressiontests.handlers.tests.ResponseOnlyMiddleware',
+    ])
+    def test_middleware_phases(self):
+        self.assertEqual(self.get('/regular/'), [
+            ('RecordingMiddleware', 'request'),
+            ('RecordingMiddleware', 'view'),
+            ('ResponseOnlyMiddleware', 'response'),
+            ('RecordingMiddleware', 'response'),
+        ])
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.BadPhaseMiddleware',
+    ])
+    def test_unknown_phase(self):
+        self.assertRaises(ImproperlyConfigured, WSGIHandler().load_middleware)
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.MissingPhaseMiddleware',
+    ])
+    def test_missing_phase(self):
+        self.assertRaises(ImproperlyConfigured, WSGIHandler().load_middleware)
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.URLconfMiddleware',
+    ])
+    def test_urlconf_set_for_request(self):
+        self.assertEqual(self.get('/regular/'), ['regressiontests.handlers.urls'])
+
+    @override_settings(DEBUG=True)
+    def test_chain_error(self):
+        handler = BrokenChainHandler()
+        handler.load_middleware()
+        senders = []
+        def receiver(sender, **kwargs):
+            senders.append(sender)
+        signals.got_request_exception.connect(receiver)
+        try:
+            response = handler.get_response(RequestFactory().get('/regular/'))
+        finally:
+            signals.got_request_exception.disconnect(receiver)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(senders, [BrokenChainHandler])
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.RecordingMiddleware',
+        'regressiontests.handlers.tests.OtherMiddleware',
+    ], MIDDLEWARE_EXCLUDED_PREFIXES={
+        '/streaming/': ('regressiontests.handlers.tests.RecordingMiddleware',),
+    })
+    def test_excluded_prefixes(self):
+        self.assertEqual(len(self.get('/regular/')), 6)
+        self.assertEqual(self.get('/streaming/'), [
+            ('OtherMiddleware', 'request'),
+            ('OtherMiddleware', 'view'),
+            ('OtherMiddleware', 'response'),
+        ])
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.APIMiddleware',
+        'regressiontests.handlers.tests.OtherMiddleware',
+    ])
+    def test_url_prefixes(self):
+        self.assertEqual(self.get('/regular/'), [
+            ('APIMiddleware', 'request'),
+            ('OtherMiddleware', 'request'),
+            ('APIMiddleware', 'view'),
+            ('OtherMiddleware', 'view'),
+            ('OtherMiddleware', 'response'),
+            ('APIMiddleware', 'response'),
+        ])
+        self.assertEqual([name for name, phase in self.get('/streaming/')],
+                         ['OtherMiddleware'] * 3)
+
+    @override_settings(MIDDLEWARE_CLASSES=[
+        'regressiontests.handlers.tests.APIMiddleware',
+    ])
+    def test_chains_are_reused(self):
+        handler = WSGIHandler()
+        handler.load_middleware()
+        chain = handler.get_middleware_chain('/streaming/')
+        self.assertIs(handler.get_middleware_chain('/other/'), chain)
+        self.assertIsNot(handler.get_middleware_chain('/regular/'), chain)
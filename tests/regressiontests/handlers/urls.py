@@ -1,9 +1,12 @@
 from __future__ import unicode_literals
 
+from io import BytesIO
+
 from django.conf.urls import patterns, url
-from django.http import HttpResponse, StreamingHttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 
 urlpatterns = patterns('',
     url(r'^regular/$', lambda request: HttpResponse(b"regular content")),
     url(r'^streaming/$', lambda request: StreamingHttpResponse([b"streaming", b" ", b"content"])),
+    url(r'^file/$', lambda request: FileResponse(BytesIO(b"file content"))),
 )
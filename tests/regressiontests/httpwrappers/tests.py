@@ -10,9 +10,9 @@ from django.core.exceptions import SuspiciousOperation
 from django.http import (QueryDict, HttpResponse, HttpResponseRedirect,
                          HttpResponsePermanentRedirect, HttpResponseNotAllowed,
                          HttpResponseNotModified, StreamingHttpResponse,
-                         SimpleCookie, BadHeaderError,
+                         FileResponse, SimpleCookie, BadHeaderError,
                          parse_cookie)
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 from django.utils.encoding import smart_str
 from django.utils._os import upath
 from django.utils import six
@@ -481,6 +481,88 @@ class StreamingHttpResponseTests(TestCase):
         with self.assertRaises(Exception):
             r.tell()
 
+class FileResponseTests(TestCase):
+    def setUp(self):
+        self.filename = os.path.join(os.path.dirname(upath(__file__)), 'abc.txt')
+        with open(self.filename, 'rb') as fp:
+            self.data = fp.read()
+
+    def test_file_response(self):
+        r = FileResponse(open(self.filename, 'rb'))
+        self.assertIsNotNone(r.file_to_stream)
+        self.assertEqual(b''.join(r), self.data)
+        r.close()
+        self.assertTrue(r.file_to_stream.closed)
+
+    def test_block_size(self):
+        r = FileResponse(open(self.filename, 'rb'))
+        r.block_size = 2
+        chunks = list(r)
+        r.close()
+        self.assertEqual(b''.join(chunks), self.data)
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+
+    def test_wrapped_content(self):
+        # Once the content is replaced, the file is no longer streamed as is.
+        file1 = open(self.filename, 'rb')
+        r = FileResponse(file1)
+        r.streaming_content = (chunk.upper() for chunk in r.streaming_content)
+        self.assertIsNone(r.file_to_stream)
+        self.assertEqual(b''.join(r), self.data.upper())
+        r.close()
+        self.assertTrue(file1.closed)
+
+    def test_iterator_content(self):
+        r = FileResponse(iter([b'abc', b'def']))
+        self.assertIsNone(r.file_to_stream)
+        self.assertEqual(list(r), [b'abc', b'def'])
+
+    def get_range_response(self, **extra):
+        request = RequestFactory().get('/', **extra)
+        r = FileResponse(open(self.filename, 'rb'))
+        r['Last-Modified'] = 'Sat, 01 Jan 2000 00:00:00 GMT'
+        r.set_range(request)
+        self.addCleanup(r.close)
+        return r
+
+    def test_range(self):
+        r = self.get_range_response(HTTP_RANGE='bytes=2-4')
+        self.assertEqual(r.status_code, 206)
+        self.assertEqual(r['Accept-Ranges'], 'bytes')
+        self.assertEqual(r['Content-Range'], 'bytes 2-4/%d' % len(self.data))
+        self.assertEqual(r['Content-Length'], '3')
+        self.assertIsNone(r.file_to_stream)
+        self.assertEqual(b''.join(r), self.data[2:5])
+
+    def test_suffix_range(self):
+        r = self.get_range_response(HTTP_RANGE='bytes=-3')
+        self.assertEqual(r.status_code, 206)
+        self.assertEqual(b''.join(r), self.data[-3:])
+
+    def test_no_range(self):
+        r = self.get_range_response()
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r['Accept-Ranges'], 'bytes')
+        self.assertFalse(r.has_header('Content-Range'))
+        self.assertEqual(b''.join(r), self.data)
+
+    def test_unsatisfiable_range(self):
+        r = self.get_range_response(HTTP_RANGE='bytes=1000-')
+        self.assertEqual(r.status_code, 416)
+        self.assertEqual(r['Content-Range'], 'bytes */%d' % len(self.data))
+        self.assertEqual(b''.join(r), b'')
+
+    def test_if_range(self):
+        r = self.get_range_response(HTTP_RANGE='bytes=2-4',
+            HTTP_IF_RANGE='Sat, 01 Jan 2000 00:00:00 GMT')
+        self.assertEqual(r.status_code, 206)
+        # The client's copy is outdated, send the whole file.
+        r = self.get_range_response(HTTP_RANGE='bytes=2-4',
+            HTTP_IF_RANGE='Sun, 02 Jan 2000 00:00:00 GMT')
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(b''.join(r), self.data)
+
+
 class FileCloseTests(TestCase):
     def test_response(self):
         filename = os.path.join(os.path.dirname(upath(__file__)), 'abc.txt')
@@ -5,9 +5,12 @@ import datetime
 import decimal
 import os
 import pickle
+import shutil
+import tempfile
 from threading import local
 
 from django.conf import settings
+from django.core.management import call_command, CommandError
 from django.template import Template, Context
 from django.template.base import TemplateSyntaxError
 from django.test import TestCase, RequestFactory
@@ -15,7 +18,8 @@ from django.test.utils import override_settings
 from django.utils import translation
 from django.utils.formats import (get_format, date_format, time_format,
     localize, localize_input, iter_format_modules, get_format_modules,
-    number_format)
+    number_format, date_format_many, time_format_many, number_format_many,
+    localize_many)
 from django.utils.importlib import import_module
 from django.utils.numberformat import format as nformat
 from django.utils._os import upath
@@ -94,6 +98,35 @@ class TranslationTests(TestCase):
         s2 = pickle.loads(pickle.dumps(s1))
         self.assertEqual(six.text_type(s2), "test")
 
+    def test_lazy_proxy_class_shared(self):
+        """
+        Lazy objects with the same result classes share their class, which
+        doesn't give them a __dict__.
+        """
+        s1 = ugettext_lazy('Add %(name)s')
+        s2 = translation.pgettext_lazy('month name', 'May')
+        self.assertIs(type(s1), type(s2))
+        self.assertFalse(hasattr(s1, '__dict__'))
+        self.assertIsNot(type(s1), type(gettext_lazy('Yes')))
+
+    def test_memoized_translations(self):
+        with translation.override('de'):
+            self.assertEqual(ugettext('Yes'), 'Ja')
+            memo = trans_real.catalog().memo
+            self.assertEqual(memo[('ugettext' if not six.PY3 else 'gettext',
+                                   six.text_type, 'Yes')], 'Ja')
+            with translation.override('fr'):
+                self.assertEqual(ugettext('Yes'), 'Oui')
+            self.assertEqual(ugettext('Yes'), 'Ja')
+            self.assertTrue(isinstance(ugettext(mark_safe('Yes')), SafeText))
+            # The memo is cleared once it's full.
+            old_size, trans_real.MEMO_SIZE = trans_real.MEMO_SIZE, 1
+            try:
+                ugettext('No')
+                self.assertEqual(len(memo), 1)
+            finally:
+                trans_real.MEMO_SIZE = old_size
+
     @override_settings(LOCALE_PATHS=extended_locale_paths)
     def test_pgettext(self):
         trans_real._active = local()
@@ -613,6 +646,28 @@ class FormattingTests(TestCase):
             with translation.override('es-us', deactivate=True):
                 self.assertEqual('31 de Diciembre de 2009', date_format(self.d))
 
+    def test_format_many(self):
+        """
+        The batch functions format like their single value counterparts.
+        """
+        values = [self.n, self.f, self.l, -1234, True, self.d, self.dt, self.t, 'text', None]
+        with self.settings(USE_L10N=True, USE_THOUSAND_SEPARATOR=True):
+            for language in ('de', 'en', 'ru'):
+                with translation.override(language, deactivate=True):
+                    self.assertEqual(localize_many(values), [localize(v) for v in values])
+                    self.assertEqual(date_format_many([self.d, self.dt], 'SHORT_DATE_FORMAT'),
+                                     [date_format(self.d, 'SHORT_DATE_FORMAT'),
+                                      date_format(self.dt, 'SHORT_DATE_FORMAT')])
+                    self.assertEqual(time_format_many([self.t]), [time_format(self.t)])
+                    for decimal_pos in (None, 0, 2):
+                        for force_grouping in (False, True):
+                            self.assertEqual(
+                                number_format_many(values[:4], decimal_pos, force_grouping=force_grouping),
+                                [number_format(v, decimal_pos, force_grouping=force_grouping) for v in values[:4]])
+        with self.settings(USE_L10N=False):
+            self.assertEqual(localize_many(values), [localize(v) for v in values])
+            self.assertEqual(number_format_many([self.n], 1), ['66666.6'])
+
     def test_localized_input(self):
         """
         Tests if form input is correctly localized
@@ -887,6 +942,71 @@ class DjangoFallbackResolutionOrderI18NTests(ResolutionOrderI18NTests):
         self.assertEqual(ugettext('Date/time'), 'Datum/Zeit')
 
 
+class MergedCatalogTests(TestCase):
+
+    def setUp(self):
+        self.catalogs_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.catalogs_dir)
+
+    def test_merged_catalog(self):
+        with self.settings(MERGED_CATALOGS_DIR=self.catalogs_dir,
+                           LOCALE_PATHS=extended_locale_paths):
+            call_command('mergecatalogs', locale=['de', 'xx'], verbosity=0)
+            self.assertEqual(os.listdir(self.catalogs_dir), ['de.catalog'])
+            t = trans_real.load_merged_catalog('de')
+            self.assertEqual(t.language(), 'de')
+            merged = trans_real.merge_catalogs('de')
+            self.assertEqual(t._catalog, merged._catalog)
+            trans_real._translations = {}
+            with translation.override('de'):
+                self.assertIs(trans_real.catalog()._catalog, trans_real._translations['de']._catalog)
+                self.assertEqual(ugettext('Yes'), 'Ja')
+                # From LOCALE_PATHS.
+                self.assertEqual(pgettext("month name", "May"), "Mai")
+                self.assertEqual(npgettext("search", "%d result", "%d results", 4) % 4, "4 Resultate")
+
+        # Catalogs merged with other settings are ignored.
+        with self.settings(MERGED_CATALOGS_DIR=self.catalogs_dir):
+            self.assertEqual(trans_real.load_merged_catalog('de'), None)
+
+    def test_regional_locale(self):
+        # es_MX falls back to the es catalogs for the messages it doesn't
+        # translate itself.
+        messages = ('Venezuelan Spanish', 'Enter a valid email address.')
+        with self.settings(MERGED_CATALOGS_DIR=self.catalogs_dir):
+            with translation.override('es-mx'):
+                expected = [ugettext(message) for message in messages]
+            self.assertNotEqual(expected, list(messages))
+            call_command('mergecatalogs', locale=['es-mx'], verbosity=0)
+            trans_real._translations = {}
+            with translation.override('es-mx'):
+                self.assertIsNot(trans_real.load_merged_catalog('es-mx'), None)
+                self.assertEqual([ugettext(message) for message in messages], expected)
+
+    def test_message_file_changed(self):
+        locale_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, locale_dir)
+        shutil.copytree(os.path.join(here, 'other', 'locale', 'de'),
+                        os.path.join(locale_dir, 'de'))
+        mofile = os.path.join(locale_dir, 'de', 'LC_MESSAGES', 'django.mo')
+        with self.settings(MERGED_CATALOGS_DIR=self.catalogs_dir,
+                           LOCALE_PATHS=(locale_dir,)):
+            call_command('mergecatalogs', locale=['de'], verbosity=0)
+            self.assertNotEqual(trans_real.load_merged_catalog('de'), None)
+            # Compiling the messages again makes the catalog out of date.
+            mtime = os.stat(mofile).st_mtime
+            os.utime(mofile, (mtime + 10, mtime + 10))
+            self.assertEqual(trans_real.load_merged_catalog('de'), None)
+            call_command('mergecatalogs', locale=['de'], verbosity=0)
+            self.assertNotEqual(trans_real.load_merged_catalog('de'), None)
+            # So does removing a message file.
+            os.remove(mofile)
+            self.assertEqual(trans_real.load_merged_catalog('de'), None)
+
+    def test_merged_catalogs_dir_not_set(self):
+        self.assertRaises(CommandError, call_command, 'mergecatalogs')
+
+
 class TestModels(TestCase):
     def test_lazy(self):
         tm = TestModel()
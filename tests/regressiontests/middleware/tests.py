@@ -4,6 +4,7 @@ from __future__ import absolute_import, unicode_literals
 import gzip
 import re
 import random
+import zlib
 from io import BytesIO
 
 from django.conf import settings
@@ -13,6 +14,8 @@ from django.db import (transaction, connections, DEFAULT_DB_ALIAS,
 from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.middleware.clickjacking import XFrameOptionsMiddleware
 from django.middleware.common import CommonMiddleware
+from django.middleware.compression import (CompressionMiddleware,
+    parse_accept_encoding)
 from django.middleware.http import ConditionalGetMiddleware
 from django.middleware.gzip import GZipMiddleware
 from django.middleware.transaction import TransactionMiddleware
@@ -671,6 +674,108 @@ class ETagGZipMiddlewareTest(TestCase):
 
         self.assertNotEqual(gzip_etag, nogzip_etag)
 
+class CompressionMiddlewareTest(TestCase):
+    """
+    Tests the compression middleware.
+    """
+    compressible_string = b'a' * 500
+    sequence = [b'a' * 500, b'b' * 200, b'a' * 300]
+
+    def setUp(self):
+        self.rf = RequestFactory()
+
+    def response(self):
+        response = HttpResponse(self.compressible_string)
+        response['Content-Type'] = 'text/html; charset=UTF-8'
+        return response
+
+    def process(self, accept_encoding, response=None):
+        request = self.rf.get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        if response is None:
+            response = self.response()
+        return CompressionMiddleware().process_response(request, response)
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(parse_accept_encoding('gzip;q=0.5, deflate , *;q=0'),
+                         {'gzip': 0.5, 'deflate': 1.0, '*': 0.0})
+        self.assertEqual(parse_accept_encoding(''), {})
+
+    def test_gzip(self):
+        r = self.process('gzip, deflate')
+        self.assertEqual(r['Content-Encoding'], 'gzip')
+        self.assertEqual(r['Content-Length'], str(len(r.content)))
+        self.assertEqual(r['Vary'], 'Accept-Encoding')
+        self.assertEqual(gzip.GzipFile(mode='rb', fileobj=BytesIO(r.content)).read(),
+                         self.compressible_string)
+
+    def test_qvalues(self):
+        r = self.process('gzip;q=0.5, deflate')
+        self.assertEqual(r['Content-Encoding'], 'deflate')
+        self.assertEqual(zlib.decompress(r.content), self.compressible_string)
+        r = self.process('*;q=0.5, gzip;q=0')
+        self.assertEqual(r['Content-Encoding'], 'deflate')
+
+    def test_not_accepted(self):
+        for accept_encoding in ('', 'identity', 'gzip;q=0', 'br'):
+            r = self.process(accept_encoding)
+            self.assertFalse(r.has_header('Content-Encoding'))
+            self.assertEqual(r.content, self.compressible_string)
+
+    def test_incompressible_content_type(self):
+        response = self.response()
+        response['Content-Type'] = 'image/png'
+        r = self.process('gzip', response)
+        self.assertFalse(r.has_header('Content-Encoding'))
+        response = self.response()
+        response['Content-Type'] = 'image/svg+xml'
+        r = self.process('gzip', response)
+        self.assertEqual(r['Content-Encoding'], 'gzip')
+
+    def test_levels(self):
+        middleware = CompressionMiddleware()
+        self.assertEqual(middleware.get_level(1000), 9)
+        self.assertEqual(middleware.get_level(100 * 1024), 6)
+        self.assertEqual(middleware.get_level(10 * 1024 * 1024), 4)
+        self.assertEqual(middleware.get_level(1000, 'application/pdf'), 1)
+        self.assertEqual(middleware.get_level(1000, 'text/html; charset=utf-8'), 9)
+
+    def test_streaming(self):
+        sequence = [b'a' * 10] * 100 + [b'b' * 20 * 1024, b'c']
+        response = StreamingHttpResponse(sequence)
+        r = self.process('gzip', response)
+        chunks = list(r)
+        # The small chunks are coalesced until the flush size is reached:
+        # the gzip header, one flushed block and the end of the stream.
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(gzip.GzipFile(mode='rb', fileobj=BytesIO(b''.join(chunks))).read(),
+                         b''.join(sequence))
+        self.assertEqual(r['Content-Encoding'], 'gzip')
+        self.assertFalse(r.has_header('Content-Length'))
+
+    def test_etag_cache(self):
+        middleware = CompressionMiddleware()
+        request = self.rf.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = self.response()
+        response['ETag'] = '"abc"'
+        compressed = middleware.process_response(request, response).content
+        self.assertEqual(response['ETag'], '"abc;gzip"')
+        response = self.response()
+        response['ETag'] = '"abc"'
+        self.assertIs(middleware.process_response(request, response).content, compressed)
+        # Weak ETags aren't cached.
+        response = self.response()
+        response['ETag'] = 'W/"abc"'
+        self.assertIsNot(middleware.process_response(request, response).content, compressed)
+        # The same ETag on other content, e.g. for another URL, doesn't
+        # return the cached content.
+        response = HttpResponse(b'b' * 500)
+        response['ETag'] = '"abc"'
+        self.assertEqual(
+            gzip.GzipFile(mode='rb', fileobj=BytesIO(
+                middleware.process_response(request, response).content)).read(),
+            b'b' * 500)
+
+
 class TransactionMiddlewareTest(TransactionTestCase):
     """
     Test the transaction middleware.
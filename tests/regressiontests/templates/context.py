@@ -1,5 +1,9 @@
 # coding: utf-8
-from django.template import Context
+from copy import copy
+
+from django.template import Context, RequestContext
+from django.template.context import provides
+from django.test.client import RequestFactory
 from django.utils.unittest import TestCase
 
 
@@ -14,3 +18,126 @@ class ContextTests(TestCase):
         self.assertEqual(c.pop(), {"a": 2})
         self.assertEqual(c["a"], 1)
         self.assertEqual(c.get("foo", 42), 42)
+
+    def test_lookup_after_stack_changes(self):
+        c = Context({"a": 1})
+        self.assertEqual(c["a"], 1)
+        c.update({"a": 2, "b": 3})
+        self.assertEqual(c["a"], 2)
+        self.assertEqual(c["b"], 3)
+        c.pop()
+        self.assertEqual(c["a"], 1)
+        self.assertRaises(KeyError, c.__getitem__, "b")
+        self.assertFalse("b" in c)
+        c.push()
+        c["a"] = 4
+        self.assertEqual(c["a"], 4)
+        del c["a"]
+        self.assertEqual(c["a"], 1)
+
+    def test_dicts_modified_directly(self):
+        c = Context({"a": 1})
+        self.assertEqual(c["a"], 1)
+        c.dicts[-1]["a"] = 2
+        c.dicts.append({"b": 3})
+        self.assertEqual(c["a"], 2)
+        self.assertEqual(c["b"], 3)
+        c.dicts = c.dicts[:1]
+        self.assertRaises(KeyError, c.__getitem__, "a")
+
+    def test_push_with_values(self):
+        c = Context({"a": 1})
+        self.assertEqual(c["a"], 1)
+        self.assertEqual(c.push({"a": 2}, b=3), {"a": 2, "b": 3})
+        self.assertEqual(c["a"], 2)
+        self.assertEqual(c["b"], 3)
+        c.pop()
+        self.assertEqual(c["a"], 1)
+
+    def test_pushed_dict_modified_directly(self):
+        c = Context({"a": 1})
+        d = c.push()
+        c.push()
+        self.assertEqual(c["a"], 1)
+        d["a"] = 2
+        self.assertEqual(c["a"], 2)
+        d.update(a=3)
+        self.assertEqual(c["a"], 3)
+        d.pop("a")
+        self.assertEqual(c["a"], 1)
+        d.setdefault("a", 4)
+        self.assertEqual(c["a"], 4)
+        del d["a"]
+        self.assertEqual(c["a"], 1)
+
+    def test_initial_dict_modified_by_caller(self):
+        values = {"a": 1}
+        c = Context(values)
+        c.push()
+        self.assertEqual(c["a"], 1)
+        values["a"] = 2
+        self.assertEqual(c["a"], 2)
+        del values["a"]
+        self.assertRaises(KeyError, c.__getitem__, "a")
+        self.assertEqual(c["True"], True)
+        values["True"] = "shadowed"
+        self.assertEqual(c["True"], "shadowed")
+        # The same goes for dicts given to update().
+        other = {}
+        self.assertIs(c.update(other), other)
+        values["a"] = 1
+        self.assertEqual(c["a"], 1)
+        other["a"] = 5
+        self.assertEqual(c["a"], 5)
+
+    def test_dicts_kept_and_modified_later(self):
+        c = Context({"a": 1})
+        ds = c.dicts
+        c.push()
+        self.assertEqual(c["a"], 1)
+        ds[1]["a"] = 2
+        self.assertEqual(c["a"], 2)
+        ds.append({"a": 3})
+        self.assertEqual(c["a"], 3)
+        ds[-1] = {"a": 4}
+        self.assertEqual(c["a"], 4)
+
+    def test_copy_shares_dicts(self):
+        c = Context({"a": 1})
+        c.push()
+        duplicate = copy(c)
+        self.assertEqual(duplicate["a"], 1)
+        c["a"] = 2
+        self.assertEqual(duplicate["a"], 2)
+        duplicate["a"] = 3
+        self.assertEqual(c["a"], 3)
+
+
+class LazyProcessorTests(TestCase):
+    def setUp(self):
+        self.calls = []
+
+        @provides('lazy', 'missing')
+        def processor(request):
+            self.calls.append(request)
+            return {'lazy': 'value'}
+        self.processor = processor
+        self.request = RequestFactory().get('/')
+
+    def test_not_run_until_looked_up(self):
+        c = RequestContext(self.request, {'a': 1}, processors=[self.processor])
+        self.assertEqual(c['a'], 1)
+        self.assertFalse('other' in c)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(c['lazy'], 'value')
+        self.assertEqual(c['lazy'], 'value')
+        self.assertEqual(self.calls, [self.request])
+
+    def test_declared_name_not_returned(self):
+        c = RequestContext(self.request, {'missing': 1}, processors=[self.processor])
+        self.assertEqual(c['missing'], 1)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_overrides_view_context(self):
+        c = RequestContext(self.request, {'lazy': 1}, processors=[self.processor])
+        self.assertEqual(c['lazy'], 'value')
@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta
 import time
 import os
 import sys
+import threading
 import traceback
 try:
     from urllib.parse import urljoin
@@ -37,7 +38,7 @@ from django.utils import six
 from django.utils.tzinfo import LocalTimezone
 
 from .callables import CallableVariablesTests
-from .context import ContextTests
+from .context import ContextTests, LazyProcessorTests
 from .custom import CustomTagTests, CustomFilterTests
 from .parser import ParserTests
 from .unicode import UnicodeTests
@@ -1074,6 +1075,12 @@ class Templates(TestCase):
             'include13': ('{% autoescape off %}{% include "basic-syntax03" %}{% endautoescape %}', {'first': '&'}, ('& --- ', '& --- INVALID')),
             'include14': ('{% autoescape off %}{% include "basic-syntax03" with first=var1 only %}{% endautoescape %}', {'var1': '&'}, ('& --- ', '& --- INVALID')),
 
+            # Asynchronous includes render the same as in-place ones
+            'include-async01': ('{% include "basic-syntax02" async %}', {'headline': 'Included'}, "Included"),
+            'include-async02': ('{% for x in values %}{% include "included-cycle" with abc=x async %}-{% endfor %}', {'values': [1, 2, 3]}, "1-2-3-"),
+            'include-async03': ('{% for x in values %}{% include "include-async-forloop" async %}{% endfor %}', {'values': ['a', 'b']}, "1a2b"),
+            'include-async-forloop': ('{{ forloop.counter }}{{ x }}', {}, ('', 'INVALIDINVALID')),
+
             'include-error01': ('{% include "basic-syntax01" with %}', {}, template.TemplateSyntaxError),
             'include-error02': ('{% include "basic-syntax01" with "no key" %}', {}, template.TemplateSyntaxError),
             'include-error03': ('{% include "basic-syntax01" with dotted.arg="error" %}', {}, template.TemplateSyntaxError),
@@ -1739,6 +1746,55 @@ class RequestContextTests(unittest.TestCase):
         )
 
 
+class AsyncIncludeTests(TestCase):
+
+    def setUp(self):
+        templates = {
+            'thread': Template('{{ thread_name }}'),
+            'nested': Template('{% include "thread" async %}'),
+            'loops': Template('{{ forloop.parentloop.counter }}{{ forloop.counter }},'),
+        }
+        setup_test_template_loader(templates)
+
+    def tearDown(self):
+        restore_template_loaders()
+
+    def render(self):
+        t = Template('{% include "thread" async %}')
+        return t.render(Context({'thread_name': ThreadName()}))
+
+    def test_rendered_in_thread(self):
+        self.assertNotEqual(self.render(), threading.current_thread().name)
+
+    @override_settings(TEMPLATE_ASYNC_INCLUDE_THREADS=0)
+    def test_disabled(self):
+        self.assertEqual(self.render(), threading.current_thread().name)
+
+    @override_settings(TEMPLATE_DEBUG=True)
+    def test_debug(self):
+        self.assertEqual(self.render(), threading.current_thread().name)
+
+    @override_settings(TEMPLATE_ASYNC_INCLUDE_THREADS=1)
+    def test_nested(self):
+        # The nested include is rendered by the thread rendering the outer
+        # one instead of waiting for a free thread.
+        t = Template('{% include "nested" async %}')
+        output = t.render(Context({'thread_name': ThreadName()}))
+        self.assertNotEqual(output, threading.current_thread().name)
+
+    def test_nested_loops(self):
+        t = Template('{% for x in values %}{% for y in values %}'
+                     '{% include "loops" async %}{% endfor %}{% endfor %}')
+        output = t.render(Context({'values': [1, 2]}))
+        self.assertEqual(output, '11,12,21,22,')
+
+
+@python_2_unicode_compatible
+class ThreadName(object):
+    def __str__(self):
+        return threading.current_thread().name
+
+
 class SSITests(TestCase):
     def setUp(self):
         self.this_dir = os.path.dirname(os.path.abspath(upath(__file__)))
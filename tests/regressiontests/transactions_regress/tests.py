@@ -2,7 +2,7 @@ from __future__ import absolute_import
 
 from django.db import connection, connections, transaction, DEFAULT_DB_ALIAS, DatabaseError
 from django.db.transaction import commit_on_success, commit_manually, TransactionManagementError
-from django.test import TransactionTestCase, skipUnlessDBFeature
+from django.test import TransactionTestCase, skipIfDBFeature, skipUnlessDBFeature
 from django.test.utils import override_settings
 from django.utils.unittest import skipIf, skipUnless
 
@@ -264,3 +264,36 @@ class SavepointTest(TransactionTestCase):
             self.assertEqual(mod2.fld, 1)
 
         work()
+
+    @skipIf(connection.vendor == 'mysql' and \
+            connection.features._mysql_storage_engine == 'MyISAM',
+            "MyISAM MySQL storage engine doesn't support savepoints")
+    @skipUnlessDBFeature('uses_savepoints')
+    def test_savepoint_rollback_discards_on_commit(self):
+        called = []
+        @commit_manually
+        def work():
+            transaction.on_commit(lambda: called.append('kept'))
+            sid = transaction.savepoint()
+            transaction.on_commit(lambda: called.append('rolled back'))
+            transaction.savepoint_rollback(sid)
+            self.assertEqual(called, [])
+            transaction.commit()
+
+        work()
+        self.assertEqual(called, ['kept'])
+
+    @skipIfDBFeature('uses_savepoints')
+    def test_on_commit_kept_without_savepoints(self):
+        # The rollback to the savepoint does nothing, the changes made since
+        # are committed along with the others.
+        called = []
+        @commit_manually
+        def work():
+            sid = transaction.savepoint()
+            transaction.on_commit(lambda: called.append('kept'))
+            transaction.savepoint_rollback(sid)
+            transaction.commit()
+
+        work()
+        self.assertEqual(called, ['kept'])
@@ -6,13 +6,16 @@ from __future__ import absolute_import, unicode_literals
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ImproperlyConfigured, ViewDoesNotExist
+from django.core import urlresolvers
 from django.core.urlresolvers import (reverse, resolve, get_callable,
     get_resolver, NoReverseMatch, Resolver404, ResolverMatch, RegexURLResolver,
-    RegexURLPattern)
+    RegexURLPattern, clear_url_caches, set_script_prefix, get_script_prefix)
 from django.http import HttpResponseRedirect, HttpResponsePermanentRedirect
 from django.shortcuts import redirect
 from django.test import TestCase
+from django.test.utils import override_settings
 from django.utils import unittest, six
+from django.utils.regex_helper import normalize
 
 from . import urlconf_outer, middleware, views
 
@@ -183,6 +186,92 @@ class URLPatternReverse(TestCase):
         self.assertEqual('/bump%2520map/includes/non_path_include/',
                reverse('non_path_include', prefix='/bump%20map/'))
 
+@override_settings(URL_REVERSE_CACHE_SIZE=2)
+class ReverseCacheTests(TestCase):
+    urls = 'regressiontests.urlpatterns_reverse.urls'
+
+    def setUp(self):
+        clear_url_caches()
+
+    def tearDown(self):
+        clear_url_caches()
+
+    def test_urlpattern_reverse(self):
+        # Every lookup twice, so the second one is served from the cache.
+        for name, expected, args, kwargs in test_data * 2:
+            try:
+                got = reverse(name, args=args, kwargs=kwargs)
+            except NoReverseMatch:
+                self.assertEqual(expected, NoReverseMatch)
+            else:
+                self.assertEqual(got, expected)
+
+    def test_cache_is_used(self):
+        self.assertEqual(reverse('places', args=[3]), '/places/3/')
+        self.assertEqual(list(urlresolvers._reverse_cache.values()), ['/places/3/'])
+
+    def test_cache_is_bounded(self):
+        reverse('places', args=[1])
+        reverse('places', args=[2])
+        reverse('places', args=[3])
+        self.assertEqual(list(urlresolvers._reverse_cache.values()), ['/places/3/'])
+
+    def test_uncacheable_arguments(self):
+        class Place(object):
+            def __str__(self):
+                return '3'
+        self.assertEqual(reverse('places', args=[Place()]), '/places/3/')
+        self.assertRaises(NoReverseMatch, reverse, 'places', args=[True])
+        self.assertEqual(urlresolvers._reverse_cache, {})
+
+    def test_prefix(self):
+        self.assertEqual(reverse('places', args=[3], prefix='/a/'), '/a/places/3/')
+        self.assertEqual(reverse('places', args=[3], prefix='/b/'), '/b/places/3/')
+
+    def test_cleared_on_script_prefix_change(self):
+        old_prefix = get_script_prefix()
+        reverse('places', args=[3])
+        try:
+            set_script_prefix('/other/')
+            self.assertEqual(urlresolvers._reverse_cache, {})
+            self.assertEqual(reverse('places', args=[3]), '/other/places/3/')
+        finally:
+            set_script_prefix(old_prefix)
+
+    @override_settings(URL_REVERSE_CACHE_SIZE=0)
+    def test_disabled(self):
+        reverse('places', args=[3])
+        self.assertEqual(urlresolvers._reverse_cache, {})
+
+class CompileReverseTests(unittest.TestCase):
+    def compile(self, pattern, defaults=None):
+        (result, params), = normalize(pattern)
+        return urlresolvers.compile_reverse('/', [], result, params, pattern, defaults or {})
+
+    def test_validators(self):
+        self.assertEqual(len(urlresolvers.get_validators('/', r'places/(\d+)/$', '/places/%(_0)s/')), 1)
+        format = self.compile(r'places/(\d+)/$')
+        self.assertEqual(format([3], {}), '/places/3/')
+        self.assertEqual(format(['x'], {}), None)
+        self.assertEqual(format([3, 4], {}), None)
+        format = self.compile(r'(?P<year>\d{4})/(?P<slug>[\w-]+)/$', {'page': 1})
+        self.assertEqual(format((), {'year': 2013, 'slug': 'a-b'}), '/2013/a-b/')
+        self.assertEqual(format((), {'year': 2013, 'slug': 'a-b', 'page': 1}), '/2013/a-b/')
+        self.assertEqual(format((), {'year': 2013, 'slug': 'a-b', 'page': 2}), None)
+        self.assertEqual(format((), {'year': 2013}), None)
+        self.assertEqual(format((), {'year': 13, 'slug': 'a'}), None)
+
+    def test_whole_pattern_fallback(self):
+        # The values are split differently by the pattern than by the groups.
+        self.assertEqual(self.compile(r'(\d+)(\w*)/$')(['1a', ''], {}), '/1a/')
+        self.assertEqual(self.compile(r'a/(\d+)/')(['1/x'], {}), '/a/1/x/')
+        self.assertEqual(self.compile(r'(\d+)$')(['1\n'], {}), '/1\n')
+
+    def test_unsupported_pattern(self):
+        self.assertEqual(urlresolvers.get_validators('/', r'places/(\d+)?/$', '/places//'), None)
+        self.assertEqual(urlresolvers.get_validators('/a.b/', r'(\d+)/$', '/a.b/%(_0)s/'), None)
+        self.assertEqual(self.compile(r'places/(?:\d+)?/$')([], {}), '/places//')
+
 class ResolverTests(unittest.TestCase):
     def test_resolver_repr(self):
         """
@@ -113,6 +113,13 @@ class DateFormatTests(unittest.TestCase):
 
         self.assertEqual(dateformat.format(my_birthday, r'jS \o\f F'), '8th of July')
 
+    def test_compiled_format(self):
+        self.assertEqual(dateformat.compile_format(r'jS \o\f F'),
+            (('j', True), ('S', True), (' of ', False), ('F', True)))
+        self.assertIs(dateformat.compile_format('Y-m-d'), dateformat.compile_format('Y-m-d'))
+        self.assertEqual(dateformat.format_many([date(2009, 5, 16), datetime(1979, 7, 8, 22, 00)], r'jS \o\f F'),
+            ['16th of May', '8th of July'])
+
     def test_futuredates(self):
         the_future = datetime(2100, 10, 25, 0, 00)
         self.assertEqual(dateformat.format(the_future, r'Y'), '2100')
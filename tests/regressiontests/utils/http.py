@@ -146,6 +146,25 @@ class ETagProcessingTests(unittest.TestCase):
         self.assertEqual(quoted_etag, r'"e\\t\"ag"')
 
 
+class RangeProcessingTests(unittest.TestCase):
+    def testParsing(self):
+        self.assertEqual(http.parse_range_header('bytes=0-9', 100), (0, 9))
+        self.assertEqual(http.parse_range_header('bytes=90-', 100), (90, 99))
+        self.assertEqual(http.parse_range_header('bytes=90-200', 100), (90, 99))
+        self.assertEqual(http.parse_range_header('bytes=-10', 100), (90, 99))
+        self.assertEqual(http.parse_range_header('bytes=-200', 100), (0, 99))
+
+    def testIgnored(self):
+        for header in ('bytes=', 'bytes=-', 'bytes=9-0', 'bytes=0-1,5-9',
+                       'items=0-9', 'bytes=a-b'):
+            self.assertIsNone(http.parse_range_header(header, 100))
+
+    def testUnsatisfiable(self):
+        self.assertRaises(ValueError, http.parse_range_header, 'bytes=100-', 100)
+        self.assertRaises(ValueError, http.parse_range_header, 'bytes=-0', 100)
+        self.assertRaises(ValueError, http.parse_range_header, 'bytes=-10', 0)
+
+
 class HttpDateProcessingTests(unittest.TestCase):
     def testParsingRfc1123(self):
         parsed = http.parse_http_date('Sun, 06 Nov 1994 08:49:37 GMT')
@@ -48,3 +48,21 @@ class NormalizeTests(unittest.TestCase):
                     ['first_group_name'])]
         result = regex_helper.normalize(pattern)
         self.assertEqual(result, expected)
+
+
+class SplitGroupsTests(unittest.TestCase):
+    def test_literal_and_groups(self):
+        pattern = r"^articles/(?P<year>\d{4})/(\w+)\.html$"
+        expected = ['articles/', ('year', r'\d{4}'), '/', ('_0', r'\w+'), '.html']
+        self.assertEqual(regex_helper.split_groups(pattern), expected)
+
+    def test_character_class(self):
+        pattern = r"^(?P<slug>[^)(]+)/$"
+        expected = [('slug', '[^)(]+'), '/']
+        self.assertEqual(regex_helper.split_groups(pattern), expected)
+
+    def test_unsupported(self):
+        for pattern in [r"^a+/(\d+)/$", r"^(\d+)?/$", r"^a|b$", r"^(?:a)/(\d+)$",
+                        r"^((\d+))/$", r"^.(\d+)$", r"^(?i)(\d+)$", r"^(\d+\b)",
+                        r"^(^\d+)/$", r"^(\d+)/\d$"]:
+            self.assertEqual(regex_helper.split_groups(pattern), None, pattern)
@@ -17,14 +17,15 @@ from .encoding import TestEncodingUtils
 from .feedgenerator import FeedgeneratorTest
 from .functional import FunctionalTestCase
 from .html import TestUtilsHtml
-from .http import TestUtilsHttp, ETagProcessingTests, HttpDateProcessingTests
+from .http import (TestUtilsHttp, ETagProcessingTests, HttpDateProcessingTests,
+    RangeProcessingTests)
 from .ipv6 import TestUtilsIPv6
 from .itercompat import TestIsIterator
 from .jslex import JsToCForGettextTest, JsTokensTest
 from .module_loading import CustomLoader, DefaultLoader, EggLoader
 from .numberformat import TestNumberFormat
 from .os_utils import SafeJoinTests
-from .regex_helper import NormalizeTests
+from .regex_helper import NormalizeTests, SplitGroupsTests
 from .simplelazyobject import TestUtilsSimpleLazyObject
 from .termcolors import TermColorTests
 from .text import TestUtilsText
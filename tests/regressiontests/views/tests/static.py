@@ -66,6 +66,27 @@ class StaticTests(TestCase):
             )
         self.assertTrue(isinstance(response, HttpResponseNotModified))
 
+    def test_range(self):
+        "The static view serves byte ranges of files"
+        file_name = 'file.txt'
+        response = self.client.get('/views/%s/%s' % (self.prefix, file_name),
+                                   HTTP_RANGE='bytes=1-3')
+        response_content = b''.join(response)
+        response.close()
+        with open(path.join(media_dir, file_name), 'rb') as fp:
+            content = fp.read()
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response_content, content[1:4])
+        self.assertEqual(response['Content-Range'], 'bytes 1-3/%d' % len(content))
+        self.assertEqual(response['Content-Length'], '3')
+
+    def test_unsatisfiable_range(self):
+        file_name = 'file.txt'
+        response = self.client.get('/views/%s/%s' % (self.prefix, file_name),
+                                   HTTP_RANGE='bytes=100000-')
+        response.close()
+        self.assertEqual(response.status_code, 416)
+
     def test_invalid_if_modified_since(self):
         """Handle bogus If-Modified-Since values gracefully
 